@@ -0,0 +1,60 @@
+"""
+Helpers shared by the GOES/XRS benchmark scripts.
+"""
+import resource
+import contextlib
+
+import numpy as np
+import pandas
+
+import astropy.units as u
+from sunpy import timeseries
+
+from sunkit_instruments.goes_xrs import goes_xrs as goes
+
+TABLE_FILES = {"file_temp_cor": goes.FILE_TEMP_COR, "file_temp_pho": goes.FILE_TEMP_PHO,
+               "file_em_cor": goes.FILE_EM_COR, "file_em_pho": goes.FILE_EM_PHO,
+               "file_rad_cor": goes.FILE_RAD_COR}
+
+
+def add_table_dir_argument(parser):
+    parser.add_argument("--table-dir", default=None,
+                        help="directory holding the CHIANTI tables under their usual "
+                             "file names, for machines that cannot download them")
+
+
+def table_overrides(table_dir):
+    """
+    Context manager using the CHIANTI tables in ``table_dir``, if given.
+    """
+    stack = contextlib.ExitStack()
+    if table_dir:
+        for name, filename in TABLE_FILES.items():
+            stack.enter_context(goes.manager.override_file(name, f"{table_dir}/{filename}"))
+    return stack
+
+
+def peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def synthetic_fluxes(n, seed=0):
+    """
+    Random long and short channel fluxes in W/m^2 spanning the B to X classes.
+    """
+    rng = np.random.default_rng(seed)
+    longflux = 10 ** rng.uniform(-7, -4, n)
+    shortflux = longflux * rng.uniform(0.02, 0.2, n)
+    return longflux, shortflux
+
+
+def synthetic_goests(n, start="2011-06-07", cadence="2s"):
+    """
+    A GOES-15 XRSTimeSeries of ``n`` random samples.
+    """
+    index = pandas.date_range(start, periods=n, freq=cadence)
+    xrsb, xrsa = synthetic_fluxes(n)
+    data = pandas.DataFrame({"xrsa": xrsa, "xrsb": xrsb}, index=index)
+    units = {"xrsa": u.W/u.m**2, "xrsb": u.W/u.m**2}
+    return timeseries.XRSTimeSeries(data, {"TELESCOP": "GOES 15"}, units)
@@ -0,0 +1,53 @@
+"""
+Cost of checking that GOES/XRS measurement times are in chronological order.
+
+Compares the vectorized check on float seconds used by ``_goes_lx`` and
+``_calc_rad_loss`` with the previous check, which compared each difference
+of adjacent `~astropy.time.Time` elements to a zero
+`~astropy.time.TimeDelta` in a Python loop.  The time to convert the
+measurement times to seconds is reported separately.
+
+Usage::
+
+    python benchmarks/goes_xrs_chrono_order.py [--sizes 100000 1000000]
+"""
+import time
+import argparse
+
+import numpy as np
+
+import astropy.units as u
+from astropy.time import Time, TimeDelta
+
+from sunkit_instruments.goes_xrs import goes_xrs as goes
+
+
+def previous_assert_chrono_order(obstime):
+    chrono_check = obstime[1:] - obstime[:-1]
+    if not all(val > TimeDelta(0*u.day) for val in chrono_check):
+        raise ValueError("Elements of obstime must be in chronological order.")
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6])
+    args = parser.parse_args()
+
+    print(f"{'samples':>10}{'previous [s]':>14}{'vectorized [s]':>16}{'to seconds [s]':>16}")
+    for n in args.sizes:
+        obstime = Time("2011-06-07") + np.arange(n) * u.s
+        seconds = (obstime - obstime[0]).sec
+        previous = timed(previous_assert_chrono_order, obstime)
+        vectorized = timed(goes._assert_chrono_order, seconds)
+        to_seconds = timed(lambda: (obstime - obstime[0]).sec)
+        print(f"{n:>10}{previous:>14.3f}{vectorized:>16.5f}{to_seconds:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Speed and accuracy of the "grid" engine for the CHIANTI lookup tables.
+
+The temperature, emission measure and radiative loss rate of random GOES
+fluxes are calculated with the default "spline" engine and with the
+"grid" engine, and the run times and the largest relative deviation
+between the two are reported.
+
+Usage::
+
+    python benchmarks/goes_xrs_grid.py [--samples 10000000] [--table-dir DIR]
+"""
+import time
+import argparse
+
+import numpy as np
+from bench_utils import add_table_dir_argument, synthetic_fluxes, table_overrides
+
+import astropy.units as u
+
+from sunkit_instruments.goes_xrs import goes_xrs as goes
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--samples", type=int, default=10**7)
+    add_table_dir_argument(parser)
+    args = parser.parse_args()
+
+    longflux, shortflux = synthetic_fluxes(args.samples)
+    longflux = u.Quantity(longflux, "W/m**2")
+    shortflux = u.Quantity(shortflux, "W/m**2")
+    with table_overrides(args.table_dir):
+        # Fit the tables and build the grids before timing
+        for engine in goes.CHIANTI_ENGINES:
+            temp, em = goes._goes_chianti_tem(longflux[:10], shortflux[:10], satellite=15,
+                                              engine=engine)
+            goes._calc_rad_loss(temp, em, engine=engine)
+
+        results = {}
+        for engine in goes.CHIANTI_ENGINES:
+            time_tem, (temp, em) = timed(goes._goes_chianti_tem, longflux, shortflux,
+                                         satellite=15, engine=engine)
+            time_rad, rad_loss = timed(goes._calc_rad_loss, temp, em, engine=engine)
+            results[engine] = (time_tem, time_rad, temp, em, rad_loss["rad_loss_rate"])
+
+    print(f"{args.samples} samples")
+    print(f"{'engine':<8}{'_goes_chianti_tem [s]':>24}{'_calc_rad_loss [s]':>22}")
+    for engine, (time_tem, time_rad, *_) in results.items():
+        print(f"{engine:<8}{time_tem:>24.2f}{time_rad:>22.2f}")
+    print("max relative deviation of grid from spline:")
+    for i, name in enumerate(["temperature", "em", "rad_loss_rate"], start=2):
+        spline, grid = results["spline"][i].value, results["grid"][i].value
+        print(f"  {name:<14}{np.max(np.abs(grid / spline - 1)):.2e}")
+
+
+if __name__ == "__main__":
+    main()
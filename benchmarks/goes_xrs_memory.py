@@ -0,0 +1,121 @@
+"""
+Peak memory use of the GOES/XRS derived quantity functions.
+
+Each function is run on a synthetic 2-s cadence `~sunpy.timeseries.sources.XRSTimeSeries`
+in a fresh subprocess, once returning a new timeseries (the default) and
+once with ``derived_only=True``, and the peak resident set size of the
+subprocess is reported.  For comparison, each is also run as a
+"baseline" reference implementation, which builds its result as the
+functions did before ``derived_only`` was added: by deep copying the
+input and adding each derived column with ``add_column``.  The derived
+quantities themselves are found by the same code in all modes.
+
+Usage::
+
+    python benchmarks/goes_xrs_memory.py [--days 90] [--table-dir DIR]
+
+``--table-dir`` points to a directory holding the CHIANTI tables under their
+usual file names, for machines that cannot download them.
+"""
+import sys
+import copy
+import time
+import argparse
+import subprocess
+
+from bench_utils import add_table_dir_argument, peak_rss_mb, synthetic_goests, table_overrides
+
+from sunpy import timeseries
+
+from sunkit_instruments.goes_xrs import goes_xrs as goes
+
+FUNCTIONS = ["calculate_temperature_em", "calculate_radiative_loss_rate",
+             "calculate_xray_luminosity"]
+MODES = ["baseline", "new", "derived_only"]
+
+
+def _baseline_copy(goests):
+    return timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta),
+                                    data=copy.deepcopy(goests.to_dataframe()),
+                                    units=copy.deepcopy(goests.units))
+
+
+def baseline_temperature_em(goests):
+    temp, em = goes._goes_chianti_tem(goests.quantity("xrsb"), goests.quantity("xrsa"),
+                                      satellite=goests.meta.metas[0]["TELESCOP"].split()[1],
+                                      date=goests.to_dataframe().index[0])
+    ts_new = _baseline_copy(goests)
+    ts_new = ts_new.add_column("temperature", temp)
+    ts_new = ts_new.add_column("em", em)
+    return ts_new
+
+
+def baseline_radiative_loss_rate(goests):
+    if "temperature" in goests.columns and "em" in goests.columns:
+        ts_new = _baseline_copy(goests)
+    else:
+        ts_new = baseline_temperature_em(goests)
+    rad_loss_out = goes._calc_rad_loss(ts_new.quantity("temperature"), ts_new.quantity("em"))
+    return ts_new.add_column("rad_loss_rate", rad_loss_out["rad_loss_rate"].to("W"))
+
+
+def baseline_xray_luminosity(goests):
+    lx_out = goes._goes_lx(goests.quantity("xrsb"), goests.quantity("xrsa"),
+                           date=str(goests.to_dataframe().index[0]))
+    ts_new = _baseline_copy(goests)
+    ts_new = ts_new.add_column("luminosity_xrsa", lx_out["shortlum"].to("W"))
+    ts_new = ts_new.add_column("luminosity_xrsb", lx_out["longlum"].to("W"))
+    return ts_new
+
+
+# Reference implementations of the functions as they built their results
+# before derived_only was added.
+BASELINES = {"calculate_temperature_em": baseline_temperature_em,
+             "calculate_radiative_loss_rate": baseline_radiative_loss_rate,
+             "calculate_xray_luminosity": baseline_xray_luminosity}
+
+
+def run_child(function, mode, days, table_dir):
+    goests = synthetic_goests(int(days * 86400 / 2))
+    if mode == "baseline":
+        run = BASELINES[function]
+    else:
+        def run(goests):
+            return getattr(goes, function)(goests, derived_only=mode == "derived_only")
+    with table_overrides(table_dir):
+        # Warm up the CHIANTI table cache on a short series so that only
+        # the cost of processing the full series is measured.
+        run(goests.truncate(0, 10))
+        before = peak_rss_mb()
+        start = time.perf_counter()
+        run(goests)
+        elapsed = time.perf_counter() - start
+    print(f"{before:.1f} {peak_rss_mb():.1f} {elapsed:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--days", type=float, default=90)
+    add_table_dir_argument(parser)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(args.child[0], args.child[1], args.days, args.table_dir)
+        return
+
+    n = int(args.days * 86400 / 2)
+    print(f"{n} samples; RSS in MB")
+    print(f"{'function':<32}{'mode':>14}{'RSS before':>12}{'peak RSS':>10}{'time [s]':>10}")
+    for function in FUNCTIONS:
+        for mode in MODES:
+            cmd = [sys.executable, __file__, "--days", str(args.days),
+                   "--child", function, mode]
+            if args.table_dir:
+                cmd += ["--table-dir", args.table_dir]
+            before, peak, elapsed = subprocess.run(
+                cmd, check=True, capture_output=True, text=True).stdout.split()
+            print(f"{function:<32}{mode:>14}{before:>12}{peak:>10}{elapsed:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,4 @@
+from .event_store import *  # NOQA
 from .goes_xrs import *  # NOQA
+from .pyramid import *  # NOQA
+from .reprocess import *  # NOQA
@@ -0,0 +1,220 @@
+"""
+A persistent local store of the GOES event list.
+"""
+import sqlite3
+
+import numpy as np
+
+from astropy.time import Time
+from sunpy.time import TimeRange
+
+from sunkit_instruments.goes_xrs.goes_xrs import (
+    _event_class_flux,
+    _event_times,
+    _goes_event_frame,
+    _optional_values,
+    _time_datetime64,
+    flareclass_to_flux,
+)
+
+__all__ = ['GOESEventStore']
+
+_EVENT_STORE_VERSION = 1
+_EVENT_STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    event_id TEXT PRIMARY KEY,
+    start_time TEXT NOT NULL,
+    peak_time TEXT,
+    end_time TEXT NOT NULL,
+    goes_class TEXT,
+    class_flux REAL,
+    coord1 REAL,
+    coord2 REAL,
+    noaa_active_region INTEGER
+);
+CREATE INDEX IF NOT EXISTS events_start_time ON events (start_time);
+CREATE INDEX IF NOT EXISTS events_end_time ON events (end_time);
+CREATE INDEX IF NOT EXISTS events_class_flux ON events (class_flux, start_time);
+CREATE TABLE IF NOT EXISTS coverage (
+    start_time TEXT NOT NULL,
+    end_time TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coverage_start_time ON coverage (start_time);
+"""
+
+
+class GOESEventStore:
+    """
+    Persistent local store of GOES flare events retrieved from the HEK.
+
+    The events are kept in an SQLite database, indexed on their start and
+    end times and on the flux of their GOES class, together with the time
+    ranges that have already been retrieved. Passed as the ``cache`` of
+    `~sunkit_instruments.goes_xrs.get_goes_event_list`, it answers repeated
+    and overlapping queries locally.
+
+    Times are stored as ISO 8601 strings in UTC, which sort chronologically.
+
+    Parameters
+    ----------
+    path : `str` or `pathlib.Path`
+        The database file, which is created if it does not exist.
+        ``":memory:"`` gives a store that only lasts as long as the object.
+
+    Examples
+    --------
+    >>> from sunpy.time import TimeRange
+    >>> from sunkit_instruments.goes_xrs import GOESEventStore
+    >>> store = GOESEventStore(":memory:")
+    >>> [gap.start.isot for gap in store.missing(TimeRange("2011-06-07", "2011-06-08"))]
+    ['2011-06-07T00:00:00.000']
+    >>> len(store)
+    0
+    >>> store.close()
+    """
+
+    def __init__(self, path):
+        self._connection = sqlite3.connect(str(path))
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _EVENT_STORE_VERSION):
+            self._connection.close()
+            raise ValueError(f"{path} is a GOES event store of unsupported version {version}")
+        with self._connection:
+            self._connection.executescript(_EVENT_STORE_SCHEMA)
+            self._connection.execute(f"PRAGMA user_version = {_EVENT_STORE_VERSION}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Close the database file.
+        """
+        self._connection.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def missing(self, timerange):
+        """
+        The parts of a time range that have not been retrieved yet.
+
+        Parameters
+        ----------
+        timerange : `sunpy.time.TimeRange`
+            The time range to check.
+
+        Returns
+        -------
+        `list` of `sunpy.time.TimeRange`
+            The uncovered parts of ``timerange``, in chronological order.
+        """
+        start, end = timerange.start.isot, timerange.end.isot
+        gaps = []
+        cursor = start
+        covered = self._connection.execute(
+            "SELECT start_time, end_time FROM coverage WHERE end_time > ? AND start_time < ?"
+            " ORDER BY start_time", (start, end))
+        for covered_start, covered_end in covered:
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return [TimeRange(gap_start, gap_end) for gap_start, gap_end in gaps]
+
+    def add(self, events, timerange):
+        """
+        Store the events retrieved from the HEK for a time range.
+
+        Events that are already in the store are replaced, and
+        ``timerange`` is recorded as covered.
+
+        Parameters
+        ----------
+        events : `sunpy.net.hek.HEKTable`
+            The result of a HEK query for flares detected by GOES,
+            unfiltered by GOES class.
+        timerange : `sunpy.time.TimeRange`
+            The time range that was queried.
+        """
+        rows = []
+        if len(events):
+            classes = np.asarray(events['fl_goescls']).astype(str)
+            rows = zip(np.asarray(events['kb_archivid']).astype(str).tolist(),
+                       *(np.datetime_as_string(_time_datetime64(_event_times(events[name])),
+                                               unit='ms').tolist()
+                         for name in ('event_starttime', 'event_peaktime', 'event_endtime')),
+                       classes.tolist(),
+                       _event_class_flux(classes).tolist(),
+                       _optional_values(events['event_coord1'], float),
+                       _optional_values(events['event_coord2'], float),
+                       _optional_values(events['ar_noaanum'], int))
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._mark_covered(timerange.start.isot, timerange.end.isot)
+
+    def _mark_covered(self, start, end):
+        overlapping = self._connection.execute(
+            "SELECT rowid, start_time, end_time FROM coverage"
+            " WHERE end_time >= ? AND start_time <= ?", (start, end)).fetchall()
+        for rowid, covered_start, covered_end in overlapping:
+            start, end = min(start, covered_start), max(end, covered_end)
+            self._connection.execute("DELETE FROM coverage WHERE rowid = ?", (rowid,))
+        self._connection.execute("INSERT INTO coverage VALUES (?, ?)", (start, end))
+
+    def query(self, timerange, goes_class_filter=None, as_dataframe=False):
+        """
+        Read the stored events overlapping a time range.
+
+        Parameters
+        ----------
+        timerange : `sunpy.time.TimeRange`
+            The time range to read the event list for.
+        goes_class_filter: `str`, optional
+            A string specifying a minimum GOES class for inclusion in the list,
+            e.g., "M1", "X2". Only flares of a greater class are included.
+        as_dataframe : `bool`, optional
+            If `True`, return a `pandas.DataFrame` instead of a list of
+            dictionaries. Default is `False`.
+
+        Returns
+        -------
+        `list` or `pandas.DataFrame`:
+            The events in the format of
+            `~sunkit_instruments.goes_xrs.get_goes_event_list`, ordered by
+            start time.
+        """
+        sql = ("SELECT start_time, peak_time, end_time, goes_class, coord1, coord2,"
+               " noaa_active_region FROM events WHERE start_time <= ? AND end_time >= ?")
+        parameters = [timerange.end.isot, timerange.start.isot]
+        if goes_class_filter:
+            # The same comparison as the HEK search of get_goes_event_list
+            sql += " AND class_flux > ?"
+            parameters.append(flareclass_to_flux(goes_class_filter).to_value("W/m^2"))
+        rows = self._connection.execute(sql + " ORDER BY start_time, event_id",
+                                        parameters).fetchall()
+        if as_dataframe:
+            columns = list(zip(*rows)) or [()] * 7
+            # ISO 8601 strings are parsed by numpy directly.
+            return _goes_event_frame(*(np.array(times, dtype='datetime64[ns]')
+                                       for times in columns[:3]), *columns[3:])
+        if not rows:
+            return []
+
+        starts, peaks, ends, classes, coords1, coords2, regions = zip(*rows)
+        times = Time(starts + peaks + ends, format='isot', scale='utc')
+        n = len(rows)
+        return [{
+            'event_date': starts[i][:10],
+            'start_time': times[i],
+            'peak_time': times[n + i],
+            'end_time': times[2 * n + i],
+            'goes_class': classes[i],
+            'goes_location': (coords1[i], coords2[i]),
+            'noaa_active_region': None if regions[i] is None else np.int64(regions[i]),
+        } for i in range(n)]
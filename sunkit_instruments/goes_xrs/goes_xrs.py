@@ -37,6 +37,12 @@ Meanwhile, the X-ray luminosity in the two GOES passbands can be obtained by
 `~sunkit_instruments.goes_xrs.calculate_xray_luminosity`. To do so, this function calls
 `~sunkit_instruments.goes_xrs._goes_lx` and `~sunkit_instruments.goes_xrs._calc_xraylum`.
 
+The unit-free kernels behind these functions, such as
+`~sunkit_instruments.goes_xrs.temperature_em_kernel`, also accept
+`dask.array.Array` inputs.  They then return dask arrays which are
+evaluated block by block when computed, so archives larger than memory can
+be processed out of core and on many cores.
+
 References
 ----------
 
@@ -45,44 +51,70 @@ References
           `10.1051/0004-6361/200911712 <https://doi.org/10.1051/0004-6361/200911712>`__
 """
 
+import os
 import csv
+import sys
 import copy
 import socket
+import struct
+import hashlib
+import inspect
+import zipfile
 import datetime
+import warnings
+import functools
+import itertools
+import threading
 from itertools import dropwhile
+from collections import namedtuple
 from urllib.parse import urljoin
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
+import erfa
 import numpy as np
+import pandas
 from scipy import interpolate
 from scipy.integrate import cumtrapz, trapz
 
 import astropy.units as u
-from astropy.time import TimeDelta
+from astropy.table import Table, vstack
+from astropy.time import Time, TimeDelta
 from sunpy import timeseries
 from sunpy.coordinates import sun
 from sunpy.data import manager
 from sunpy.sun import constants
 from sunpy.time import parse_time
 from sunpy.util.config import get_and_create_download_dir
+from sunpy.util.exceptions import SunpyUserWarning
 
 GOES_CONVERSION_DICT = {'X': u.Quantity(1e-4, "W/m^2"),
                         'M': u.Quantity(1e-5, "W/m^2"),
                         'C': u.Quantity(1e-6, "W/m^2"),
                         'B': u.Quantity(1e-7, "W/m^2"),
                         'A': u.Quantity(1e-8, "W/m^2")}
+# GOES class letters in order of increasing flux, one per decade from 1e-8 W/m^2
+_GOES_CLASS_LETTERS = np.array(sorted(GOES_CONVERSION_DICT, key=GOES_CONVERSION_DICT.get))
+_GOES_MIN_DECADE = -8
+_GOES_MAX_DECADE = _GOES_MIN_DECADE + len(_GOES_CLASS_LETTERS) - 1
 __all__ = ['get_goes_event_list', 'calculate_temperature_em',
            'calculate_radiative_loss_rate', 'calculate_xray_luminosity',
-           'flux_to_flareclass', 'flareclass_to_flux', '_goes_lx',
+           'calculate_thermodynamics', 'calculate_interval_energies',
+           'calculate_flare_energetics',
+           'iter_thermodynamics', 'XRSEnergyAccumulator',
+           'temperature_em_uncertainty', 'temperature_em_kernel', 'temperature_kernel',
+           'emission_measure_kernel', 'synthetic_fluxes', 'synthetic_fluxes_kernel',
+           'radiative_loss_rate_kernel', 'xray_luminosity_kernel', 'interval_integral_kernel',
+           'interval_peak_kernel',
+           'flux_to_flareclass', 'flareclass_to_flux', 'find_flares', 'FlareDetector',
+           'chianti_cache_info', 'clear_chianti_cache', 'ChiantiTableStore',
+           'write_chianti_table_store', 'use_chianti_table_store', '_goes_lx',
            '_goes_get_chianti_em', '_calc_rad_loss', '_calc_xraylum', '_goes_chianti_tem', '_goes_get_chianti_temp']
 
-try:
-    # Check required data files are present in user's default download dir
-    # Define location where GOES data files are stored.
-    # Manually resolve the hostname
-    HOST = socket.gethostbyname_ex('hesperia.gsfc.nasa.gov')[0]
-except socket.gaierror:
-    HOST = ''
-GOES_REMOTE_PATH = f"http://{HOST}/ssw/gen/idl/synoptic/goes/"
+# Host of the GOES data files. Its name is only resolved when one of the
+# files has to be downloaded, see _goes_remote_path.
+GOES_REMOTE_HOST = 'hesperia.gsfc.nasa.gov'
+_GOES_REMOTE_PATH = None
 # Define variables for file names
 FILE_TEMP_COR = "goes_chianti_temp_cor.csv"
 FILE_TEMP_PHO = "goes_chianti_temp_pho.csv"
@@ -91,7 +123,280 @@ FILE_EM_PHO = "goes_chianti_em_pho.csv"
 FILE_RAD_COR = "chianti7p1_rad_loss.txt"
 
 
-def get_goes_event_list(timerange, goes_class_filter=None):
+def _goes_remote_path():
+    """
+    Return the URL of the directory holding the GOES data files.
+
+    The hostname is resolved on first use rather than on import, so that
+    importing this module never blocks on a DNS lookup.
+    """
+    global _GOES_REMOTE_PATH
+    if _GOES_REMOTE_PATH is None:
+        try:
+            # Manually resolve the hostname
+            host = socket.gethostbyname_ex(GOES_REMOTE_HOST)[0]
+        except socket.gaierror:
+            # Do not remember the failure so the next download tries again.
+            return f"http://{GOES_REMOTE_HOST}/ssw/gen/idl/synoptic/goes/"
+        _GOES_REMOTE_PATH = f"http://{host}/ssw/gen/idl/synoptic/goes/"
+    return _GOES_REMOTE_PATH
+
+
+def __getattr__(name):
+    # GOES_REMOTE_PATH used to be resolved on import; keep it available.
+    if name == "GOES_REMOTE_PATH":
+        return _goes_remote_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _RemoteTableURLs(Sequence):
+    """
+    The download URL of a GOES data file, built only when it is needed.
+
+    Used in place of a list of URLs in ``manager.require`` so that the
+    remote path is only resolved when the file is not in the local cache.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+
+    def __getitem__(self, index):
+        return [urljoin(_goes_remote_path(), self.filename)][index]
+
+    def __len__(self):
+        return 1
+
+
+ChiantiCacheInfo = namedtuple("ChiantiCacheInfo", ["hits", "misses", "currsize"])
+# Tolerance to which the "grid" engine reproduces the CHIANTI spline fits,
+# see _ChiantiGrid.
+CHIANTI_GRID_TOLERANCE = 1e-6
+# The largest grid tried before falling back to the spline fits.
+_CHIANTI_GRID_MAX_SIZE = 2**22 + 1
+CHIANTI_ENGINES = ("spline", "grid")
+
+
+class _ChiantiSpline:
+    """
+    Interpolating spline fit to a CHIANTI lookup table.
+
+    Parameters
+    ----------
+    x, y : `numpy.ndarray`
+        The tabulated values; ``x`` must be increasing.
+    log_x : `bool`
+        Whether the "grid" engine should sample ``x`` uniformly in log space.
+    relative : `bool`
+        Whether the "grid" engine tolerance applies to the relative, rather
+        than the absolute, deviation from the spline.
+    """
+
+    def __init__(self, x, y, log_x=False, relative=True):
+        self.tck = interpolate.splrep(x, y, s=0)
+        self.x_min = np.min(x)
+        self.x_max = np.max(x)
+        self.log_x = log_x
+        self.relative = relative
+        self._grid = None
+
+    def __call__(self, x, engine="spline"):
+        """
+        Evaluate the fit at ``x`` with the "spline" or the "grid" engine.
+        """
+        if engine == "grid":
+            if self._grid is None:
+                self._grid = _ChiantiGrid(self)
+                if not self._grid.converged:
+                    warnings.warn("The grid engine does not reach a tolerance of "
+                                  f"{CHIANTI_GRID_TOLERANCE} on this CHIANTI table "
+                                  f"(error {self._grid.max_error:.2g}), the spline engine "
+                                  "is used instead.", SunpyUserWarning)
+            if self._grid.converged:
+                return self._grid(x)
+        elif engine != "spline":
+            raise ValueError("engine must be one of {}.".format(
+                ", ".join(repr(e) for e in CHIANTI_ENGINES)))
+        # splev rejects empty input
+        if np.size(x) == 0:
+            return np.empty(np.shape(x))
+        return interpolate.splev(x, self.tck, der=0)
+
+
+class _ChiantiGrid:
+    """
+    Piecewise linear approximation of a `_ChiantiSpline` on a uniform grid.
+
+    The spline is sampled once on a grid that is uniform in ``x``, or in
+    ``log10(x)``, and is then evaluated by index arithmetic and linear
+    interpolation between the two neighbouring grid points, which takes
+    constant time per sample. The grid is refined, by doubling the number
+    of points, until the deviation from the spline at the midpoints
+    between grid points, where the error of linear interpolation peaks,
+    is at most `CHIANTI_GRID_TOLERANCE`, or the grid would exceed
+    ``max_size`` points. The reached deviation is stored in ``max_error``
+    and whether it is within the tolerance in ``converged``.
+    """
+
+    def __init__(self, spline, tolerance=CHIANTI_GRID_TOLERANCE, size=2**10 + 1,
+                 max_size=None):
+        if max_size is None:
+            max_size = _CHIANTI_GRID_MAX_SIZE
+        self.log_x = spline.log_x
+        if self.log_x:
+            start, stop = np.log10(spline.x_min), np.log10(spline.x_max)
+        else:
+            start, stop = spline.x_min, spline.x_max
+        while True:
+            nodes = np.linspace(start, stop, size)
+            values = spline(self._unscale(nodes))
+            midpoints = spline(self._unscale((nodes[:-1] + nodes[1:]) / 2))
+            error = np.abs((values[:-1] + values[1:]) / 2 - midpoints)
+            if spline.relative:
+                error /= np.abs(midpoints)
+            self.max_error = np.max(error)
+            self.converged = self.max_error <= tolerance
+            if self.converged or 2 * size - 1 > max_size:
+                break
+            size = 2 * size - 1
+        self.start = start
+        self.step = (stop - start) / (size - 1)
+        self.values = values[:-1]
+        self.slopes = np.diff(values)
+
+    def _unscale(self, nodes):
+        return 10**nodes if self.log_x else nodes
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        position = ((np.log10(x) if self.log_x else x) - self.start) / self.step
+        with np.errstate(invalid='ignore'):
+            index = np.clip(np.floor(position), 0, len(self.values) - 1)
+        index = np.nan_to_num(index).astype(np.intp)
+        return self.values[index] + (position - index) * self.slopes[index]
+
+
+class _ChiantiSplineCache:
+    """
+    Process-wide cache of spline fits to the CHIANTI lookup tables.
+
+    Entries are keyed by ``(table_file, satellite, abundances)`` so that
+    each table is only parsed and fitted once per interpreter.
+    """
+
+    def __init__(self):
+        self._splines = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, fit):
+        """
+        Return the cached spline for ``key``, calling ``fit()`` on a miss.
+        """
+        with self._lock:
+            spline = self._splines.get(key)
+            if spline is not None:
+                self.hits += 1
+                return spline
+            self.misses += 1
+        # Fit outside the lock so a slow table read does not block
+        # lookups of other tables.
+        spline = fit()
+        with self._lock:
+            return self._splines.setdefault(key, spline)
+
+    def invalidate(self, table_file=None):
+        """
+        Drop the cached fits of ``table_file``, or of all tables if `None`.
+        """
+        with self._lock:
+            if table_file is None:
+                self._splines.clear()
+            else:
+                for key in [key for key in self._splines if key[0] == str(table_file)]:
+                    del self._splines[key]
+
+    def clear(self):
+        with self._lock:
+            self._splines.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return ChiantiCacheInfo(self.hits, self.misses, len(self._splines))
+
+
+_CHIANTI_SPLINE_CACHE = _ChiantiSplineCache()
+
+
+# Version of the layout of the files written by write_chianti_table_store
+CHIANTI_STORE_VERSION = 1
+# Data manager names of the tables held in a CHIANTI table store
+_CHIANTI_STORE_TABLES = ("file_temp_cor", "file_temp_pho", "file_em_cor", "file_em_pho",
+                         "file_rad_cor")
+
+
+class ChiantiTableStore:
+    """
+    Read-only, memory-mapped store of the parsed CHIANTI lookup tables.
+
+    The store is an uncompressed ``.npz`` file written by
+    `~sunkit_instruments.goes_xrs.write_chianti_table_store`.  For each
+    table it holds the column names, the values as a (columns, rows) array
+    and the SHA-256 hash of the text file it was parsed from.  The arrays
+    are memory-mapped rather than read, so processes using the same store
+    share its pages.  The hash of each table file looked up is cached, and
+    only recomputed when the modification time or size of the file change.
+
+    Parameters
+    ----------
+    path : `str` or `pathlib.Path`
+        The store file.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a store of version `CHIANTI_STORE_VERSION`.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        arrays = _npz_memmap(self.path)
+        version = int(arrays.pop("version", -1))
+        if version != CHIANTI_STORE_VERSION:
+            raise ValueError(f"{self.path} is a CHIANTI table store of version {version}, "
+                             f"expected version {CHIANTI_STORE_VERSION}.")
+        self._tables = {}
+        # data_file: ((st_mtime_ns, st_size), sha256)
+        self._hashes = {}
+        for name in _CHIANTI_STORE_TABLES:
+            self._tables[str(arrays[f"{name}.sha256"])] = (
+                arrays[f"{name}.columns"].tolist(), arrays[f"{name}.values"])
+
+    def __len__(self):
+        return len(self._tables)
+
+    def get(self, data_file):
+        """
+        The ``(columns, values)`` of the table parsed from ``data_file``.
+
+        Returns `None` if the store holds no table with the hash of ``data_file``,
+        e.g. because the file has changed since the store was written.
+        """
+        stat = os.stat(data_file)
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._hashes.get(str(data_file))
+        if cached is None or cached[0] != key:
+            cached = self._hashes[str(data_file)] = (key, _file_sha256(data_file))
+        return self._tables.get(cached[1])
+
+
+_CHIANTI_TABLE_STORE = None
+
+
+def get_goes_event_list(timerange, goes_class_filter=None, cache=None, window=None,
+                        max_workers=4, retries=2, as_dataframe=False):
     """
     Retrieve list of flares detected by GOES within a given time range.
 
@@ -101,48 +406,87 @@ def get_goes_event_list(timerange, goes_class_filter=None):
         The time range to download the event list for.
     goes_class_filter: `str`, optional
         A string specifying a minimum GOES class for inclusion in the list,
-        e.g., "M1", "X2".
+        e.g., "M1", "X2". Only flares of a greater class are included.
+    cache : `str`, `pathlib.Path` or `~sunkit_instruments.goes_xrs.GOESEventStore`, optional
+        A local event store, or the path of its database file. If given,
+        only the parts of ``timerange`` that have not been retrieved into the
+        store before are requested from the HEK, for all GOES classes, and
+        the list is then read from the store. Default is to always query
+        the HEK.
+    window : `~astropy.units.Quantity` or `~astropy.time.TimeDelta`, optional
+        If given, the HEK is searched in windows of this length, which are
+        fetched concurrently, e.g. ``30 * u.day`` for ranges of several
+        years. Default is to search the whole time range at once.
+    max_workers : `int`, optional
+        The maximum number of windows fetched at the same time. Default is 4.
+    retries : `int`, optional
+        How many times a search that fails with an `OSError` is repeated
+        before giving up. Each window is retried independently. Default is 2.
+    as_dataframe : `bool`, optional
+        If `True`, return the flares as a `pandas.DataFrame` with one row per
+        flare instead of a list of dictionaries, which is much faster to
+        build and filter for long event lists. Default is `False`.
 
     Returns
     -------
-    `list`:
-        A list of all the flares found for the given time range.
+    `list` or `pandas.DataFrame`:
+        A list of all the flares found for the given time range. The
+        `~pandas.DataFrame` has the columns ``start_time``, ``peak_time``
+        and ``end_time`` (``datetime64[ns]``, UTC), ``goes_class``,
+        ``class_letter`` (an ordered categorical of the class letters),
+        ``peak_flux`` (the flux of the GOES class in W/m^2, NaN for an
+        invalid class), ``event_coord1``, ``event_coord2`` and
+        ``noaa_active_region`` (a nullable integer).
     """
-    # Importing hek here to avoid calling code that relies on optional dependencies.
-    from sunpy.net import hek
-
-    # use HEK module to search for GOES events
-    client = hek.HEKClient()
-    event_type = 'FL'
-    tstart = timerange.start
-    tend = timerange.end
-
-    # query the HEK for a list of events detected by the GOES instrument
-    # between tstart and tend (using a GOES-class filter)
-    if goes_class_filter:
-        result = client.search(hek.attrs.Time(tstart, tend),
-                               hek.attrs.EventType(event_type),
-                               hek.attrs.FL.GOESCls > goes_class_filter,
-                               hek.attrs.OBS.Observatory == 'GOES')
-    else:
-        result = client.search(hek.attrs.Time(tstart, tend),
-                               hek.attrs.EventType(event_type),
-                               hek.attrs.OBS.Observatory == 'GOES')
+    if cache is not None:
+        from sunkit_instruments.goes_xrs.event_store import GOESEventStore
+
+        store = cache if isinstance(cache, GOESEventStore) else GOESEventStore(cache)
+        try:
+            for missing in store.missing(timerange):
+                store.add(_search_goes_events(missing.start, missing.end, window=window,
+                                              max_workers=max_workers, retries=retries),
+                          missing)
+            return store.query(timerange, goes_class_filter, as_dataframe=as_dataframe)
+        finally:
+            if store is not cache:
+                store.close()
+
+    # The class filter is applied to the fluxes of the classes here, as in
+    # the store, rather than by the HEK, which compares the class strings.
+    result = _search_goes_events(timerange.start, timerange.end, window=window,
+                                 max_workers=max_workers, retries=retries)
+    if goes_class_filter and len(result):
+        result = result[_event_class_flux(result['fl_goescls'])
+                        > flareclass_to_flux(goes_class_filter).to_value("W/m^2")]
+
+    if as_dataframe:
+        if not len(result):
+            return _goes_event_frame([], [], [], [], [], [], [])
+        return _goes_event_frame(
+            *(_time_datetime64(_event_times(result[name]))
+              for name in ('event_starttime', 'event_peaktime', 'event_endtime')),
+            result['fl_goescls'], result['event_coord1'], result['event_coord2'],
+            result['ar_noaanum'])
 
     # want to condense the results of the query into a more manageable
     # dictionary
     # keep event data, start time, peak time, end time, GOES-class,
     # location, active region source (as per GOES list standard)
     # make this into a list of dictionaries
+    if not len(result):
+        return []
+    starts, peaks, ends = (_event_times(result[name]) for name in
+                           ('event_starttime', 'event_peaktime', 'event_endtime'))
+    dates = starts.strftime('%Y-%m-%d')
     goes_event_list = []
 
-    for r in result:
+    for i, r in enumerate(result):
         goes_event = {
-            'event_date': parse_time(r['event_starttime']).strftime(
-                '%Y-%m-%d'),
-            'start_time': parse_time(r['event_starttime']),
-            'peak_time': parse_time(r['event_peaktime']),
-            'end_time': parse_time(r['event_endtime']),
+            'event_date': str(dates[i]),
+            'start_time': starts[i],
+            'peak_time': peaks[i],
+            'end_time': ends[i],
             'goes_class': str(r['fl_goescls']),
             'goes_location': (r['event_coord1'], r['event_coord2']),
             'noaa_active_region': r['ar_noaanum']
@@ -152,8 +496,160 @@ def get_goes_event_list(timerange, goes_class_filter=None):
     return goes_event_list
 
 
+def _event_times(column):
+    """
+    Parse a column of HEK event times at once.
+    """
+    if isinstance(column, Time):
+        return column
+    return parse_time(np.asarray(column).astype(str).tolist())
+
+
+def _goes_event_frame(starts, peaks, ends, classes, coords1, coords2, regions):
+    """
+    Build the `~pandas.DataFrame` form of the GOES event list from its columns.
+    """
+    classes = np.asarray(classes).astype(str)
+    letters = np.char.upper(np.char.strip(classes)).astype('U1')
+    return pandas.DataFrame({
+        'start_time': np.asarray(starts, dtype='datetime64[ns]'),
+        'peak_time': np.asarray(peaks, dtype='datetime64[ns]'),
+        'end_time': np.asarray(ends, dtype='datetime64[ns]'),
+        'goes_class': classes.astype(object),
+        'class_letter': pandas.Categorical(letters, categories=_GOES_CLASS_LETTERS,
+                                           ordered=True),
+        'peak_flux': _event_class_flux(classes),
+        'event_coord1': np.array(_optional_values(coords1, float), dtype=float),
+        'event_coord2': np.array(_optional_values(coords2, float), dtype=float),
+        'noaa_active_region': pandas.array(_optional_values(regions, int), dtype='Int64'),
+    })
+
+
+# The HEK columns used for the GOES event list.
+_GOES_EVENT_COLUMNS = ("kb_archivid", "event_starttime", "event_peaktime", "event_endtime",
+                       "fl_goescls", "event_coord1", "event_coord2", "ar_noaanum")
+
+
+def _search_goes_events(tstart, tend, window=None, max_workers=4, retries=2):
+    """
+    Query the HEK for the flares detected by GOES between two times.
+
+    With ``window``, the time range is split into windows of that length
+    which are searched by a pool of up to ``max_workers`` threads. The
+    results are merged into one table of the ``_GOES_EVENT_COLUMNS``,
+    ordered by start time, in which events found in several windows are
+    only kept once.
+    """
+    if window is None:
+        return _search_goes_window(tstart, tend, retries)
+
+    edges = _window_edges(tstart, tend, window)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(edges) - 1)) as executor:
+        tables = list(executor.map(
+            lambda start, end: _search_goes_window(start, end, retries),
+            edges[:-1], edges[1:]))
+    return _merge_event_tables(tables)
+
+
+def _search_goes_window(tstart, tend, retries):
+    """
+    Query the HEK for GOES flares, repeating the search if it fails with an `OSError`.
+    """
+    # Importing hek here to avoid calling code that relies on optional dependencies.
+    from sunpy.net import attrs, hek
+
+    # use HEK module to search for GOES events
+    client = hek.HEKClient()
+    event_type = 'FL'
+
+    # query the HEK for a list of events detected by the GOES instrument
+    # between tstart and tend
+    query = [attrs.Time(tstart, tend), hek.attrs.EventType(event_type)]
+    query.append(hek.attrs.OBS.Observatory == 'GOES')
+    for attempt in range(retries + 1):
+        try:
+            return client.search(*query)
+        except OSError:
+            if attempt == retries:
+                raise
+
+
+def _window_edges(tstart, tend, window):
+    """
+    Split a time range into consecutive windows of at most a given length.
+    """
+    step = TimeDelta(window).to_value(u.s)
+    if not step > 0:
+        raise ValueError("window must be a positive time interval")
+    duration = (tend - tstart).to_value(u.s)
+    n_windows = max(int(np.ceil(duration / step)), 1)
+    offsets = np.minimum(np.arange(n_windows + 1) * step, duration)
+    return tstart + TimeDelta(offsets, format='sec')
+
+
+def _merge_event_tables(tables):
+    """
+    Merge the HEK results of several windows, dropping duplicate events.
+    """
+    tables = [_event_columns(table) for table in tables if len(table)]
+    if not tables:
+        return Table()
+    merged = vstack(tables, metadata_conflicts='silent')
+    _, first = np.unique(np.asarray(merged['kb_archivid']).astype(str), return_index=True)
+    merged = merged[np.sort(first)]
+    merged.sort('event_starttime', kind='stable')
+    return merged
+
+
+def _event_columns(table):
+    """
+    Select the ``_GOES_EVENT_COLUMNS`` of a HEK result.
+
+    The other columns are object arrays, so that tables whose columns were
+    given different types by the HEK, e.g. because of missing values, can be
+    stacked.
+    """
+    columns = {}
+    for name in _GOES_EVENT_COLUMNS:
+        column = table[name]
+        if not isinstance(column, Time):
+            values = np.empty(len(column), dtype=object)
+            values[:] = list(column)
+            column = values
+        columns[name] = column
+    return Table(columns)
+
+
+def _event_class_flux(classes):
+    """
+    The flux of an array of GOES classes in W/m^2, NaN where a class is invalid.
+    """
+    flux, invalid = _flareclass_flux(np.asarray(classes).astype(str))
+    flux[invalid] = np.nan
+    return flux
+
+
+def _optional_values(column, kind):
+    """
+    Convert a table column to a list of Python numbers, with None for missing values.
+    """
+    array = np.asanyarray(column)
+    if array.dtype.kind in 'biuf':
+        missing = np.ma.getmaskarray(array)
+        if array.dtype.kind == 'f':
+            missing = missing | np.isnan(np.ma.getdata(array))
+        values = np.where(missing, 0, np.ma.getdata(array)).astype(kind).tolist()
+        if missing.any():
+            values = [None if is_missing else value
+                      for value, is_missing in zip(values, missing.tolist())]
+        return values
+    return [None if value is None or np.ma.is_masked(value) else kind(value)
+            for value in column]
+
+
 def calculate_temperature_em(goests, abundances="coronal",
-                             download=False, download_dir=None):
+                             download=False, download_dir=None, derived_only=False,
+                             engine="spline"):
     """
     Calculates temperature and emission measure from a
     `~sunpy.timeseries.sources.XRSTimeSeries`.
@@ -183,6 +679,16 @@ def calculate_temperature_em(goests, abundances="coronal",
     download_dir : `str`, optional
         The directory to download the GOES temperature and emission measure
         data files to, defaults to the default download directory.
+    derived_only : `bool`, optional
+        If `True`, only the temperature and emission measure are returned,
+        as a `~pandas.DataFrame` sharing the time index of ``goests``. The
+        flux data are not copied, which avoids the memory cost of
+        duplicating long timeseries. Defaults to `False`.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. 'grid'
+        interpolates linearly on a dense uniform grid sampled from the
+        spline fits, which is faster for long timeseries, and matches each
+        fit to within CHIANTI_GRID_TOLERANCE (1e-6).  Defaults to 'spline'.
 
     Returns
     -------
@@ -193,6 +699,9 @@ def calculate_temperature_em(goests, abundances="coronal",
         | ts_new.to_dataframe().temperature - Array of temperatures [MK]
         | ts_new.to_dataframe().em - Array of volume emission measures [cm**-3]
 
+        If ``derived_only`` is `True`, a `~pandas.DataFrame` holding only
+        these two columns is returned instead.
+
     Notes
     -----
     The temperature and volume emission measure are calculated here
@@ -260,27 +769,62 @@ def calculate_temperature_em(goests, abundances="coronal",
     if not download_dir:
         download_dir = get_and_create_download_dir()
 
-    # Find temperature and emission measure with _goes_chianti_tem
-    temp, em = _goes_chianti_tem(
-        goests.quantity("xrsb"),
-        goests.quantity("xrsa"),
+    temp, em = _goests_temperature_em(goests, abundances=abundances, download=download,
+                                      download_dir=download_dir, engine=engine)
+
+    return _add_derived_columns(goests, {"temperature": temp, "em": em}, derived_only)
+
+
+def _goests_temperature_em(goests, **kwargs):
+    """
+    Find temperature and emission measure of a XRSTimeSeries with _goes_chianti_tem.
+    """
+    return _goes_chianti_tem(
+        _goests_quantity(goests, "xrsb"),
+        _goests_quantity(goests, "xrsa"),
         satellite=goests.meta.metas[0]["TELESCOP"].split()[1],
         date=goests.to_dataframe().index[0],
-        abundances=abundances, download=download, download_dir=download_dir)
+        **kwargs)
+
+
+def _goests_quantity(goests, column):
+    """
+    Return a column of a XRSTimeSeries as a Quantity without copying the data.
+    """
+    return u.Quantity(goests.to_dataframe()[column].values, goests.units[column], copy=False)
+
 
-    ts_new = timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta),
-                                      data=copy.deepcopy(goests.to_dataframe()),
-                                      units=copy.deepcopy(goests.units))
-    ts_new = ts_new.add_column("temperature", temp)
-    ts_new = ts_new.add_column("em", em)
+def _add_derived_columns(goests, columns, derived_only=False):
+    """
+    Add derived quantities to a copy of a XRSTimeSeries.
 
-    return ts_new
+    Parameters
+    ----------
+    goests : `~sunpy.timeseries.sources.XRSTimeSeries`
+        The input timeseries, which is not altered.
+    columns : `dict` of `~astropy.units.Quantity`
+        The derived quantities, keyed by column name.
+    derived_only : `bool`
+        If `True`, return only the derived quantities as a
+        `~pandas.DataFrame` sharing the time index of ``goests``.
+    """
+    if derived_only:
+        return pandas.DataFrame({name: quantity.value for name, quantity in columns.items()},
+                                index=goests.to_dataframe().index)
+    # Copy the data once here, rather than using add_column which copies
+    # the whole dataframe for every added column.
+    data = goests.to_dataframe().copy()
+    units = copy.deepcopy(goests.units)
+    for name, quantity in columns.items():
+        data[name] = quantity.value
+        units[name] = quantity.unit
+    return timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta), data=data, units=units)
 
 
 @u.quantity_input
 def _goes_chianti_tem(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite=8,
                       date=datetime.datetime.today(), abundances="coronal",
-                      download=False, download_dir=None):
+                      download=False, download_dir=None, engine="spline"):
     """
     Calculates temperature and emission measure from GOES/XRS data.
 
@@ -295,13 +839,18 @@ def _goes_chianti_tem(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite=8
         Arrays containing the long and short GOES/XRS flux measurements
         respectively as a function of time.  Must be of same length. [W/m**2].
 
-    satellite : int (optional)
+    satellite : int or array of int (optional)
         Number of GOES satellite used to make observations, important for
-        correct calibration of data.
+        correct calibration of data.  An array of the same length as
+        longflux gives the satellite of each sample, e.g. for series
+        stitched together from several satellites.
         Default=8
 
     date : `astropy.time.Time` or `str`
-        Date when observations made.  Important for correctcalibration.
+        Date when observations made.  Important for correct calibration.
+        A `~astropy.time.Time` array of the same length as longflux gives
+        the date of each sample, e.g. for series spanning a calibration
+        change.
         Default=today
 
     abundances : (optional) string equalling 'coronal' or 'photospheric'
@@ -321,6 +870,13 @@ def _goes_chianti_tem(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite=8
         data files to.
         Default=SunPy default download directory
 
+    engine : (optional) string equalling 'spline' or 'grid'
+        How the fits to the lookup tables are evaluated.  'grid' is faster
+        for large arrays and matches each fit to within
+        CHIANTI_GRID_TOLERANCE (1e-6).  See _goes_get_chianti_temp() and
+        _goes_get_chianti_em().
+        Default='spline'
+
     Returns
     -------
     temp : `~astropy.units.Quantity`
@@ -375,63 +931,310 @@ def _goes_chianti_tem(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m, satellite=8
     >>> em  # doctest: +REMOTE_DATA
     <Quantity [4.78577516e+48, 4.78577516e+48] 1 / cm3>
     """
+    temp, em = temperature_em_kernel(longflux.to_value(u.W/u.m**2),
+                                     shortflux.to_value(u.W/u.m**2),
+                                     satellite=satellite, date=date, abundances=abundances,
+                                     download=download, download_dir=download_dir,
+                                     engine=engine)
+    return u.Quantity(temp, u.MK, copy=False), u.Quantity(em, u.cm**-3, copy=False)
+
+
+def _blockwise(*array_args, n_outputs=1):
+    """
+    Make a kernel evaluate dask arrays lazily, block by block.
+
+    If any of the ``array_args`` of a call is a `dask.array.Array`, the
+    kernel is mapped with `dask.array.map_blocks` over the blocks of the
+    array arguments instead of being called, and dask arrays are returned.
+    The other array arguments are chunked like the first dask array, and an
+    `~astropy.time.Time` array is converted to `numpy.datetime64` first.
+    All other arguments are passed unchanged to every block.  The fits to
+    the CHIANTI tables are cached per process, so each dask worker process
+    fits them on its first block and reuses them for the rest.
+
+    A kernel returning ``n_outputs`` arrays returns a tuple of dask arrays.
+    """
+    def decorator(kernel):
+        signature = inspect.signature(kernel)
+
+        @functools.wraps(kernel)
+        def wrapper(*args, **kwargs):
+            # Keep the common call on numpy arrays cheap.
+            if not any(map(_is_dask_array, itertools.chain(args, kwargs.values()))):
+                return kernel(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs).arguments
+            if not any(_is_dask_array(arguments.get(name)) for name in array_args):
+                return kernel(*args, **kwargs)
+            return _map_blocks(kernel, arguments, array_args, n_outputs)
+        return wrapper
+    return decorator
+
+
+def _is_dask_array(value):
+    # Only look dask up if it has been imported, as it is not a dependency.
+    dask_array = sys.modules.get("dask.array")
+    return dask_array is not None and isinstance(value, dask_array.Array)
+
+
+def _map_blocks(kernel, arguments, array_args, n_outputs):
+    """
+    Map ``kernel`` over the blocks of the dask arrays in ``arguments``, see `_blockwise`.
+    """
+    import dask.array as da
+
+    chunks = next(arguments[name].chunks for name in array_args
+                  if _is_dask_array(arguments.get(name)))
+    arrays = {}
+    kwargs = dict(arguments)
+    for name in array_args:
+        value = kwargs.get(name)
+        if np.ndim(value) == 0:
+            continue
+        if isinstance(value, Time):
+            value = _time_datetime64(value)
+        elif not _is_dask_array(value):
+            value = np.asarray(value)
+        arrays[name] = da.asarray(value).rechunk(chunks)
+        del kwargs[name]
+    # Refitting once is enough; the blocks reuse the new fits.
+    for name in ("download", "force_download"):
+        if kwargs.get(name):
+            _CHIANTI_SPLINE_CACHE.invalidate()
+            kwargs[name] = False
+    names = list(arrays)
+
+    def block(*blocks):
+        result = kernel(**dict(zip(names, blocks)), **kwargs)
+        return np.stack(result) if n_outputs > 1 else result
+
+    ndim = len(chunks)
+    if n_outputs == 1:
+        return da.map_blocks(block, *arrays.values(), dtype=float, chunks=chunks,
+                             meta=np.empty((0,) * ndim))
+    result = da.map_blocks(block, *arrays.values(), dtype=float, new_axis=0,
+                           chunks=((n_outputs,),) + chunks, meta=np.empty((0,) * (ndim + 1)))
+    return tuple(result[i] for i in range(n_outputs))
+
+
+@_blockwise("longflux", "shortflux", "satellite", "date", n_outputs=2)
+def temperature_em_kernel(longflux, shortflux, satellite=8, date=None, abundances="coronal",
+                          download=False, download_dir=None, engine="spline",
+                          out_of_range="raise"):
+    """
+    Calculates temperature and emission measure from plain GOES/XRS flux arrays.
+
+    This is the unit-free kernel behind `_goes_chianti_tem`, for use in
+    tight loops over many short arrays where the cost of handling
+    `~astropy.units.Quantity` objects dominates.  See `_goes_chianti_tem`
+    for a description of the parameters and the method.
+
+    Parameters
+    ----------
+    longflux, shortflux : `numpy.ndarray` or `dask.array.Array`
+        Long and short channel fluxes in W/m**2.
+    satellite : int or array of int (optional)
+        GOES satellite number, for all or for each sample.
+        Default=8
+    date : (optional) `astropy.time.Time`, `str` or `None`
+        Date of the observations, for all or for each sample.  Only
+        needed for GOES 6 data, and only parsed if any sample is from
+        GOES 6.  `None` means after the GOES 6 calibration change.
+        Default=None
+    abundances, download, download_dir, engine :
+        See `_goes_chianti_tem`.
+    out_of_range : {'raise' | 'nan'}, optional
+        Whether fluxes outside the lookup tables raise a `ValueError` or
+        give a temperature and emission measure of NaN.  Defaults to 'raise'.
+
+    Returns
+    -------
+    temp : `numpy.ndarray` or `dask.array.Array`
+        Temperature in MK.
+    em : `numpy.ndarray` or `dask.array.Array`
+        Volume emission measure in cm**-3.
+    """
     if not download_dir:
         download_dir = get_and_create_download_dir()
+    longflux_corrected, fluxratio = _goes_correct_fluxes(longflux, shortflux,
+                                                         satellite=satellite, date=date)
+
+    # FIND TEMPERATURE AND EMISSION MEASURE FROM FUNCTIONS BELOW
+    temp = temperature_kernel(fluxratio, satellite=satellite,
+                              abundances=abundances, download=download,
+                              download_dir=download_dir, engine=engine,
+                              out_of_range=out_of_range)
+    em = emission_measure_kernel(longflux_corrected, temp, satellite=satellite,
+                                 abundances=abundances, download=download,
+                                 download_dir=download_dir, engine=engine,
+                                 out_of_range=out_of_range)
+    return temp, em
+
+
+@u.quantity_input
+def temperature_em_uncertainty(longflux: u.W/u.m/u.m, shortflux: u.W/u.m/u.m,
+                               longflux_err: u.W/u.m/u.m, shortflux_err: u.W/u.m/u.m,
+                               satellite=8, date=None, abundances="coronal", n_draws=1000,
+                               percentiles=(16, 50, 84), max_batch=2**20, seed=None,
+                               download=False, download_dir=None, engine="spline"):
+    """
+    Estimates the uncertainty of GOES temperature and emission measure by Monte Carlo.
+
+    ``n_draws`` realizations of the fluxes are drawn from normal
+    distributions with the given standard deviations, and the temperature
+    and emission measure of each are found as in `_goes_chianti_tem`.  The
+    realizations are evaluated in batches of at most ``max_batch`` draws,
+    each holding the draws of a range of samples, so each batch is one call
+    of the cached fits to the CHIANTI tables and memory use does not grow
+    with the length of the series.  Realizations outside the range of the
+    tables are ignored.  The percentiles need all draws of a sample, so
+    besides a batch the temperatures and emission measures of at most
+    ``max(n_draws, max_batch)`` realizations are held at once.
+
+    Parameters
+    ----------
+    longflux, shortflux : `~astropy.units.Quantity`
+        Array containing the observed GOES/XRS long and short channel
+        fluxes.  Units=[W/m**2]
+    longflux_err, shortflux_err : `~astropy.units.Quantity`
+        Standard deviations of the fluxes, for all or for each sample.
+        Units=[W/m**2]
+    satellite, date, abundances, download, download_dir, engine :
+        See `_goes_chianti_tem`.
+    n_draws : `int`, optional
+        Number of realizations of the fluxes.  Default=1000
+    percentiles : sequence of `float`, optional
+        The percentiles of the realizations to return, between 0 and 100.
+        Default=(16, 50, 84), i.e. the median and one sigma bounds.
+    max_batch : `int`, optional
+        The maximum number of realizations evaluated at once.  Default=2**20
+    seed : `int` or `numpy.random.Generator`, optional
+        Seed of the random numbers.  For a given seed and ``max_batch`` the
+        results are reproducible.
+
+    Returns
+    -------
+    temp : `~astropy.units.Quantity`
+        Percentiles of the temperature in MK, one row per percentile.
+    em : `~astropy.units.Quantity`
+        Percentiles of the volume emission measure in cm**-3, one row per
+        percentile.
+
+    Examples
+    --------
+    >>> from astropy.units import Quantity
+    >>> from sunkit_instruments.goes_xrs import temperature_em_uncertainty
+    >>> longflux = Quantity([7e-6, 7e-6], unit="W/m**2")
+    >>> shortflux = Quantity([7e-7, 7e-7], unit="W/m**2")
+    >>> temp, em = temperature_em_uncertainty(longflux, shortflux, 0.05 * longflux,
+    ...                                       0.05 * shortflux, satellite=15,
+    ...                                       seed=1)  # doctest: +REMOTE_DATA
+    >>> temp.shape  # doctest: +REMOTE_DATA
+    (3, 2)
+    """
+    longflux = longflux.to_value(u.W/u.m**2)
+    shortflux = shortflux.to_value(u.W/u.m**2)
+    if longflux.ndim != 1 or longflux.shape != shortflux.shape:
+        raise ValueError("longflux and shortflux must be 1-D and have the same "
+                         "number of elements.")
+    longflux_err = np.broadcast_to(longflux_err.to_value(u.W/u.m**2), longflux.shape)
+    shortflux_err = np.broadcast_to(shortflux_err.to_value(u.W/u.m**2), longflux.shape)
+    satellite = _satellite_numbers(satellite)
+    if np.ndim(date):
+        # Parse the dates once rather than for every batch.
+        date = _datetime64_array(date)
+    percentiles = np.atleast_1d(percentiles)
+    rng = np.random.default_rng(seed)
+
+    temp = np.empty((len(percentiles), len(longflux)))
+    em = np.empty_like(temp)
+    step = max(1, max_batch // n_draws)
+    draw_step = min(n_draws, max_batch)
+    for start in range(0, len(longflux), step):
+        columns = slice(start, start + step)
+        temp_draws = np.empty((n_draws, len(longflux[columns])))
+        em_draws = np.empty_like(temp_draws)
+        # The draws of a sample are split if they do not fit in one batch.
+        for first in range(0, n_draws, draw_step):
+            rows = slice(first, first + draw_step)
+            shape = temp_draws[rows].shape
+            per_sample = [np.broadcast_to(values[columns], shape).ravel() if np.ndim(values)
+                          else values for values in (satellite, date)]
+            temp_batch, em_batch = temperature_em_kernel(
+                rng.normal(longflux[columns], longflux_err[columns], shape).ravel(),
+                rng.normal(shortflux[columns], shortflux_err[columns], shape).ravel(),
+                *per_sample, abundances=abundances, download=download,
+                download_dir=download_dir, engine=engine, out_of_range="nan")
+            # The tables only need to be downloaded once.
+            download = False
+            temp_draws[rows] = temp_batch.reshape(shape)
+            em_draws[rows] = em_batch.reshape(shape)
+        with warnings.catch_warnings():
+            # Samples with no realization in the tables give NaN.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            temp[:, columns] = np.nanpercentile(temp_draws, percentiles, axis=0)
+            em[:, columns] = np.nanpercentile(em_draws, percentiles, axis=0)
+    return u.Quantity(temp, u.MK, copy=False), u.Quantity(em, u.cm**-3, copy=False)
+
+
+@_blockwise("longflux", "shortflux", "satellite", "date", n_outputs=2)
+def _goes_correct_fluxes(longflux, shortflux, satellite=8, date=None):
+    """
+    Prepare GOES/XRS fluxes for use with the CHIANTI lookup tables.
+
+    Applies the satellite and date dependent calibration corrections
+    described in the Notes of `_goes_chianti_tem` to fluxes in W/m**2
+    and returns the corrected long channel flux and the short to long
+    channel flux ratio as arrays.
+    """
     # ENSURE INPUTS ARE OF CORRECT TYPE AND VALID VALUES
-    longflux = longflux.to(u.W/u.m/u.m)
-    shortflux = shortflux.to(u.W/u.m/u.m)
-    satellite = int(satellite)
-    if satellite < 1:
-        raise ValueError("satellite must be the number of a "
-                         "valid GOES satellite (>1).")
-    date = parse_time(date)
+    longflux = np.asarray(longflux, dtype=float)
+    shortflux = np.asarray(shortflux, dtype=float)
+    satellite = _satellite_numbers(satellite)
     # Check flux arrays are of same length.
     if len(longflux) != len(shortflux):
         raise ValueError(
             "longflux and shortflux must have same number of elements.")
+    # satellite and date may be given per sample.
+    for name, values in (("satellite", satellite), ("date", date)):
+        if np.ndim(values) and len(values) != len(longflux):
+            raise ValueError(f"{name} must be a scalar or have the same "
+                             "number of elements as longflux.")
 
     # PREPARE DATA
+    # The corrections are applied as masks so that series spanning a
+    # calibration change or stitched from several satellites are handled
+    # in one pass.  Samples not needing a correction are scaled by 1.
     # GOES 6 long channel flux before 1983-Jun-28 must be corrected by a
     # factor of 4.43/5.32
-    if date < parse_time((1983, 6, 28)) and satellite == 6:
-        longflux_corrected = longflux*(4.43/5.32)
+    goes6_early = False
+    if date is not None and np.any(satellite == 6):
+        goes6_early = np.logical_and(satellite == 6,
+                                     parse_time(date) < parse_time((1983, 6, 28)))
+    if np.any(goes6_early):
+        longflux_corrected = longflux * np.where(goes6_early, 4.43/5.32, 1.)
     else:
         longflux_corrected = longflux
     # Un-scale fluxes if GOES satellite is after 7.  See 2nd paragraph
-    # in Notes section of docstring above.
-    if satellite > 7:
-        longflux_corrected = longflux_corrected / 0.7
-        shortflux_corrected = shortflux / 0.85
+    # in Notes section of _goes_chianti_tem docstring.
+    after_goes7 = satellite > 7
+    if np.any(after_goes7):
+        longflux_corrected = longflux_corrected / np.where(after_goes7, 0.7, 1.)
+        shortflux_corrected = shortflux / np.where(after_goes7, 0.85, 1.)
     else:
         shortflux_corrected = shortflux
     # Calculate short to long channel ratio.
     # Data which is not good have their ratio value set to 0.003.
-    # See Notes section in docstring above.
-    index = np.logical_or(
-        shortflux_corrected < u.Quantity(1e-10, unit="W/m**2"),
-        longflux_corrected < u.Quantity(3e-8, unit="W/m**2"))
+    # See Notes section in _goes_chianti_tem docstring.
+    index = np.logical_or(shortflux_corrected < 1e-10, longflux_corrected < 3e-8)
     fluxratio = shortflux_corrected / longflux_corrected
-    fluxratio.value[index] = u.Quantity(0.003, unit="W/m**2")
+    fluxratio[index] = 0.003
 
-    # FIND TEMPERATURE AND EMISSION MEASURE FROM FUNCTIONS BELOW
-    temp = _goes_get_chianti_temp(fluxratio, satellite=satellite,
-                                  abundances=abundances, download=download,
-                                  download_dir=download_dir)
-    em = _goes_get_chianti_em(longflux_corrected, temp, satellite=satellite,
-                              abundances=abundances, download=download,
-                              download_dir=download_dir)
-    return temp, em
+    return longflux_corrected, fluxratio
 
 
-@manager.require('file_temp_cor',
-                 [urljoin(GOES_REMOTE_PATH, FILE_TEMP_COR)],
-                 '3d8ddaaabf0faf75ba8d15e0c468896ce3d7622cc23076bf91437951e0ab3ad4')
-@manager.require('file_temp_pho',
-                 [urljoin(GOES_REMOTE_PATH, FILE_TEMP_PHO)],
-                 'dd8c6b949a492174146a0b7307dd5fb197236431dbbedfdbab2e3f8dcd360267')
 @u.quantity_input
 def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
-                           download=False, download_dir=None):
+                           download=False, download_dir=None, engine="spline"):
     """
     Calculates temperature from GOES flux ratio.
 
@@ -450,9 +1253,10 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
         Array containing the ratio of short channel to long channel
         GOES/XRS flux measurements.
 
-    satellite : int (optional)
+    satellite : int or array of int (optional)
         Number of GOES satellite used to make observations. Important for
-        correct calibration of data.
+        correct calibration of data.  An array of the same shape as
+        fluxratio gives the satellite of each sample.
         Default=8
 
     abundances : (optional) string equalling 'coronal' or 'photospheric'
@@ -471,6 +1275,13 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
         The directory to download the GOES temperature data file to.
         Default=SunPy default download directory
 
+    engine : (optional) string equalling 'spline' or 'grid'
+        How the fit to the lookup table is evaluated.  'spline' evaluates
+        the spline fit directly; 'grid' interpolates linearly on a dense
+        uniform grid sampled from the spline, which is faster for large
+        arrays.  See Notes.
+        Default='spline'
+
     Returns
     -------
     temp : `~astropy.units.Quantity`
@@ -499,6 +1310,9 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
     For correct preparation of GOES data before calculating temperature
     see _goes_chianti_tem() (Notes section of docstring).
 
+    With engine='grid', log10 of the temperature deviates from the spline
+    fit by at most CHIANTI_GRID_TOLERANCE (1e-6).
+
     References
     ----------
     .. [1] White, S. M., Thomas, R. J., & Schwartz, R. A. 2005,
@@ -516,12 +1330,46 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
     >>> temp  # doctest: +REMOTE_DATA
     <Quantity [12.27557778, 12.27557778] MK>
     """
+    temp = temperature_kernel(fluxratio.to_value(u.one), satellite=satellite,
+                              abundances=abundances, download=download,
+                              download_dir=download_dir, engine=engine)
+    return u.Quantity(temp, unit='MK', copy=False)
+
+
+@_blockwise("fluxratio", "satellite")
+@manager.require('file_temp_cor',
+                 _RemoteTableURLs(FILE_TEMP_COR),
+                 '3d8ddaaabf0faf75ba8d15e0c468896ce3d7622cc23076bf91437951e0ab3ad4')
+@manager.require('file_temp_pho',
+                 _RemoteTableURLs(FILE_TEMP_PHO),
+                 'dd8c6b949a492174146a0b7307dd5fb197236431dbbedfdbab2e3f8dcd360267')
+def temperature_kernel(fluxratio, satellite=8, abundances="coronal",
+                       download=False, download_dir=None, engine="spline", out_of_range="raise"):
+    """
+    Calculates temperature from a plain array of GOES flux ratios.
+
+    This is the unit-free kernel behind `_goes_get_chianti_temp`; see that
+    function for a description of the parameters and the method.
+
+    Parameters
+    ----------
+    fluxratio : `numpy.ndarray` or `dask.array.Array`
+        Ratio of short channel to long channel flux.
+    satellite, abundances, download, download_dir, engine :
+        See `_goes_get_chianti_temp`.
+    out_of_range : {'raise' | 'nan'}, optional
+        Whether flux ratios outside the lookup table raise a `ValueError`
+        or give a temperature of NaN.  Defaults to 'raise'.
+
+    Returns
+    -------
+    temp : `numpy.ndarray` or `dask.array.Array`
+        Temperature in MK.
+    """
     # check inputs are correct
-    fluxratio = fluxratio.decompose()
-    int(satellite)
-    if satellite < 1:
-        raise ValueError("satellite must be the number of a "
-                         "valid GOES satellite (>1).")
+    fluxratio = np.asarray(fluxratio, dtype=float)
+    groups = _satellite_groups(satellite, fluxratio.shape)
+    _check_out_of_range(out_of_range)
     # if abundance input is valid create file suffix, abund, equalling
     # of 'cor' or 'pho'.
     if abundances == "coronal":
@@ -531,52 +1379,38 @@ def _goes_get_chianti_temp(fluxratio: u.one, satellite=8, abundances="coronal",
     else:
         raise ValueError("abundances must be a string equalling "
                          "'coronal' or 'photospheric'.")
-
-    # Initialize lists to hold model data of flux ratio - temperature
-    # relationship read in from csv file
-    modeltemp = []  # modelled temperature is in log_10 space in units of MK
-    modelratio = []
-    # Determine name of column in csv file containing model ratio values
-    # for relevant GOES satellite
-    label = f"ratioGOES{satellite}"
-    # Read data representing appropriate temperature--flux ratio
-    # relationship depending on satellite number and assumed abundances.
-    with open(data_file, "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelratio.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelratio = np.asarray(modelratio)
-
-    # Ensure input values of flux ratio are within limits of model table
-    if np.min(fluxratio) < np.min(modelratio) or \
-       np.max(fluxratio) > np.max(modelratio):
-        raise ValueError(
-            "For GOES {0}, all values in fluxratio input must be within " +
-            "the range {1} - {2}.".format(satellite, np.min(modelratio),
-                                          np.max(modelratio)))
-
-    # Perform spline fit to model data to get temperatures for input
-    # values of flux ratio
-    spline = interpolate.splrep(modelratio, modeltemp, s=0)
-    temp = 10.**interpolate.splev(fluxratio.value, spline, der=0)
-    temp = u.Quantity(temp, unit='MK')
-
+    if download:
+        _CHIANTI_SPLINE_CACHE.invalidate(data_file)
+
+    temp = np.empty(fluxratio.shape)
+    for sat, index in groups:
+        spline = _CHIANTI_SPLINE_CACHE.get((str(data_file), sat, abundances),
+                                           functools.partial(_fit_chianti_temp, data_file, sat))
+        ratio = fluxratio[index]
+
+        # Ensure input values of flux ratio are within limits of model table
+        if out_of_range == "raise" and (np.min(ratio) < spline.x_min or
+                                        np.max(ratio) > spline.x_max):
+            raise ValueError(
+                "For GOES {0}, all values in fluxratio input must be within "
+                "the range {1} - {2}.".format(sat, spline.x_min, spline.x_max))
+
+        # Evaluate spline fit to model data to get temperatures for input
+        # values of flux ratio
+        if out_of_range == "nan":
+            temp_sat = np.full(ratio.shape, np.nan)
+            inside = (ratio >= spline.x_min) & (ratio <= spline.x_max)
+            temp_sat[inside] = 10.**spline(ratio[inside], engine=engine)
+            temp[index] = temp_sat
+        else:
+            temp[index] = 10.**spline(ratio, engine=engine)
     return temp
 
 
-@manager.require('file_em_cor',
-                 [urljoin(GOES_REMOTE_PATH, FILE_EM_COR)],
-                 'a7440e20cbcb74e87db528e8e9d47cd69fbbd8f56ddc92cf4e854a66fb2a6172')
-@manager.require('file_em_pho',
-                 [urljoin(GOES_REMOTE_PATH, FILE_EM_PHO)],
-                 '0d59042b265bf76351d129b3e2a5844b3a9c96943cb246538013fd8c1b9b71b9')
 @u.quantity_input
 def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
                          abundances="coronal", download=False,
-                         download_dir=None):
+                         download_dir=None, engine="spline"):
     """
     Calculates emission measure from GOES 1-8A flux and temperature.
 
@@ -599,9 +1433,10 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
     temp : `~astropy.units.Quantity`
         Array containing the GOES temperature.  Units=[MK]
 
-    satellite : int (optional)
+    satellite : int or array of int (optional)
         Number of GOES satellite used to make observations.
-        Important for correct calibration of data.
+        Important for correct calibration of data.  An array of the same
+        shape as longflux gives the satellite of each sample.
         Default=8
 
     abundances : (optional) {'coronal' | 'photospheric'}
@@ -620,6 +1455,11 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
         The directory to download the GOES emission measure data file to.
         Default=SunPy default download directory
 
+    engine : (optional) {'spline' | 'grid'}
+        How the fit to the lookup table is evaluated.  See
+        _goes_get_chianti_temp().
+        Default='spline'
+
     Returns
     -------
     em : `~astropy.units.Quantity`
@@ -651,6 +1491,10 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
     For correct preparation of GOES data before calculating temperature
     see _goes_chianti_tem() (Notes section of docstring).
 
+    With engine='grid', the emission measure deviates from the spline fit
+    by a relative error of at most CHIANTI_GRID_TOLERANCE (1e-6) for a
+    given temperature.
+
     References
     ----------
     .. [1] White, S. M., Thomas, R. J., & Schwartz, R. A. 2005,
@@ -669,16 +1513,54 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
     >>> em  # doctest: +REMOTE_DATA
     <Quantity [3.45200672e+48, 3.45200672e+48] 1 / cm3>
     """
+    em = emission_measure_kernel(longflux.to_value(u.W/u.m**2), temp.to_value(u.MK),
+                                 satellite=satellite, abundances=abundances,
+                                 download=download, download_dir=download_dir,
+                                 engine=engine)
+    return u.Quantity(em, unit='cm**(-3)', copy=False)
+
+
+@_blockwise("longflux", "temp", "satellite")
+@manager.require('file_em_cor',
+                 _RemoteTableURLs(FILE_EM_COR),
+                 'a7440e20cbcb74e87db528e8e9d47cd69fbbd8f56ddc92cf4e854a66fb2a6172')
+@manager.require('file_em_pho',
+                 _RemoteTableURLs(FILE_EM_PHO),
+                 '0d59042b265bf76351d129b3e2a5844b3a9c96943cb246538013fd8c1b9b71b9')
+def emission_measure_kernel(longflux, temp, satellite=8, abundances="coronal",
+                            download=False, download_dir=None, engine="spline",
+                            out_of_range="raise"):
+    """
+    Calculates emission measure from plain arrays of GOES 1-8A flux and temperature.
+
+    This is the unit-free kernel behind `_goes_get_chianti_em`; see that
+    function for a description of the parameters and the method.
+
+    Parameters
+    ----------
+    longflux : `numpy.ndarray` or `dask.array.Array`
+        Long channel flux in W/m**2.
+    temp : `numpy.ndarray` or `dask.array.Array`
+        Temperature in MK.
+    satellite, abundances, download, download_dir, engine :
+        See `_goes_get_chianti_em`.
+    out_of_range : {'raise' | 'nan'}, optional
+        Whether temperatures outside the lookup table, or NaN, raise a
+        `ValueError` or give an emission measure of NaN.  Defaults to 'raise'.
+
+    Returns
+    -------
+    em : `numpy.ndarray` or `dask.array.Array`
+        Volume emission measure in cm**-3.
+    """
     # Check inputs are of correct type
-    longflux = longflux.to(u.W/u.m**2)
-    temp = temp.to(u.MK)
+    longflux = np.asarray(longflux, dtype=float)
+    temp = np.asarray(temp, dtype=float)
     # Ignore zero values raising a numpy warning here
     with np.errstate(invalid='ignore'):
-        log10_temp = np.log10(temp.value)
-    int(satellite)
-    if satellite < 1:
-        raise ValueError("satellite must be the number of a "
-                         "valid GOES satellite (>1).")
+        log10_temp = np.log10(temp)
+    groups = _satellite_groups(satellite, longflux.shape)
+    _check_out_of_range(out_of_range)
     # if abundance input is valid create file suffix, abund, equalling
     # of 'cor' or 'pho'.
     if abundances == "coronal":
@@ -692,75 +1574,220 @@ def _goes_get_chianti_em(longflux: u.W/u.m/u.m, temp: u.MK, satellite=8,
     if len(longflux) != len(temp):
         raise ValueError("longflux and temp must have same number of "
                          "elements.")
-
-    # Initialize lists to hold model data of temperature - long channel
-    # flux relationship read in from csv file.
-    modeltemp = []   # modelled temperature is in log_10 space in units of MK
-    modelflux = []
-    # Determine name of column in csv file containing model ratio values
-    # for relevant GOES satellite
-    label = f"longfluxGOES{satellite}"
-
-    # Read data representing appropriate temperature--long flux
-    # relationship depending on satellite number and assumed abundances.
-    with open(data_file, "r") as csvfile:
-        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
-        csvreader = csv.DictReader(startline, delimiter=";")
-        for row in csvreader:
-            modeltemp.append(float(row["log10temp_MK"]))
-            modelflux.append(float(row[label]))
-    modeltemp = np.asarray(modeltemp)
-    modelflux = np.asarray(modelflux)
-
-    # Ensure input values of flux ratio are within limits of model table
-    if np.min(log10_temp) < np.min(modeltemp) or \
-       np.max(log10_temp) > np.max(modeltemp) or \
-       np.isnan(np.min(log10_temp)):
-        raise ValueError("All values in temp must be within the range "
-                         "{} - {} MK.".format(np.min(10**modeltemp),
-                                              np.max(10**modeltemp)))
-
-    # Perform spline fit to model data
-    spline = interpolate.splrep(modeltemp, modelflux, s=0)
-    denom = interpolate.splev(log10_temp, spline, der=0)
-    em = longflux.value/denom * 1e55
-    em = u.Quantity(em, unit='cm**(-3)')
-
+    if download:
+        _CHIANTI_SPLINE_CACHE.invalidate(data_file)
+
+    em = np.empty(longflux.shape)
+    for sat, index in groups:
+        spline = _CHIANTI_SPLINE_CACHE.get((str(data_file), sat, abundances),
+                                           functools.partial(_fit_chianti_em, data_file, sat))
+        log10_temp_sat = log10_temp[index]
+
+        # Ensure input values of flux ratio are within limits of model table
+        if out_of_range == "raise" and (np.min(log10_temp_sat) < spline.x_min or
+                                        np.max(log10_temp_sat) > spline.x_max or
+                                        np.isnan(np.min(log10_temp_sat))):
+            raise ValueError("All values in temp must be within the range "
+                             "{} - {} MK.".format(10**spline.x_min, 10**spline.x_max))
+
+        # Evaluate spline fit to model data
+        if out_of_range == "nan":
+            # NaN temperatures fail both comparisons
+            inside = (log10_temp_sat >= spline.x_min) & (log10_temp_sat <= spline.x_max)
+            em_sat = np.full(log10_temp_sat.shape, np.nan)
+            em_sat[inside] = (longflux[index][inside] /
+                              spline(log10_temp_sat[inside], engine=engine) * 1e55)
+            em[index] = em_sat
+        else:
+            denom = spline(log10_temp_sat, engine=engine)
+            em[index] = longflux[index]/denom * 1e55
     return em
 
 
-def calculate_radiative_loss_rate(goests, force_download=False,
-                                  download_dir=None):
+@u.quantity_input
+def synthetic_fluxes(temp: u.MK, em: u.cm**-3, satellite=8, date=None, abundances="coronal",
+                     download=False, download_dir=None, engine="spline"):
     """
-    Calculates radiative loss rate from GOES observations.
-
-    This function calculates the radiative loss rate as a function of
-    time of solar soft X-ray-emitting plasma across all wavelengths given a
-    LightCurve object containing GOES data.  The radiative loss rate is
-    determined from the GOES isothermal temperature and volume emission
-    measure as a function of time, as calculated by
-    `~calculate_temperature_em()`.  See docstring of that function for more
-    details.  If the LightCurve object does not contain the temperatures and
-    emission measures, but only contain the GOES fluxes, then the temperature
-    and emission measures are calculated using calculate_temperature_em().
-    The unit of the resulting radiative loss rates is W.  Once
-    the radiative loss rates have been found, they are returned as part of a
-    new LightCurve object also containing the metadata, GOES fluxes and
-    corresponding temperatures and emission measures of the input LightCurve
-    object.
+    Calculates the GOES/XRS fluxes of an isothermal plasma.
+
+    This is the inverse of `_goes_chianti_tem`: it gives the long and short
+    channel fluxes which a GOES satellite would observe from plasma of the
+    given temperature and volume emission measure, using the same CHIANTI
+    lookup tables as `_goes_get_chianti_temp` and `_goes_get_chianti_em`.
+    The long channel flux is the emission measure times the tabulated flux
+    per 10^55 cm**-3 at the temperature, and the short channel flux the
+    long channel flux times the tabulated flux ratio.  The calibration
+    corrections described in the Notes of `_goes_chianti_tem` are then
+    undone, so that the fluxes are those found in the GOES data files.
 
     Parameters
     ----------
-    goests : `~sunpy.timeseries.sources.XRSTimeSeries`
-        TimeSeries object containing GOES data.  The units of these
-        data MUST be W/m^2 (flux), MK (temperature) and cm^-3
-        (emission measure).  If LightCurve object does not contain
-        temperature and emission measure values, they are calculated from
-        the flux values using calculate_temperature_em().
+    temp : `~astropy.units.Quantity`
+        Array of temperatures.  Units=[MK]
+    em : `~astropy.units.Quantity`
+        Array of volume emission measures.  Units=[cm**-3]
+    satellite : int or array of int (optional)
+        GOES satellite number, for all or for each sample.
+        Default=8
+    date : (optional) `astropy.time.Time`, `str` or `None`
+        Date of the observations, for all or for each sample.  Only
+        needed for GOES 6 data.  `None` means after the GOES 6
+        calibration change.
+        Default=None
+    abundances, download, download_dir :
+        See `_goes_chianti_tem`.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated.  The 'grid'
+        engine is several times faster for large arrays, e.g. for
+        generating many synthetic samples.  See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
 
-    force_download : (optional) `bool`
-        If True, the GOES radiative loss data file is downloaded even if
-        already locally stored. It is important to do this if a new version
+    Returns
+    -------
+    longflux : `~astropy.units.Quantity`
+        Array of 1-8 angstrom fluxes.  Units=[W/m**2]
+    shortflux : `~astropy.units.Quantity`
+        Array of 0.5-4 angstrom fluxes.  Units=[W/m**2]
+
+    Examples
+    --------
+    >>> from astropy.units import Quantity
+    >>> from sunkit_instruments.goes_xrs import synthetic_fluxes
+    >>> longflux, shortflux = synthetic_fluxes(Quantity([11.0], "MK"),
+    ...                                        Quantity([4e48], "cm**-3"),
+    ...                                        satellite=15)  # doctest: +REMOTE_DATA
+    """
+    longflux, shortflux = synthetic_fluxes_kernel(
+        temp.to_value(u.MK), em.to_value(u.cm**-3), satellite=satellite, date=date,
+        abundances=abundances, download=download, download_dir=download_dir, engine=engine)
+    return (u.Quantity(longflux, u.W/u.m**2, copy=False),
+            u.Quantity(shortflux, u.W/u.m**2, copy=False))
+
+
+@_blockwise("temp", "em", "satellite", "date", n_outputs=2)
+@manager.require('file_temp_cor',
+                 _RemoteTableURLs(FILE_TEMP_COR),
+                 '3d8ddaaabf0faf75ba8d15e0c468896ce3d7622cc23076bf91437951e0ab3ad4')
+@manager.require('file_temp_pho',
+                 _RemoteTableURLs(FILE_TEMP_PHO),
+                 'dd8c6b949a492174146a0b7307dd5fb197236431dbbedfdbab2e3f8dcd360267')
+@manager.require('file_em_cor',
+                 _RemoteTableURLs(FILE_EM_COR),
+                 'a7440e20cbcb74e87db528e8e9d47cd69fbbd8f56ddc92cf4e854a66fb2a6172')
+@manager.require('file_em_pho',
+                 _RemoteTableURLs(FILE_EM_PHO),
+                 '0d59042b265bf76351d129b3e2a5844b3a9c96943cb246538013fd8c1b9b71b9')
+def synthetic_fluxes_kernel(temp, em, satellite=8, date=None, abundances="coronal",
+                            download=False, download_dir=None, engine="spline",
+                            out_of_range="raise"):
+    """
+    Calculates GOES/XRS fluxes from plain arrays of temperature and emission measure.
+
+    This is the unit-free kernel behind `synthetic_fluxes`; see that
+    function for a description of the parameters and the method.
+
+    Parameters
+    ----------
+    temp : `numpy.ndarray` or `dask.array.Array`
+        Temperature in MK.
+    em : `numpy.ndarray` or `dask.array.Array`
+        Volume emission measure in cm**-3.
+    satellite, date, abundances, download, download_dir, engine :
+        See `synthetic_fluxes`.
+    out_of_range : {'raise' | 'nan'}, optional
+        Whether temperatures outside the lookup tables raise a `ValueError`
+        or give fluxes of NaN.  Defaults to 'raise'.
+
+    Returns
+    -------
+    longflux, shortflux : `numpy.ndarray` or `dask.array.Array`
+        Long and short channel fluxes in W/m**2.
+    """
+    temp = np.asarray(temp, dtype=float)
+    em = np.asarray(em, dtype=float)
+    if temp.ndim != 1 or temp.shape != em.shape:
+        raise ValueError("temp and em must be 1-D and have the same number of elements.")
+    groups = _satellite_groups(satellite, temp.shape)
+    _check_out_of_range(out_of_range)
+    if abundances == "coronal":
+        temp_file, em_file = manager.get('file_temp_cor'), manager.get('file_em_cor')
+    elif abundances == "photospheric":
+        temp_file, em_file = manager.get('file_temp_pho'), manager.get('file_em_pho')
+    else:
+        raise ValueError("abundances must be a string equalling "
+                         "'coronal' or 'photospheric'.")
+    if download:
+        _CHIANTI_SPLINE_CACHE.invalidate(temp_file)
+        _CHIANTI_SPLINE_CACHE.invalidate(em_file)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        log10_temp = np.log10(temp)
+
+    longflux = np.empty(temp.shape)
+    shortflux = np.empty(temp.shape)
+    for sat, index in groups:
+        # The flux fit is shared with emission_measure_kernel.
+        flux_spline = _CHIANTI_SPLINE_CACHE.get(
+            (str(em_file), sat, abundances), functools.partial(_fit_chianti_em, em_file, sat))
+        ratio_spline = _CHIANTI_SPLINE_CACHE.get(
+            (str(temp_file), sat, abundances, "ratio"),
+            functools.partial(_fit_chianti_ratio, temp_file, sat))
+        log10_temp_sat = log10_temp[index]
+        # NaN temperatures fail both comparisons
+        inside = ((log10_temp_sat >= max(flux_spline.x_min, ratio_spline.x_min)) &
+                  (log10_temp_sat <= min(flux_spline.x_max, ratio_spline.x_max)))
+        if out_of_range == "raise" and not np.all(inside):
+            raise ValueError("For GOES {0}, all values in temp must be within the range "
+                             "{1} - {2} MK.".format(sat, 10**flux_spline.x_min,
+                                                    10**flux_spline.x_max))
+        longflux[index] = em[index] * 1e-55 * flux_spline(log10_temp_sat, engine=engine)
+        shortflux[index] = longflux[index] * ratio_spline(log10_temp_sat, engine=engine)
+        if out_of_range == "nan":
+            longflux[index] = np.where(inside, longflux[index], np.nan)
+            shortflux[index] = np.where(inside, shortflux[index], np.nan)
+
+    # Undo the calibration corrections, which are factors depending only on
+    # the satellite and date, by finding them for unit fluxes.
+    size = max(np.size(satellite), np.size(date) if date is not None else 1)
+    ones = np.ones(size if size > 1 else 1)
+    longfactor, ratiofactor = _goes_correct_fluxes(ones, ones, satellite=satellite, date=date)
+    longflux /= longfactor
+    shortflux /= longfactor * ratiofactor
+    return longflux, shortflux
+
+
+def calculate_radiative_loss_rate(goests, force_download=False,
+                                  download_dir=None, derived_only=False, engine="spline"):
+    """
+    Calculates radiative loss rate from GOES observations.
+
+    This function calculates the radiative loss rate as a function of
+    time of solar soft X-ray-emitting plasma across all wavelengths given a
+    LightCurve object containing GOES data.  The radiative loss rate is
+    determined from the GOES isothermal temperature and volume emission
+    measure as a function of time, as calculated by
+    `~calculate_temperature_em()`.  See docstring of that function for more
+    details.  If the LightCurve object does not contain the temperatures and
+    emission measures, but only contain the GOES fluxes, then the temperature
+    and emission measures are calculated using calculate_temperature_em().
+    The unit of the resulting radiative loss rates is W.  Once
+    the radiative loss rates have been found, they are returned as part of a
+    new LightCurve object also containing the metadata, GOES fluxes and
+    corresponding temperatures and emission measures of the input LightCurve
+    object.
+
+    Parameters
+    ----------
+    goests : `~sunpy.timeseries.sources.XRSTimeSeries`
+        TimeSeries object containing GOES data.  The units of these
+        data MUST be W/m^2 (flux), MK (temperature) and cm^-3
+        (emission measure).  If LightCurve object does not contain
+        temperature and emission measure values, they are calculated from
+        the flux values using calculate_temperature_em().
+
+    force_download : (optional) `bool`
+        If True, the GOES radiative loss data file is downloaded even if
+        already locally stored. It is important to do this if a new version
         of the file has been generated due to a new CHIANTI version being
         released or the launch of new GOES satellites.
         Default=False
@@ -769,6 +1796,17 @@ def calculate_radiative_loss_rate(goests, force_download=False,
         The directory to download the GOES radiative loss data file to.
         Default=SunPy default download directory
 
+    derived_only : (optional) `bool`
+        If True, only the columns that would be added to the input are
+        returned, as a `~pandas.DataFrame` sharing the time index of
+        goests.  The flux data are not copied.
+        Default=False
+
+    engine : (optional) {'spline' | 'grid'}
+        How the fits to the CHIANTI lookup tables are evaluated.  See
+        `~calculate_temperature_em()`.
+        Default='spline'
+
     Returns
     -------
     ts_new : `~sunpy.timeseries.sources.XRSTimeSeries`
@@ -780,6 +1818,10 @@ def calculate_radiative_loss_rate(goests, force_download=False,
         | ts_new.to_dataframe().rad_loss_rate - radiative loss rate of the coronal soft
           X-ray-emitting plasma across all wavelengths [W]
 
+        If derived_only is True, a `~pandas.DataFrame` holding only
+        rad_loss_rate, and temperature and em if they were not in the input,
+        is returned instead.
+
     Notes
     -----
     The GOES radiative loss rates are calculated using a csv file containing
@@ -837,36 +1879,30 @@ def calculate_radiative_loss_rate(goests, force_download=False,
     # extract temperature and emission measure from GOESLightCurve
     # object and change type to that required by _calc_rad_loss().
     # If LightCurve object does not contain temperature and
-    # emission measure, calculate using calculate_temperature_em()
+    # emission measure, calculate them as calculate_temperature_em() does.
+    derived = {}
     if 'temperature' in goests.columns and 'em' in goests.columns:
-        # Use copy.deepcopy for replicating meta and data so that input
-        # lightcurve is not altered.
-        ts_new = timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta),
-                                          data=copy.deepcopy(goests.to_dataframe()),
-                                          units=copy.deepcopy(goests.units))
+        temp = u.Quantity(np.asarray(goests.to_dataframe().temperature, dtype=np.float64),
+                          unit=u.MK)
+        em = u.Quantity(np.asarray(goests.to_dataframe().em, dtype=np.float64),
+                        unit=u.cm**(-3))
     else:
-        ts_new = calculate_temperature_em(goests)
-    temp = u.Quantity(np.asarray(ts_new.to_dataframe().temperature, dtype=np.float64),
-                      unit=u.MK)
-    em = u.Quantity(np.asarray(ts_new.to_dataframe().em, dtype=np.float64),
-                    unit=u.cm**(-3))
+        temp, em = _goests_temperature_em(goests, engine=engine)
+        derived["temperature"] = temp
+        derived["em"] = em
 
     # Find radiative loss rate with _calc_rad_loss()
     rad_loss_out = _calc_rad_loss(temp, em, force_download=force_download,
-                                  download_dir=download_dir)
+                                  download_dir=download_dir, engine=engine)
+    derived["rad_loss_rate"] = rad_loss_out['rad_loss_rate'].to("W")
 
     # Enter results into new version of GOES LightCurve Object
-    ts_new = ts_new.add_column("rad_loss_rate", rad_loss_out['rad_loss_rate'].to("W"))
+    return _add_derived_columns(goests, derived, derived_only)
 
-    return ts_new
 
-
-@manager.require('file_rad_cor',
-                 [urljoin(GOES_REMOTE_PATH, FILE_RAD_COR)],
-                 'b56dccaa1035da46baa1a9251c4840107750d869de101d1811b506ceaec5828e')
 @u.quantity_input
 def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
-                   download_dir=None):
+                   download_dir=None, engine="spline"):
     """
     Finds radiative loss rate of coronal plasma over all wavelengths.
 
@@ -901,6 +1937,12 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
     download_dir : (optional) str
         The directory to download the GOES radiative loss data file to.
         Default=SunPy default download directory
+    engine : (optional) str equalling 'spline' or 'grid'
+        How the fit to the lookup table is evaluated.  With 'grid' the
+        radiative loss rate deviates from the spline fit by a relative
+        error of at most CHIANTI_GRID_TOLERANCE (1e-6).  See
+        _goes_get_chianti_temp().
+        Default='spline'
 
     Returns
     -------
@@ -942,40 +1984,10 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
     >>> rad_loss["rad_loss_rate"]  # doctest: +REMOTE_DATA
     <Quantity [3.01851392e+19, 3.01851392e+19] J / s>
     """
-    if not download_dir:
-        download_dir = get_and_create_download_dir()
-    # Check inputs are correct
-    temp = temp.to(u.K)
-    em = em.to(1/u.cm**3)
-    if len(temp) != len(em):
-        raise ValueError("temp and em must all have same number of elements.")
-
-    # Initialize lists to hold model data of temperature - rad loss rate
-    # relationship read in from csv file
-    modeltemp = []    # modelled temperature is in log_10 space in units of MK
-    model_loss_rate = []
-
-    # Read data from csv file into lists, being sure to skip commented
-    # lines beginning with "#"
-    with open(manager.get('file_rad_cor'), "r") as csvfile:
-        startline = csvfile.readlines()[7:]
-        csvreader = csv.reader(startline, delimiter=" ")
-        for row in csvreader:
-            modeltemp.append(float(row[0]))
-            model_loss_rate.append(float(row[1]))
-    modeltemp = np.asarray(modeltemp)
-    model_loss_rate = np.asarray(model_loss_rate)
-    # Ensure input values of flux ratio are within limits of model table
-    if temp.value.min() < modeltemp.min() or temp.value.max() > modeltemp.max():
-        raise ValueError("All values in temp must be within the range " +
-                         "{} - {} MK.".format(np.min(modeltemp/1e6),
-                                              np.max(modeltemp/1e6)))
-    # Perform spline fit to model data to get temperatures for input
-    # values of flux ratio
-    spline = interpolate.splrep(modeltemp, model_loss_rate, s=0)
-    rad_loss = em.value * interpolate.splev(temp.value, spline, der=0)
-    rad_loss = u.Quantity(rad_loss, unit='erg/s')
-    rad_loss = rad_loss.to(u.J/u.s)
+    rad_loss = radiative_loss_rate_kernel(temp.to_value(u.MK), em.to_value(u.cm**-3),
+                                          force_download=force_download,
+                                          download_dir=download_dir, engine=engine)
+    rad_loss = u.Quantity(rad_loss, unit=u.J/u.s, copy=False)
 
     # If obstime keyword giving measurement times is set, calculate
     # radiative losses integrated over time.
@@ -987,13 +1999,9 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
             raise OSError("obstime must have same number of elements as "
                           "temp and em.")
 
-        obstime = parse_time(obstime)
-
-        # Check elements in obstime in chronological order
-        _assert_chrono_order(obstime)
-        # Next, get measurement times in seconds from time of first
-        # measurement.
-        obstime_seconds = (obstime - obstime[0]).sec
+        # Get measurement times in seconds from time of first measurement,
+        # checking they are in chronological order.
+        obstime_seconds = _obstime_seconds(obstime)
         # Finally, integrate using trapezoid rule
         rad_loss_int = trapz(rad_loss.value, obstime_seconds)
         rad_loss_int = u.Quantity(rad_loss_int, unit=rad_loss.unit*u.s)
@@ -1011,7 +2019,61 @@ def _calc_rad_loss(temp: u.MK, em: u.cm**-3, obstime=None, force_download=False,
     return rad_loss_out
 
 
-def calculate_xray_luminosity(goests):
+@_blockwise("temp", "em")
+@manager.require('file_rad_cor',
+                 _RemoteTableURLs(FILE_RAD_COR),
+                 'b56dccaa1035da46baa1a9251c4840107750d869de101d1811b506ceaec5828e')
+def radiative_loss_rate_kernel(temp, em, force_download=False, download_dir=None,
+                               engine="spline"):
+    """
+    Finds radiative loss rate from plain arrays of temperature and emission measure.
+
+    This is the unit-free kernel behind `_calc_rad_loss`; see that function
+    for a description of the parameters and the method.
+
+    Parameters
+    ----------
+    temp : `numpy.ndarray` or `dask.array.Array`
+        Temperature in MK.
+    em : `numpy.ndarray` or `dask.array.Array`
+        Volume emission measure in cm**-3.
+    force_download, download_dir, engine :
+        See `_calc_rad_loss`.
+
+    Returns
+    -------
+    rad_loss : `numpy.ndarray` or `dask.array.Array`
+        Radiative loss rate in W.
+    """
+    if not download_dir:
+        download_dir = get_and_create_download_dir()
+    # Check inputs are correct.  The table is in units of K and erg/s.
+    temp = np.asarray(temp, dtype=float) * u.MK.to(u.K)
+    em = np.asarray(em, dtype=float)
+    if len(temp) != len(em):
+        raise ValueError("temp and em must all have same number of elements.")
+
+    data_file = manager.get('file_rad_cor')
+    if force_download:
+        _CHIANTI_SPLINE_CACHE.invalidate(data_file)
+
+    def fit():
+        # modelled temperature is in units of K
+        _, (modeltemp, model_loss_rate) = _chianti_table(data_file, _parse_chianti_rad_loss)
+        return _ChiantiSpline(modeltemp, model_loss_rate, log_x=True)
+
+    spline = _CHIANTI_SPLINE_CACHE.get((str(data_file), None, "coronal"), fit)
+    # Ensure input values of flux ratio are within limits of model table
+    if temp.min() < spline.x_min or temp.max() > spline.x_max:
+        raise ValueError("All values in temp must be within the range " +
+                         "{} - {} MK.".format(spline.x_min/1e6, spline.x_max/1e6))
+    # Evaluate spline fit to model data to get radiative loss rates for
+    # input values of temperature
+    rad_loss = em * spline(temp, engine=engine)
+    return rad_loss * u.erg.to(u.J)
+
+
+def calculate_xray_luminosity(goests, derived_only=False):
     """
     Calculates GOES solar X-ray luminosity.
 
@@ -1020,15 +2082,20 @@ def calculate_xray_luminosity(goests):
     observed GOES fluxes.  The units of the results are W.  The calculation
     is made by simply assuming that the radiation is emitted isotropically,
     i.e. is distributed over a spherical surface area with a radius equal to
-    the Sun-Earth distance.  Once the luminosity in each GOES passband is
-    found, they are returned in a new LightCurve object also containing the
-    metadata and data of the input LightCurve object.
+    the Sun-Earth distance at the time of each sample.  Once the luminosity
+    in each GOES passband is found, they are returned in a new LightCurve
+    object also containing the metadata and data of the input LightCurve
+    object.
 
     Parameters
     ----------
     goests : `~sunpy.timeseries.sources.XRSTimeSeries`
         LightCurve object containing GOES flux data which MUST
         be in units of W/m^2.
+    derived_only : `bool`, optional
+        If `True`, only the luminosities are returned, as a `~pandas.DataFrame`
+        sharing the time index of goests.  The flux data are not copied.
+        Defaults to `False`.
 
     Returns
     -------
@@ -1041,6 +2108,9 @@ def calculate_xray_luminosity(goests):
         - ts_new.to_dataframe().luminosity_xrsb - Xray luminosity in 1-8A channel
           unit=[W]
 
+        If derived_only is `True`, a `~pandas.DataFrame` holding only these
+        two columns is returned instead.
+
     Examples
     --------
     >>> import sunpy.timeseries as ts
@@ -1077,19 +2147,712 @@ def calculate_xray_luminosity(goests):
     if not isinstance(goests, timeseries.XRSTimeSeries):
         raise TypeError("goeslc must be a XRSTimeSeries object.")
     # Find temperature and emission measure with _goes_chianti_tem
-    lx_out = _goes_lx(goests.quantity("xrsb"),
-                      goests.quantity("xrsa"),
-                      date=str(goests.to_dataframe().index[0]))
+    lx_out = _goes_lx(_goests_quantity(goests, "xrsb"),
+                      _goests_quantity(goests, "xrsa"),
+                      date=goests.to_dataframe().index)
     # Enter results into new version of GOES LightCurve Object
-    # Use copy.deepcopy for replicating meta and data so that input
-    # lightcurve is not altered.
-    ts_new = timeseries.XRSTimeSeries(meta=copy.deepcopy(goests.meta),
-                                      data=copy.deepcopy(goests.to_dataframe()),
-                                      units=copy.deepcopy(goests.units))
-    ts_new = ts_new.add_column("luminosity_xrsa", lx_out["shortlum"].to("W"))
-    ts_new = ts_new.add_column("luminosity_xrsb", lx_out["longlum"].to("W"))
+    return _add_derived_columns(goests, {"luminosity_xrsa": lx_out["shortlum"].to("W"),
+                                         "luminosity_xrsb": lx_out["longlum"].to("W")},
+                                derived_only)
+
+
+THERMODYNAMIC_QUANTITIES = ("temperature", "em", "rad_loss_rate", "luminosity")
+
+
+def calculate_thermodynamics(goests, quantities=THERMODYNAMIC_QUANTITIES,
+                             abundances="coronal", download=False, download_dir=None,
+                             derived_only=False, engine="spline"):
+    """
+    Calculates any of the GOES derived quantities in a single call.
+
+    This combines `~sunkit_instruments.goes_xrs.calculate_temperature_em`,
+    `~sunkit_instruments.goes_xrs.calculate_radiative_loss_rate` and
+    `~sunkit_instruments.goes_xrs.calculate_xray_luminosity`. The fluxes are
+    extracted, corrected and converted to a flux ratio once, and the
+    temperature and emission measure are found once and reused for the
+    radiative loss rate. Only the requested quantities, and those they
+    depend on, are calculated.
+
+    Parameters
+    ----------
+    goests : `~sunpy.timeseries.sources.XRSTimeSeries`
+        The TimeSeries containing GOES flux data which **MUST**
+        be in units of "W/m^2".
+    quantities : iterable of `str`, optional
+        The quantities to calculate, any of ``"temperature"``, ``"em"``,
+        ``"rad_loss_rate"`` and ``"luminosity"``. Defaults to all of them.
+    abundances : {'coronal' | 'photospheric'}, optional
+        States whether "photospheric" or "coronal" abundances should be
+        assumed for the temperature and emission measure, default to 'coronal'.
+    download : `bool`, optional
+        If `True`, the GOES data files are downloaded.
+        Defaults to `False`.
+    download_dir : `str`, optional
+        The directory to download the GOES data files to, defaults to the
+        default download directory.
+    derived_only : `bool`, optional
+        If `True`, only the calculated quantities are returned, as a
+        `~pandas.DataFrame` sharing the time index of ``goests``.
+        Defaults to `False`.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
+
+    Returns
+    -------
+    `~sunpy.timeseries.sources.XRSTimeSeries`
+        Contains same metadata and data as input timeseries with the
+        following additional data columns, depending on ``quantities``:
+
+        | ts_new.to_dataframe().temperature - Array of temperatures [MK]
+        | ts_new.to_dataframe().em - Array of volume emission measures [cm**-3]
+        | ts_new.to_dataframe().rad_loss_rate - radiative loss rate of the coronal soft
+          X-ray-emitting plasma across all wavelengths [W]
+        | ts_new.to_dataframe().luminosity_xrsa - Xray luminosity in 0.5-4A channel [W]
+        | ts_new.to_dataframe().luminosity_xrsb - Xray luminosity in 1-8A channel [W]
+
+        If ``derived_only`` is `True`, a `~pandas.DataFrame` holding only
+        these columns is returned instead.
+
+    Examples
+    --------
+    >>> import sunpy.timeseries as ts
+    >>> from sunkit_instruments.goes_xrs import calculate_thermodynamics
+    >>> from sunpy.data.sample import GOES_XRS_TIMESERIES  # doctest: +REMOTE_DATA
+    >>> goests = ts.TimeSeries(GOES_XRS_TIMESERIES)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
+    >>> calculate_thermodynamics(goests, ["temperature", "rad_loss_rate"],
+    ...                          derived_only=True)[0:3]  # doctest: +REMOTE_DATA
+                                   temperature  rad_loss_rate
+    2011-06-06 23:59:59.961999893     3.503510   1.781001e+19
+    2011-06-07 00:00:02.008999944     3.534262   1.660031e+19
+    2011-06-07 00:00:04.058999896     3.518700   1.719931e+19
+    """
+    # Check that input argument is of correct type
+    if not isinstance(goests, timeseries.XRSTimeSeries):
+        raise TypeError("goests must be a XRSTimeSeries object")
+    quantities = set(quantities)
+    if not quantities.issubset(THERMODYNAMIC_QUANTITIES):
+        raise ValueError("quantities must be any of {}.".format(
+            ", ".join(repr(q) for q in THERMODYNAMIC_QUANTITIES)))
+    if not download_dir:
+        download_dir = get_and_create_download_dir()
+
+    longflux = _goests_quantity(goests, "xrsb").to_value(u.W/u.m**2)
+    shortflux = _goests_quantity(goests, "xrsa").to_value(u.W/u.m**2)
+    satellite = int(goests.meta.metas[0]["TELESCOP"].split()[1])
+    date = goests.to_dataframe().index[0]
+    columns = {}
+    if quantities & {"temperature", "em", "rad_loss_rate"}:
+        longflux_corrected, fluxratio = _goes_correct_fluxes(longflux, shortflux,
+                                                             satellite=satellite, date=date)
+        temp = temperature_kernel(fluxratio, satellite=satellite, abundances=abundances,
+                                  download=download, download_dir=download_dir,
+                                  engine=engine)
+        if "temperature" in quantities:
+            columns["temperature"] = u.Quantity(temp, u.MK, copy=False)
+    if quantities & {"em", "rad_loss_rate"}:
+        em = emission_measure_kernel(longflux_corrected, temp, satellite=satellite,
+                                     abundances=abundances, download=download,
+                                     download_dir=download_dir, engine=engine)
+        if "em" in quantities:
+            columns["em"] = u.Quantity(em, u.cm**-3, copy=False)
+    if "rad_loss_rate" in quantities:
+        rad_loss = radiative_loss_rate_kernel(temp, em, force_download=download,
+                                              download_dir=download_dir, engine=engine)
+        columns["rad_loss_rate"] = u.Quantity(rad_loss, u.W, copy=False)
+    if "luminosity" in quantities:
+        # The Sun-Earth distances are found once for both channels.
+        area = _luminosity_area(goests.to_dataframe().index)
+        columns["luminosity_xrsa"] = u.Quantity(area * shortflux, u.W, copy=False)
+        columns["luminosity_xrsb"] = u.Quantity(area * longflux, u.W, copy=False)
+
+    return _add_derived_columns(goests, columns, derived_only)
+
+
+def calculate_interval_energies(goests, start, end, abundances="coronal", download=False,
+                                download_dir=None, engine="spline"):
+    """
+    Calculates the energy radiated by the GOES plasma during many time intervals.
+
+    The radiative loss rate and the X-ray luminosities of the whole
+    timeseries are calculated once, as by
+    `~sunkit_instruments.goes_xrs.calculate_thermodynamics`, and
+    integrated once into cumulative energies.  The energy radiated during
+    each interval is then the difference of the cumulative energies at its
+    ends, so the cost is proportional to the number of samples plus the
+    number of intervals, e.g. for finding the energies of all flares in a
+    long timeseries.
+
+    Parameters
+    ----------
+    goests : `~sunpy.timeseries.sources.XRSTimeSeries`
+        The TimeSeries containing GOES flux data which **MUST**
+        be in units of "W/m^2".  Its times must be in chronological order.
+    start, end : array-like of `~sunpy.time.parse_time` parsable objects
+        The start and end times of the intervals.  Both ends are inclusive,
+        so each result is the same as integrating the samples of
+        ``goests.truncate(start, end)``.
+    abundances : {'coronal' | 'photospheric'}, optional
+        States whether "photospheric" or "coronal" abundances should be
+        assumed, default to 'coronal'.
+    download : `bool`, optional
+        If `True`, the GOES data files are downloaded.
+        Defaults to `False`.
+    download_dir : `str`, optional
+        The directory to download the GOES data files to, defaults to the
+        default download directory.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
+
+    Returns
+    -------
+    `~pandas.DataFrame`
+        One row per interval with the following columns:
+
+        | start, end - The interval limits
+        | rad_loss_int - Energy radiated by the coronal soft X-ray-emitting
+          plasma across all wavelengths [J]
+        | luminosity_xrsa_int - Energy radiated in the 0.5-4A channel [J]
+        | luminosity_xrsb_int - Energy radiated in the 1-8A channel [J]
+
+        Intervals holding fewer than two samples have zero energy.
+
+    Examples
+    --------
+    >>> import sunpy.timeseries as ts
+    >>> from sunkit_instruments.goes_xrs import calculate_interval_energies
+    >>> from sunpy.data.sample import GOES_XRS_TIMESERIES  # doctest: +REMOTE_DATA
+    >>> goests = ts.TimeSeries(GOES_XRS_TIMESERIES)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
+    >>> energies = calculate_interval_energies(
+    ...     goests, ["2011-06-07 06:20", "2011-06-07 08:00"],
+    ...     ["2011-06-07 07:00", "2011-06-07 08:30"])  # doctest: +REMOTE_DATA
+    >>> energies.columns.tolist()  # doctest: +REMOTE_DATA
+    ['start', 'end', 'rad_loss_int', 'luminosity_xrsa_int', 'luminosity_xrsb_int']
+    """
+    if not isinstance(goests, timeseries.XRSTimeSeries):
+        raise TypeError("goests must be a XRSTimeSeries object")
+    index = goests.to_dataframe().index
+    start = _datetime64_array(start)
+    end = _datetime64_array(end)
+    if start.shape != end.shape:
+        raise ValueError("start and end must have same number of elements.")
+
+    rates = calculate_thermodynamics(goests, quantities=("rad_loss_rate", "luminosity"),
+                                     abundances=abundances, download=download,
+                                     download_dir=download_dir, derived_only=True,
+                                     engine=engine)
+    energies = interval_integral_kernel(
+        rates[["rad_loss_rate", "luminosity_xrsa", "luminosity_xrsb"]].to_numpy().T,
+        *_interval_seconds(index, start, end))
+    return pandas.DataFrame({"start": start, "end": end,
+                             "rad_loss_int": energies[0],
+                             "luminosity_xrsa_int": energies[1],
+                             "luminosity_xrsb_int": energies[2]})
+
+
+def calculate_flare_energetics(goests, flares, abundances="coronal", download=False,
+                               download_dir=None, engine="spline"):
+    """
+    Calculates the peak thermodynamic properties and radiated energies of many flares.
+
+    The temperature, emission measure, radiative loss rate and X-ray
+    luminosities of the whole timeseries are calculated once, as by
+    `~sunkit_instruments.goes_xrs.calculate_thermodynamics`. The peak
+    values during each flare are then found by segment reductions over
+    these arrays and the radiated energies from their cumulative integrals,
+    so the cost is proportional to the number of samples plus the number
+    of flares rather than their product.
+
+    Parameters
+    ----------
+    goests : `~sunpy.timeseries.sources.XRSTimeSeries`
+        The TimeSeries containing GOES flux data which **MUST**
+        be in units of "W/m^2".  Its times must be in chronological order.
+    flares : `~pandas.DataFrame` or `list` of `dict`
+        The flares, with their start and end times in ``start_time`` and
+        ``end_time`` columns or keys, as returned by
+        `~sunkit_instruments.goes_xrs.get_goes_event_list` or
+        `~sunkit_instruments.goes_xrs.find_flares`.  Both ends are
+        inclusive.  An end time of NaT, as for a flare that is still in
+        progress at the end of the data given to
+        `~sunkit_instruments.goes_xrs.find_flares`, extends the flare to the
+        last sample.
+    abundances : {'coronal' | 'photospheric'}, optional
+        States whether "photospheric" or "coronal" abundances should be
+        assumed, default to 'coronal'.
+    download : `bool`, optional
+        If `True`, the GOES data files are downloaded.
+        Defaults to `False`.
+    download_dir : `str`, optional
+        The directory to download the GOES data files to, defaults to the
+        default download directory.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
+
+    Returns
+    -------
+    `~pandas.DataFrame`
+        One row per flare, with the index of ``flares`` if it is a
+        `~pandas.DataFrame`, and the following columns:
+
+        | start_time, end_time - The flare limits
+        | peak_temperature - Maximum temperature during the flare [MK]
+        | peak_em - Maximum volume emission measure during the flare [cm**-3]
+        | rad_loss_int - Energy radiated by the coronal soft X-ray-emitting
+          plasma across all wavelengths [J]
+        | luminosity_xrsa_int - Energy radiated in the 0.5-4A channel [J]
+        | luminosity_xrsb_int - Energy radiated in the 1-8A channel [J]
+
+        Flares holding no samples have NaN peak values, and flares holding
+        fewer than two samples have zero energy.
+
+    Examples
+    --------
+    >>> import sunpy.timeseries as ts
+    >>> from sunkit_instruments.goes_xrs import calculate_flare_energetics, find_flares
+    >>> from sunpy.data.sample import GOES_XRS_TIMESERIES  # doctest: +REMOTE_DATA
+    >>> goests = ts.TimeSeries(GOES_XRS_TIMESERIES)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
+    >>> flares = find_flares(goests.to_dataframe().index, goests.quantity("xrsb"))  # doctest: +SKIP
+    >>> energetics = calculate_flare_energetics(goests, flares)  # doctest: +SKIP
+    """
+    if not isinstance(goests, timeseries.XRSTimeSeries):
+        raise TypeError("goests must be a XRSTimeSeries object")
+    index = goests.to_dataframe().index
+    if isinstance(flares, pandas.DataFrame):
+        flare_index = flares.index
+        start = _datetime64_array(flares["start_time"].values)
+        end = _datetime64_array(flares["end_time"].values)
+    else:
+        flares = list(flares)
+        flare_index = None
+        start, end = (_datetime64_array(Time([flare[key] for flare in flares]))
+                      if flares else np.array([], dtype="datetime64[ns]")
+                      for key in ("start_time", "end_time"))
+
+    derived = calculate_thermodynamics(goests, abundances=abundances, download=download,
+                                       download_dir=download_dir, derived_only=True,
+                                       engine=engine)
+    seconds = _interval_seconds(index, start, end)
+    peaks = interval_peak_kernel(derived[["temperature", "em"]].to_numpy().T, *seconds)
+    energies = interval_integral_kernel(
+        derived[["rad_loss_rate", "luminosity_xrsa", "luminosity_xrsb"]].to_numpy().T,
+        *seconds)
+    return pandas.DataFrame({"start_time": start, "end_time": end,
+                             "peak_temperature": peaks[0],
+                             "peak_em": peaks[1],
+                             "rad_loss_int": energies[0],
+                             "luminosity_xrsa_int": energies[1],
+                             "luminosity_xrsb_int": energies[2]}, index=flare_index)
+
+
+def _interval_seconds(index, start, end):
+    """
+    Measure sample times and interval limits in seconds from the first sample.
+    """
+    t0 = index[0].to_datetime64() if len(index) else np.datetime64(0, "ns")
+    return ((index.values - t0) / np.timedelta64(1, "s"),
+            (start - t0) / np.timedelta64(1, "s"),
+            (end - t0) / np.timedelta64(1, "s"))
+
+
+_STREAM_COLUMNS = ("temperature", "em", "rad_loss_rate", "luminosity_xrsa",
+                   "luminosity_xrsb", "rad_loss_cumul", "luminosity_xrsa_cumul",
+                   "luminosity_xrsb_cumul")
+
+
+def iter_thermodynamics(chunks, abundances="coronal", download=False, download_dir=None,
+                        engine="spline"):
+    """
+    Calculates the GOES derived quantities chunk by chunk over a long archive.
+
+    This is a generator version of
+    `~sunkit_instruments.goes_xrs.calculate_thermodynamics` for archives
+    too long to hold in memory.  The chunks are loaded one at a time and
+    only one chunk is held at once.  The fits to the CHIANTI tables are
+    cached, so they are only made for the first chunk from each satellite.
+    The energy radiated since the start of the first chunk is carried
+    across chunk boundaries, including the interval between the last
+    sample of one chunk and the first sample of the next.
+
+    Parameters
+    ----------
+    chunks : iterable of `~sunpy.timeseries.sources.XRSTimeSeries` or file paths
+        Consecutive pieces of the archive in chronological order.  File
+        paths are read with `sunpy.timeseries.TimeSeries`.  The fluxes
+        **MUST** be in units of "W/m^2".
+    abundances : {'coronal' | 'photospheric'}, optional
+        States whether "photospheric" or "coronal" abundances should be
+        assumed, default to 'coronal'.
+    download : `bool`, optional
+        If `True`, the GOES data files are downloaded before the first
+        chunk.  Defaults to `False`.
+    download_dir : `str`, optional
+        The directory to download the GOES data files to, defaults to the
+        default download directory.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
+
+    Yields
+    ------
+    `~pandas.DataFrame`
+        For each chunk, a dataframe sharing its time index with the
+        following columns:
+
+        | temperature - Array of temperatures [MK]
+        | em - Array of volume emission measures [cm**-3]
+        | rad_loss_rate - Radiative loss rate of the coronal soft X-ray-emitting
+          plasma across all wavelengths [W]
+        | luminosity_xrsa - Xray luminosity in 0.5-4A channel [W]
+        | luminosity_xrsb - Xray luminosity in 1-8A channel [W]
+        | rad_loss_cumul - Radiative losses since the first sample of the
+          first chunk [J]
+        | luminosity_xrsa_cumul - Energy radiated in the 0.5-4A channel
+          since the first sample of the first chunk [J]
+        | luminosity_xrsb_cumul - Energy radiated in the 1-8A channel
+          since the first sample of the first chunk [J]
+
+    Examples
+    --------
+    >>> import glob
+    >>> from sunkit_instruments.goes_xrs import iter_thermodynamics
+    >>> for derived in iter_thermodynamics(sorted(glob.glob("goes/*.fits"))):  # doctest: +SKIP
+    ...     derived.to_csv("derived.csv", mode="a")
+    """
+    columns = list(_STREAM_COLUMNS)
+    rates = ["rad_loss_rate", "luminosity_xrsa", "luminosity_xrsb"]
+    energy = _RunningIntegral(len(rates))
+    for chunk in chunks:
+        if not isinstance(chunk, timeseries.XRSTimeSeries):
+            chunk = timeseries.TimeSeries(chunk)
+        index = chunk.to_dataframe().index
+        if len(index) == 0:
+            yield pandas.DataFrame(columns=columns, index=index, dtype=float)
+            continue
+        derived = calculate_thermodynamics(chunk, abundances=abundances, download=download,
+                                           download_dir=download_dir, derived_only=True,
+                                           engine=engine)
+        # The tables only need to be downloaded once.
+        download = False
+        cumul = energy.update(index.values, derived[rates].to_numpy().T)
+        for name, values in zip(rates, cumul):
+            derived[name.replace("_rate", "") + "_cumul"] = values
+        yield derived[columns]
+
+
+class _RunningIntegral:
+    """
+    Trapezoid-rule integral of sampled rates, continued over successive chunks.
+
+    Only the total so far and the last sample are kept, so the cost of
+    each update is proportional to the number of new samples.  Non-finite
+    rates are skipped, so each rate is integrated over its finite samples.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.reset()
+
+    def reset(self):
+        """
+        Restart the integral at zero from the next sample.
+        """
+        self.total = np.zeros(self.size)
+        self.last_time = None
+        # The last finite sample of each rate
+        self.last_finite_times = np.full(self.size, np.datetime64("NaT", "ns"))
+        self.last_values = np.full(self.size, np.nan)
+
+    def update(self, times, values):
+        """
+        Add samples to the integral.
+
+        Parameters
+        ----------
+        times : `numpy.ndarray` of `numpy.datetime64`
+            Times of the new samples, after those of earlier updates.
+        values : `numpy.ndarray`
+            Rates of shape ``(size, len(times))``.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            The integral at each new sample, of the same shape as ``values``
+            and in the units of the rates times s.  At a non-finite rate it
+            is that at the last finite one.
+        """
+        times = np.asarray(times, dtype="datetime64[ns]")
+        values = np.asarray(values, dtype=float).reshape(self.size, len(times))
+        if len(times) == 0:
+            return values.copy()
+        _assert_chrono_order(times if self.last_time is None
+                             else np.concatenate([[self.last_time], times]), name="times")
+        cumul = np.empty_like(values)
+        for row, row_values in enumerate(values):
+            finite = np.isfinite(row_values)
+            if not finite.any():
+                cumul[row] = self.total[row]
+                continue
+            row_times, row_values = times[finite], row_values[finite]
+            previous = not np.isnat(self.last_finite_times[row])
+            if previous:
+                # Include the interval since the last finite sample of earlier updates.
+                row_times = np.concatenate([self.last_finite_times[row:row + 1], row_times])
+                row_values = np.concatenate([self.last_values[row:row + 1], row_values])
+            seconds = (row_times - row_times[0]) / np.timedelta64(1, "s")
+            integral = (cumtrapz(row_values, seconds, initial=0)[int(previous):]
+                        + self.total[row])
+            # Non-finite samples take the integral of the last finite one before them.
+            last_finite = np.cumsum(finite) - 1
+            cumul[row] = np.where(last_finite >= 0, integral[np.maximum(last_finite, 0)],
+                                  self.total[row])
+            self.total[row] = integral[-1]
+            self.last_finite_times[row] = row_times[-1]
+            self.last_values[row] = row_values[-1]
+        self.last_time = times[-1]
+        return cumul
+
+
+class XRSEnergyAccumulator:
+    """
+    Incrementally calculates GOES derived quantities and radiated energy from live data.
+
+    New GOES/XRS samples are passed to `update` as they arrive.  The
+    temperature, emission measure, radiative loss rate and luminosities
+    are calculated for the new samples only, and the energy radiated since
+    the first sample, or since the last call to `reset`, is updated from
+    the last sample received.  Each update therefore costs time
+    proportional to the number of new samples, however long the
+    accumulator has been running.
 
-    return ts_new
+    Parameters
+    ----------
+    satellite : `int`, optional
+        Number of the GOES satellite observing the samples.
+        Defaults to 16.
+    abundances : {'coronal' | 'photospheric'}, optional
+        States whether "photospheric" or "coronal" abundances should be
+        assumed, default to 'coronal'.
+    download_dir : `str`, optional
+        The directory to download the GOES data files to, defaults to the
+        default download directory.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
+    out_of_range : {'nan' | 'raise'}, optional
+        What to do with samples outside the CHIANTI tables.  With 'nan',
+        their temperature, emission measure and radiative loss rate are
+        NaN and the radiated energy is integrated over the other samples.
+        With 'raise', a `ValueError` is raised and the whole update is
+        rejected.  Defaults to 'nan'.
+
+    Examples
+    --------
+    >>> from sunkit_instruments.goes_xrs import XRSEnergyAccumulator
+    >>> accumulator = XRSEnergyAccumulator(satellite=16)
+    >>> derived = accumulator.update("2017-09-10T16:00:00", 1e-4, 1e-5)  # doctest: +REMOTE_DATA
+    >>> derived = accumulator.update(["2017-09-10T16:00:01", "2017-09-10T16:00:02"],
+    ...                              [1.1e-4, 1.2e-4], [1.1e-5, 1.2e-5])  # doctest: +REMOTE_DATA
+    >>> accumulator.reset()  # At the end of a flare
+    """
+
+    def __init__(self, satellite=16, abundances="coronal", download_dir=None, engine="spline",
+                 out_of_range="nan"):
+        _check_out_of_range(out_of_range)
+        self.satellite = int(_satellite_numbers(satellite))
+        self.abundances = abundances
+        self.download_dir = download_dir
+        self.engine = engine
+        self.out_of_range = out_of_range
+        self._energy = _RunningIntegral(3)
+
+    @property
+    def last_time(self):
+        """
+        Time of the last sample received, or `None`.
+        """
+        return self._energy.last_time
+
+    @property
+    def energy(self):
+        """
+        `dict` of the energies radiated since the start or the last reset, in J.
+
+        The keys are "rad_loss", "luminosity_xrsa" and "luminosity_xrsb".
+        """
+        return dict(zip(["rad_loss", "luminosity_xrsa", "luminosity_xrsb"], self._energy.total))
+
+    def reset(self):
+        """
+        Restart the radiated energies at zero, e.g. at a flare boundary.
+
+        The energies are integrated from the last sample received, so the
+        interval between it and the next sample is counted after the reset.
+        """
+        self._energy.total = np.zeros(self._energy.size)
+
+    def update(self, time, longflux, shortflux):
+        """
+        Add new samples.
+
+        Parameters
+        ----------
+        time : `~sunpy.time.parse_time` parsable object or array of them
+            Times of the new samples, which must be after those already
+            received.
+        longflux, shortflux : `~astropy.units.Quantity` or array-like
+            Long and short channel fluxes of the new samples.  Plain
+            numbers are taken to be in W/m**2.
+
+        Returns
+        -------
+        `~pandas.DataFrame`
+            The derived quantities for the new samples, indexed by their
+            times, with the same columns and units as those yielded by
+            `~sunkit_instruments.goes_xrs.iter_thermodynamics`.  The
+            cumulative energies are since the start or the last reset.
+        """
+        times = _datetime64_array(time)
+        longflux = np.atleast_1d(u.Quantity(longflux, u.W/u.m**2).value)
+        shortflux = np.atleast_1d(u.Quantity(shortflux, u.W/u.m**2).value)
+        if not len(times) == len(longflux) == len(shortflux):
+            raise ValueError("time, longflux and shortflux must all have "
+                             "same number of elements.")
+        if len(times) == 0:
+            return pandas.DataFrame(columns=list(_STREAM_COLUMNS),
+                                    index=pandas.DatetimeIndex(times), dtype=float)
+        temp, em = temperature_em_kernel(longflux, shortflux, satellite=self.satellite,
+                                         date=times, abundances=self.abundances,
+                                         download_dir=self.download_dir, engine=self.engine,
+                                         out_of_range=self.out_of_range)
+        rad_loss = np.full(len(times), np.nan)
+        inside = np.isfinite(temp)
+        if inside.any():
+            rad_loss[inside] = radiative_loss_rate_kernel(temp[inside], em[inside],
+                                                          download_dir=self.download_dir,
+                                                          engine=self.engine)
+        area = _luminosity_area(times)
+        rates = np.stack([rad_loss, area * shortflux, area * longflux])
+        cumul = self._energy.update(times, rates)
+        return pandas.DataFrame(dict(zip(_STREAM_COLUMNS, [temp, em, *rates, *cumul])),
+                                index=pandas.DatetimeIndex(times))
+
+
+def interval_integral_kernel(values, seconds, start, end):
+    """
+    Integrates sampled rates over many time intervals with a single cumulative integral.
+
+    The rates are integrated with the trapezoid rule into a cumulative
+    integral once, and the integral over each interval is the difference
+    of the cumulative integral at the last and first samples within it.
+    This gives the same result, up to rounding, as applying
+    `scipy.integrate.trapz` to the samples within each interval, at a cost
+    proportional to the number of samples plus the number of intervals.
+
+    Parameters
+    ----------
+    values : `numpy.ndarray`
+        Rates sampled at ``seconds`` along the last axis, e.g. an array of
+        shape ``(m, n)`` holding ``m`` quantities at ``n`` times.
+    seconds : `numpy.ndarray`
+        Sample times in s.  Must be in chronological order.
+    start, end : `numpy.ndarray`
+        Start and end times of the intervals in s, on the same scale as
+        ``seconds``.  Both ends are inclusive.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The integral over each interval, with the leading shape of
+        ``values`` and the shape of ``start`` along the last axis, in the
+        units of ``values`` times s.  Intervals holding fewer than two
+        samples have a zero integral.
+    """
+    values = np.asarray(values, dtype=float)
+    seconds = np.asarray(seconds, dtype=float)
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    if values.shape[-1] != len(seconds):
+        raise ValueError("values must have same number of elements as seconds "
+                         "along the last axis.")
+    if start.shape != end.shape:
+        raise ValueError("start and end must have same number of elements.")
+    _assert_chrono_order(seconds, name="seconds")
+    if len(seconds) < 2:
+        return np.zeros(values.shape[:-1] + start.shape)
+
+    cumul = cumtrapz(values, seconds, axis=-1, initial=0)
+    # Indices of the first and last samples within each interval
+    first = np.searchsorted(seconds, start, side="left")
+    last = np.searchsorted(seconds, end, side="right") - 1
+    integral = (cumul[..., np.clip(last, 0, len(seconds) - 1)]
+                - cumul[..., np.clip(first, 0, len(seconds) - 1)])
+    integral[..., last <= first] = 0.
+    return integral
+
+
+def interval_peak_kernel(values, seconds, start, end):
+    """
+    Finds the maxima of sampled values over many time intervals with segment reductions.
+
+    The samples within each interval are reduced by `numpy.fmax.reduceat`,
+    with the intervals ordered by their first sample so that the total
+    cost is proportional to the number of samples plus the number of
+    samples within the intervals.
+
+    Parameters
+    ----------
+    values : `numpy.ndarray`
+        Values sampled at ``seconds`` along the last axis, e.g. an array of
+        shape ``(m, n)`` holding ``m`` quantities at ``n`` times.
+    seconds : `numpy.ndarray`
+        Sample times in s.  Must be in chronological order.
+    start, end : `numpy.ndarray`
+        Start and end times of the intervals in s, on the same scale as
+        ``seconds``.  Both ends are inclusive.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        The maximum over each interval, with the leading shape of
+        ``values`` and the shape of ``start`` along the last axis.  NaN
+        values are ignored, and intervals holding no samples, or only NaN
+        values, give NaN.
+    """
+    values = np.asarray(values, dtype=float)
+    seconds = np.asarray(seconds, dtype=float)
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    if values.shape[-1] != len(seconds):
+        raise ValueError("values must have same number of elements as seconds "
+                         "along the last axis.")
+    if start.shape != end.shape:
+        raise ValueError("start and end must have same number of elements.")
+    _assert_chrono_order(seconds, name="seconds")
+    peaks = np.full(values.shape[:-1] + start.shape, np.nan)
+    if start.size == 0:
+        return peaks
+
+    # Indices of the first sample within and the first sample after each interval
+    first = np.searchsorted(seconds, start.ravel(), side="left")
+    stop = np.searchsorted(seconds, end.ravel(), side="right")
+    order = np.argsort(first, kind="stable")
+    # reduceat reduces between consecutive indices, so the even elements of
+    # the interleaved (first, stop) pairs give the interval maxima.  A NaN
+    # sample appended at the end keeps all indices valid.
+    padded = np.concatenate([values, np.full(values.shape[:-1] + (1,), np.nan)], axis=-1)
+    indices = np.stack([first[order], stop[order]], axis=-1).ravel()
+    reduced = np.fmax.reduceat(padded, indices, axis=-1)[..., ::2]
+    reduced[..., stop[order] <= first[order]] = np.nan
+    peaks.reshape(values.shape[:-1] + (-1,))[..., order] = reduced
+    return peaks
 
 
 def _goes_lx(longflux, shortflux, obstime=None, date=None):
@@ -1117,7 +2880,8 @@ def _goes_lx(longflux, shortflux, obstime=None, date=None):
         were taken simultaneously.
     date : (optional) `astropy.time.Time` object or valid date string.
         Date at which measurements were taken.  This is used to
-        calculate the Sun-Earth distance.
+        calculate the Sun-Earth distance.  An array of dates, e.g.
+        ``obstime``, gives the distance at each measurement.
         Default=None implies Sun-Earth distance is set to 1AU.
 
     Returns
@@ -1175,14 +2939,9 @@ def _goes_lx(longflux, shortflux, obstime=None, date=None):
             raise ValueError("longflux, shortflux, and obstime must all have "
                              "same number of elements.")
 
-        obstime = parse_time(obstime)
-
-        # Check elements in obstime in chronological order
-        _assert_chrono_order(obstime)
-
-        # Next, get measurement times in seconds from time of first
-        # measurement.
-        obstime_seconds = (obstime - obstime[0]).sec
+        # Get measurement times in seconds from time of first measurement,
+        # checking they are in chronological order.
+        obstime_seconds = _obstime_seconds(obstime)
 
         # Finally, integrate using trapezoid rule
         longlum_int = trapz(longlum.value, obstime_seconds)
@@ -1225,7 +2984,10 @@ def _calc_xraylum(flux: u.W/u.m/u.m, date=None):
     date : (optional) `astropy.time.Time` object or valid date str
         Used to calculate a more accurate Sun-Earth distance based on
         Earth's orbit at that date.  If date is None, Sun-Earth
-        distance is set to 1AU.
+        distance is set to 1AU.  An array of dates with the shape of
+        ``flux`` gives the distance at the time of each flux measurement,
+        interpolated from the distance at 0 UT on each day, which is
+        accurate to better than one part in 10^6.
 
     Returns
     -------
@@ -1241,12 +3003,310 @@ def _calc_xraylum(flux: u.W/u.m/u.m, date=None):
     >>> xraylum  # doctest: +REMOTE_DATA
     <Quantity [1.98751663e+18, 1.98751663e+18] W>
     """
-    if date is not None:
-        date = parse_time(date)
-        xraylum = 4 * np.pi * sun.earth_distance(date).to("m")**2 * flux
+    xraylum = xray_luminosity_kernel(flux.to_value(u.W/u.m**2), date=date)
+    return u.Quantity(xraylum, unit=u.W, copy=False)
+
+
+@_blockwise("flux", "date")
+def xray_luminosity_kernel(flux, date=None):
+    """
+    Calculates solar luminosity from a plain array of flux observed at 1AU.
+
+    This is the unit-free kernel behind `_calc_xraylum`; see that function
+    for a description of the parameters and the method.
+
+    Parameters
+    ----------
+    flux : `numpy.ndarray` or `dask.array.Array`
+        Observed solar flux in W/m**2.
+    date : (optional) `astropy.time.Time`, valid date str or array of dates
+        See `_calc_xraylum`.
+
+    Returns
+    -------
+    xraylum : `numpy.ndarray` or `dask.array.Array`
+        X-ray luminosity in W.
+    """
+    return _luminosity_area(date) * np.asarray(flux, dtype=float)
+
+
+def _luminosity_area(date=None):
+    """
+    The area in m**2 of the sphere around the Sun through the Earth at ``date``.
+
+    Luminosity is this area times the observed flux; see `xray_luminosity_kernel`.
+    """
+    if date is None:
+        distance = constants.au.to_value("m")
+    elif np.ndim(date) == 0:
+        distance = sun.earth_distance(parse_time(date)).to_value("m")
     else:
-        xraylum = 4 * np.pi * constants.au.to("m")**2 * flux
-    return xraylum
+        distance = _earth_distance(date)
+    return 4 * np.pi * distance**2
+
+
+# Days from the Modified Julian Date epoch to the Unix epoch
+_MJD_UNIX_EPOCH = 40587
+# Number of days of the Sun-Earth distance grid computed and cached at once
+_EARTH_DISTANCE_BLOCK_DAYS = 64
+
+
+def _earth_distance(times):
+    """
+    The Sun-Earth distance in m at many times.
+
+    `sunpy.coordinates.sun.earth_distance` is only evaluated at 0 UT on the
+    days spanned by ``times``, in cached blocks of days, and interpolated
+    linearly to ``times``.  NaN or NaT times give NaN.
+    """
+    if isinstance(times, Time):
+        mjd = np.asarray(times.utc.mjd, dtype=float)
+    else:
+        mjd = ((_datetime64_array(times) - np.datetime64(0, "ns")) / np.timedelta64(1, "D")
+               + _MJD_UNIX_EPOCH)
+    if not np.isfinite(mjd).any():
+        return np.full(mjd.shape, np.nan)
+
+    first, last = (int(np.floor(day / _EARTH_DISTANCE_BLOCK_DAYS))
+                   for day in (np.nanmin(mjd), np.nanmax(mjd)))
+    blocks = [_earth_distance_block(block) for block in range(first, last + 1)]
+    # Consecutive blocks share the distance on their common day.
+    grid = np.concatenate([block[:-1] for block in blocks] + [blocks[-1][-1:]])
+    grid_mjd = first * _EARTH_DISTANCE_BLOCK_DAYS + np.arange(len(grid))
+    return np.interp(mjd, grid_mjd, grid)
+
+
+@functools.lru_cache(maxsize=None)
+def _earth_distance_block(block):
+    """
+    The Sun-Earth distance in m at 0 UT on the days of a block, including the first day of the next.
+    """
+    mjd = block * _EARTH_DISTANCE_BLOCK_DAYS + np.arange(_EARTH_DISTANCE_BLOCK_DAYS + 1)
+    distance = sun.earth_distance(Time(mjd, format="mjd", scale="utc")).to_value("m")
+    distance.flags.writeable = False
+    return distance
+
+
+# NOAA event definitions: a flare starts with the first of
+# NOAA_FLARE_RISE_SAMPLES one-minute samples of monotonically increasing
+# 1-8 angstrom flux, the last at least NOAA_FLARE_RISE_RATIO times the first.
+NOAA_FLARE_RISE_SAMPLES = 4
+NOAA_FLARE_RISE_RATIO = 1.4
+
+
+def find_flares(times, flux):
+    """
+    Finds flares in GOES/XRS 1-8 angstrom flux using the NOAA event definitions.
+
+    This builds a flare list locally from the flux, without querying the
+    HEK, following the definitions used for the NOAA GOES event list:
+
+    * The start is the first of 4 one-minute samples of steep monotonic
+      increase in flux, where the flux of the last is at least 1.4 times
+      that of the first.
+    * The peak is the sample of maximum flux.
+    * The end is the first sample after the peak where the flux has
+      decayed to halfway between the peak flux and the flux at the start.
+
+    A new flare can only start once the previous one has ended.  This is
+    the batch version of `~sunkit_instruments.goes_xrs.FlareDetector`.
+
+    Parameters
+    ----------
+    times : array-like of `~sunpy.time.parse_time` parsable objects
+        Times of the flux samples, exactly one minute apart.
+    flux : `~astropy.units.Quantity` or array-like
+        1-8 angstrom (XRS-B) flux averaged over one minute.  Plain numbers
+        are taken to be in W/m**2.  Missing samples must be given as NaN,
+        which never count as rising or as decayed.
+
+    Returns
+    -------
+    `~pandas.DataFrame`
+        One row per flare with the columns start_time, peak_time,
+        end_time, peak_flux [W/m**2] and goes_class.  A flare which has not
+        ended by the last sample has an end_time of NaT.
+
+    Examples
+    --------
+    >>> import sunpy.timeseries as ts
+    >>> from sunkit_instruments.goes_xrs import find_flares
+    >>> from sunpy.data.sample import GOES_XRS_TIMESERIES  # doctest: +REMOTE_DATA
+    >>> goests = ts.TimeSeries(GOES_XRS_TIMESERIES)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
+    >>> xrsb = goests.to_dataframe()["xrsb"].resample("1min").mean()  # doctest: +REMOTE_DATA
+    >>> flares = find_flares(xrsb.index, xrsb.values)  # doctest: +REMOTE_DATA
+    """
+    detector = FlareDetector()
+    flares = detector.update(times, flux)
+    return pandas.concat([flares, detector.finish()], ignore_index=True)
+
+
+class FlareDetector:
+    """
+    Finds flares in streaming GOES/XRS 1-8 angstrom flux using the NOAA event definitions.
+
+    New one-minute samples are passed to `update` as they arrive, which
+    returns the flares which ended within them.  Only the last few samples
+    and the flare in progress, if any, are kept between updates, so memory
+    does not grow with the length of the stream.  See
+    `~sunkit_instruments.goes_xrs.find_flares` for the event definitions.
+
+    Examples
+    --------
+    >>> from sunkit_instruments.goes_xrs import FlareDetector
+    >>> detector = FlareDetector()
+    >>> flares = detector.update(["2017-09-10T15:50", "2017-09-10T15:51"], [2e-6, 2.1e-6])
+    >>> detector.in_flare
+    False
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        # The last samples, to detect starts spanning two updates
+        self._tail_times = np.array([], dtype="datetime64[ns]")
+        self._tail_flux = np.array([])
+        # [start_time, start_flux, peak_time, peak_flux] of the flare in progress
+        self._flare = None
+        # Flares cannot start before the end of the previous one
+        self._not_before = None
+
+    @property
+    def in_flare(self):
+        """
+        Whether a flare has started but not yet ended.
+        """
+        return self._flare is not None
+
+    def update(self, times, flux):
+        """
+        Add new samples.
+
+        Parameters
+        ----------
+        times : array-like of `~sunpy.time.parse_time` parsable objects
+            Times of the new samples, one minute apart and continuing those
+            already received.
+        flux : `~astropy.units.Quantity` or array-like
+            1-8 angstrom flux averaged over one minute.  Plain numbers are
+            taken to be in W/m**2.
+
+        Returns
+        -------
+        `~pandas.DataFrame`
+            The flares which ended within the new samples, with the columns
+            described in `~sunkit_instruments.goes_xrs.find_flares`.
+        """
+        new_times = _datetime64_array(times)
+        new_flux = np.atleast_1d(u.Quantity(flux, u.W/u.m**2).value)
+        if len(new_times) != len(new_flux):
+            raise ValueError("times and flux must have same number of elements.")
+        times = np.concatenate([self._tail_times, new_times])
+        flux = np.concatenate([self._tail_flux, new_flux])
+        _assert_chrono_order(times, name="times")
+        if np.any(np.diff(times) != np.timedelta64(1, "m")):
+            raise ValueError("times must be one minute apart; give missing samples as NaN.")
+
+        starts = _flare_starts(flux)
+        if self._not_before is not None:
+            starts = starts[times[starts] >= self._not_before]
+        flares = []
+        # Index of the first sample not yet searched for the end of a flare,
+        # and of the earliest possible start of the next flare
+        position = len(self._tail_times)
+        earliest_start = 0
+        while True:
+            if self._flare is None:
+                next_start = np.searchsorted(starts, earliest_start)
+                if next_start == len(starts):
+                    break
+                start = starts[next_start]
+                self._flare = [times[start], flux[start], times[start], flux[start]]
+                position = start + 1
+            else:
+                end = self._find_end(flux, times, position)
+                if end is None:
+                    break
+                flares.append(self._flare + [times[end]])
+                self._flare = None
+                self._not_before = times[end]
+                position = earliest_start = end
+        self._tail_times = times[-(NOAA_FLARE_RISE_SAMPLES - 1):]
+        self._tail_flux = flux[-(NOAA_FLARE_RISE_SAMPLES - 1):]
+        return _flare_frame(flares)
+
+    def finish(self):
+        """
+        End the stream.
+
+        Returns
+        -------
+        `~pandas.DataFrame`
+            The flare in progress, if any, with an end_time of NaT, with the
+            columns described in `~sunkit_instruments.goes_xrs.find_flares`.
+            The detector is then reset.
+        """
+        flares = [] if self._flare is None else [self._flare + [np.datetime64("NaT")]]
+        self._reset()
+        return _flare_frame(flares)
+
+    def _find_end(self, flux, times, position):
+        """
+        Find the end of the flare in progress from ``flux[position:]``, updating its peak.
+
+        The flux is searched in blocks of doubling size, so that the cost
+        is proportional to the length of the flare rather than of ``flux``.
+        Returns the index of the end, or `None` if the flare has not ended.
+        """
+        start_flux = self._flare[1]
+        block = 64
+        while position < len(flux):
+            stop = min(len(flux), position + block)
+            segment = flux[position:stop]
+            # NaN samples are skipped by fmax and never count as decayed
+            running_peak = np.fmax.accumulate(np.concatenate([[self._flare[3]], segment]))[1:]
+            decayed = segment <= (running_peak + start_flux) / 2
+            if decayed.any():
+                stop = position + np.argmax(decayed) + 1
+                segment = flux[position:stop]
+            peak = np.argmax(np.fmax(segment, -np.inf))
+            if segment[peak] > self._flare[3]:
+                self._flare[2:] = [times[position + peak], segment[peak]]
+            if decayed.any():
+                return stop - 1
+            position = stop
+            block *= 2
+        return None
+
+
+def _flare_starts(flux):
+    """
+    Indices of the samples meeting the NOAA definition of a flare start.
+    """
+    n = NOAA_FLARE_RISE_SAMPLES
+    if len(flux) < n:
+        return np.array([], dtype=int)
+    steep = flux[n - 1:] >= NOAA_FLARE_RISE_RATIO * flux[:1 - n]
+    for i in range(n - 1):
+        stop = len(flux) - n + i + 1
+        steep &= flux[i + 1:stop + 1] > flux[i:stop]
+    return np.flatnonzero(steep)
+
+
+def _flare_frame(flares):
+    """
+    Tabulate flares given as [start_time, start_flux, peak_time, peak_flux, end_time].
+    """
+    columns = list(zip(*flares)) if flares else [[]] * 5
+    peak_flux = np.array(columns[3], dtype=float)
+    return pandas.DataFrame({
+        "start_time": np.array(columns[0], dtype="datetime64[ns]"),
+        "peak_time": np.array(columns[2], dtype="datetime64[ns]"),
+        "end_time": np.array(columns[4], dtype="datetime64[ns]"),
+        "peak_flux": peak_flux,
+        "goes_class": flux_to_flareclass(u.Quantity(peak_flux, u.W/u.m**2)),
+    })
 
 
 def flareclass_to_flux(flareclass):
@@ -1255,18 +3315,25 @@ def flareclass_to_flux(flareclass):
 
     Parameters
     ----------
-    flareclass : str
+    flareclass : `str` or array-like of `str`
         The case-insensitive flare class (e.g., 'X3.2', 'm1.5', 'A9.6').
+        A list, `numpy.ndarray` or `pandas.Series` of flare classes can be
+        given to convert them all at once.
 
     Returns
     -------
     flux : `~astropy.units.Quantity`
         X-ray flux between 1 and 8 Angstroms as measured near Earth in W/m^2.
+        An array of the same shape is returned for array input.
 
     Raises
     ------
     TypeError
-        Input must be a string.
+        If a single flare class is given that is not a string.
+    ValueError
+        If any of the flare classes is not a valid GOES class. For array
+        input the message lists the indices of all invalid elements,
+        including any that are not strings (e.g. `None` or NaN).
 
     Examples
     --------
@@ -1277,19 +3344,83 @@ def flareclass_to_flux(flareclass):
     <Quantity 4.7e-06 W / m2>
     >>> flareclass_to_flux('X2.4')
     <Quantity 0.00024 W / m2>
+    >>> flareclass_to_flux(['X2.4', 'c4.7'])
+    <Quantity [2.4e-04, 4.7e-06] W / m2>
     """
-    if not isinstance(flareclass, type('str')):
-        raise TypeError("Input must be a string")
-    # TODO should probably make sure the string is in the expected format.
+    classes = np.asarray(flareclass)
+    if classes.ndim == 0 and not isinstance(classes.item(), str):
+        raise TypeError("Input must be a string or an array of strings")
+    if classes.dtype.kind == 'U':
+        is_string = np.ones(classes.shape, dtype=bool)
+    else:
+        # e.g. a pandas.Series with missing entries; anything but a string is invalid
+        is_string = np.frompyfunc(isinstance, 2, 1)(classes, str).astype(bool)
+        classes = np.where(is_string, classes, '').astype(str)
 
-    flareclass = flareclass.upper()
-    # invert the conversion dictionary
-    # conversion_dict = {v: k for k, v in GOES_CONVERSION_DICT.items()}
-    return float(flareclass[1:]) * GOES_CONVERSION_DICT[flareclass[0]]
+    flux, invalid = _flareclass_flux(classes)
+    invalid |= ~is_string
+    if np.any(invalid):
+        if classes.ndim == 0:
+            raise ValueError(f"Invalid GOES flare class: {str(flareclass)!r}")
+        bad = np.flatnonzero(invalid)
+        raise ValueError("Invalid GOES flare classes at indices {}: {}".format(
+            _truncated_list(bad), _truncated_list(np.asarray(flareclass).flat[bad])))
+
+    return u.Quantity(flux, "W/m^2")
+
+
+def _flareclass_flux(classes):
+    """
+    The flux in W/m^2 of a `str` array of GOES classes, and a mask of the invalid classes.
+    """
+    classes = np.char.upper(classes)
+    letters = classes.astype('U1')
+    numbers = _drop_first_char(classes)
+    subclass = _parse_flareclass_subclass(numbers)
+    scale = np.full(classes.shape, np.nan)
+    for letter, flux in GOES_CONVERSION_DICT.items():
+        scale[letters == letter] = flux.to_value("W/m^2")
+
+    with np.errstate(invalid='ignore'):
+        invalid = np.isnan(scale) | ~np.isfinite(subclass) | (subclass < 0)
+    # float() ignores surrounding whitespace, but 'X 1' is not a flare class
+    invalid |= np.char.str_len(np.char.strip(numbers)) != np.char.str_len(numbers)
+    return subclass * scale, invalid
+
+
+def _drop_first_char(strings):
+    """
+    Remove the first character of every element of a `str` array.
+    """
+    strings = np.require(strings, requirements='C')
+    width = strings.dtype.itemsize // np.dtype('U1').itemsize
+    if width <= 1:
+        return np.full(strings.shape, '')
+    chars = strings.reshape(-1).view('U1').reshape(-1, width)
+    return np.ascontiguousarray(chars[:, 1:]).view(f'U{width - 1}').reshape(strings.shape)
+
+
+def _parse_flareclass_subclass(numbers):
+    """
+    Convert an array of numeric strings to floats, using NaN for invalid ones.
+    """
+    try:
+        return numbers.astype(float)
+    except ValueError:
+        subclass = pandas.to_numeric(numbers.ravel(), errors='coerce')
+        return np.asarray(subclass, dtype=float).reshape(numbers.shape)
+
+
+def _truncated_list(values, max_items=20):
+    values = list(values)
+    if len(values) > max_items:
+        return "[{}, ...] ({} in total)".format(
+            ", ".join(repr(v) for v in values[:max_items]), len(values))
+    return repr(values)
 
 
 @u.quantity_input
-def flux_to_flareclass(goesflux: u.watt/u.m**2):
+def flux_to_flareclass(goesflux: u.watt/u.m**2, split=False):
     """
     Converts X-ray flux into the corresponding GOES flare class.
 
@@ -1297,12 +3428,21 @@ def flux_to_flareclass(goesflux: u.watt/u.m**2):
     ----------
     flux : `~astropy.units.Quantity`
         X-ray flux between 1 and 8 Angstroms (usually measured by GOES) as
-        measured at the Earth in W/m^2
+        measured at the Earth in W/m^2. May be a scalar or an array.
+    split : `bool`, optional
+        If `True`, return the class letters and the numeric subclasses
+        separately instead of the combined flare class strings.
+        Defaults to `False`.
 
     Returns
     -------
-    flareclass : str
-        The flare class e.g.: 'X3.2', 'M1.5', 'A9.6'.
+    flareclass : `str` or `numpy.ndarray` of `str`
+        The flare class e.g.: 'X3.2', 'M1.5', 'A9.6'. An array of the same
+        shape as ``goesflux`` is returned for array input.
+        NaN fluxes give a class letter of ``''`` and a subclass of NaN.
+    letter, subclass : `tuple`
+        Only if ``split`` is `True`. The class letters and the numeric
+        subclasses, e.g.: ``('X', 3.2)``. Arrays are returned for array input.
 
     Raises
     ------
@@ -1327,27 +3467,362 @@ def flux_to_flareclass(goesflux: u.watt/u.m**2):
     'A0.78'
     >>> flux_to_flareclass(0.00682 * u.watt/u.m**2)
     'X68.2'
+    >>> flux_to_flareclass([2.1e-05, 6.9e-07] * u.watt/u.m**2)
+    array(['M2.1', 'B6.9'], dtype='<U4')
+    >>> flux_to_flareclass([2.1e-05, 6.9e-07] * u.watt/u.m**2, split=True)
+    (array(['M', 'B'], dtype='<U1'), array([2.1, 6.9]))
+    """
+    flux = goesflux.to_value('W/m**2')
+    with np.errstate(invalid='ignore'):
+        if np.any(flux < 0):
+            raise ValueError("Flux cannot be negative")
+
+    # Fluxes below the A class or above the X class are expressed as
+    # multiples of the A or X class respectively.
+    with np.errstate(divide='ignore'):
+        decade = np.clip(np.floor(np.log10(flux)), _GOES_MIN_DECADE, _GOES_MAX_DECADE)
+    isnan = np.isnan(decade)
+    index = np.where(isnan, _GOES_MIN_DECADE, decade).astype(int) - _GOES_MIN_DECADE
+    str_class = np.where(isnan, '', _GOES_CLASS_LETTERS[index])
+    goes_subclass = 10 ** -decade * flux
+
+    if split:
+        if str_class.ndim == 0:
+            return str(str_class), float(goes_subclass)
+        return str_class, goes_subclass
+    # np.char.mod keeps the float dtype of empty arrays
+    flareclass = np.char.add(str_class, np.char.mod('%.3g', goes_subclass).astype(str))
+    if flareclass.ndim == 0:
+        return str(flareclass)
+    return flareclass
+
+
+def chianti_cache_info():
     """
+    Report statistics of the cache of spline fits to the CHIANTI tables.
 
-    if goesflux.value < 0:
-        raise ValueError("Flux cannot be negative")
+    The CHIANTI lookup tables used by `~sunkit_instruments.goes_xrs.calculate_temperature_em`
+    and `~sunkit_instruments.goes_xrs.calculate_radiative_loss_rate` are parsed and
+    fitted once per table file, satellite and abundances, and the fits are
+    reused by all subsequent calls in the same process.
 
-    decade = np.floor(np.log10(goesflux.to('W/m**2').value))
-    # invert the conversion dictionary
-    conversion_dict = {v: k for k, v in GOES_CONVERSION_DICT.items()}
-    if decade < -8:
-        str_class = "A"
-        decade = -8
-    elif decade > -4:
-        str_class = "X"
-        decade = -4
-    else:
-        str_class = conversion_dict.get(u.Quantity(10 ** decade, "W/m**2"))
-    goes_subclass = 10 ** -decade * goesflux.to('W/m**2').value
-    return f"{str_class}{goes_subclass:.3g}"
+    Returns
+    -------
+    `tuple`
+        Named tuple of the number of cache ``hits`` and ``misses`` and the
+        number of fits currently held (``currsize``).
+
+    Examples
+    --------
+    >>> from sunkit_instruments.goes_xrs import chianti_cache_info, clear_chianti_cache
+    >>> clear_chianti_cache()
+    >>> chianti_cache_info()
+    ChiantiCacheInfo(hits=0, misses=0, currsize=0)
+    """
+    return _CHIANTI_SPLINE_CACHE.info()
+
+
+def clear_chianti_cache():
+    """
+    Discard all cached spline fits to the CHIANTI tables and reset the counters.
+
+    The fits are also discarded for a table when it is requested with
+    ``download=True`` (``force_download=True`` for the radiative loss table).
+    """
+    _CHIANTI_SPLINE_CACHE.clear()
+
+
+@manager.require('file_temp_cor',
+                 _RemoteTableURLs(FILE_TEMP_COR),
+                 '3d8ddaaabf0faf75ba8d15e0c468896ce3d7622cc23076bf91437951e0ab3ad4')
+@manager.require('file_temp_pho',
+                 _RemoteTableURLs(FILE_TEMP_PHO),
+                 'dd8c6b949a492174146a0b7307dd5fb197236431dbbedfdbab2e3f8dcd360267')
+@manager.require('file_em_cor',
+                 _RemoteTableURLs(FILE_EM_COR),
+                 'a7440e20cbcb74e87db528e8e9d47cd69fbbd8f56ddc92cf4e854a66fb2a6172')
+@manager.require('file_em_pho',
+                 _RemoteTableURLs(FILE_EM_PHO),
+                 '0d59042b265bf76351d129b3e2a5844b3a9c96943cb246538013fd8c1b9b71b9')
+@manager.require('file_rad_cor',
+                 _RemoteTableURLs(FILE_RAD_COR),
+                 'b56dccaa1035da46baa1a9251c4840107750d869de101d1811b506ceaec5828e')
+def write_chianti_table_store(path):
+    """
+    Parse all the CHIANTI lookup tables and write them to one binary store.
+
+    The text tables are downloaded if needed, parsed once and written to
+    ``path`` as an uncompressed ``.npz`` file, which can be memory-mapped by
+    `~sunkit_instruments.goes_xrs.ChiantiTableStore` and used by all GOES
+    functions with `~sunkit_instruments.goes_xrs.use_chianti_table_store`.
+
+    Parameters
+    ----------
+    path : `str` or `pathlib.Path`
+        The file to write.  An ``.npz`` extension is appended if missing.
+
+    Examples
+    --------
+    >>> from sunkit_instruments.goes_xrs import (use_chianti_table_store,
+    ...                                          write_chianti_table_store)
+    >>> write_chianti_table_store("chianti_tables.npz")  # doctest: +SKIP
+    >>> use_chianti_table_store("chianti_tables.npz")  # doctest: +SKIP
+    """
+    arrays = {"version": np.array(CHIANTI_STORE_VERSION)}
+    for name in _CHIANTI_STORE_TABLES:
+        data_file = manager.get(name)
+        parse = _parse_chianti_rad_loss if name == "file_rad_cor" else _parse_chianti_csv
+        columns, values = parse(data_file)
+        arrays[f"{name}.sha256"] = np.array(_file_sha256(data_file))
+        arrays[f"{name}.columns"] = np.array(columns)
+        arrays[f"{name}.values"] = values
+    np.savez(path, **arrays)
+
+
+def use_chianti_table_store(path):
+    """
+    Read the CHIANTI lookup tables from a binary store instead of the text files.
+
+    The store is memory-mapped, so the tables are not parsed by any GOES
+    function, and worker processes forked after this call share one copy.
+    A text table whose hash does not match any table of the store, e.g.
+    after it has been downloaded again, is still parsed from the text.  The
+    cached spline fits are discarded.
+
+    Parameters
+    ----------
+    path : `str`, `pathlib.Path` or `None`
+        A store written by
+        `~sunkit_instruments.goes_xrs.write_chianti_table_store`, or `None`
+        to go back to parsing the text tables.
+    """
+    global _CHIANTI_TABLE_STORE
+    _CHIANTI_TABLE_STORE = None if path is None else ChiantiTableStore(path)
+    _CHIANTI_SPLINE_CACHE.clear()
+
+
+def _chianti_table(data_file, parse):
+    """
+    The ``(columns, values)`` of a CHIANTI table, from the store in use if it holds it.
+    """
+    store = _CHIANTI_TABLE_STORE
+    table = None if store is None else store.get(data_file)
+    return parse(data_file) if table is None else table
+
+
+def _fit_chianti_temp(data_file, satellite):
+    """
+    Fit log_10 of the temperature in MK against the flux ratio of ``satellite``.
+    """
+    # Determine name of column in csv file containing model ratio values
+    # for relevant GOES satellite
+    modeltemp, modelratio = _read_chianti_csv(data_file, f"ratioGOES{satellite}")
+    return _ChiantiSpline(modelratio, modeltemp, log_x=True, relative=False)
+
+
+def _fit_chianti_ratio(data_file, satellite):
+    """
+    Fit the flux ratio of ``satellite`` against log_10 of the temperature in MK.
+    """
+    modeltemp, modelratio = _read_chianti_csv(data_file, f"ratioGOES{satellite}")
+    return _ChiantiSpline(modeltemp, modelratio)
+
+
+def _fit_chianti_em(data_file, satellite):
+    """
+    Fit the long channel flux of ``satellite`` per 10^55 cm**-3 against log_10 of temperature.
+    """
+    # Determine name of column in csv file containing model flux values
+    # for relevant GOES satellite
+    modeltemp, modelflux = _read_chianti_csv(data_file, f"longfluxGOES{satellite}")
+    return _ChiantiSpline(modeltemp, modelflux)
+
+
+def _read_chianti_csv(data_file, label):
+    """
+    Read the temperature column and the ``label`` column of a CHIANTI csv table.
+
+    Returns the modelled temperature, in log_10 space in units of MK, and
+    the requested column as arrays.
+    """
+    columns, values = _chianti_table(data_file, _parse_chianti_csv)
+    return values[columns.index("log10temp_MK")], values[columns.index(label)]
 
 
-def _assert_chrono_order(obstime):
-    chrono_check = obstime[1:] - obstime[:-1]
-    if not all(val > TimeDelta(0*u.day) for val in chrono_check):
-        raise ValueError("Elements of obstime must be in chronological order.")
+def _parse_chianti_csv(data_file):
+    """
+    Parse a CHIANTI csv table into its column names and a (columns, rows) array.
+    """
+    with open(data_file, "r") as csvfile:
+        startline = dropwhile(lambda l: l.startswith("#"), csvfile)
+        csvreader = csv.reader(startline, delimiter=";")
+        columns = next(csvreader)
+        values = np.array([[float(value) for value in row] for row in csvreader if row])
+    return columns, values.reshape(-1, len(columns)).T.copy()
+
+
+def _parse_chianti_rad_loss(data_file):
+    """
+    Parse the CHIANTI radiative loss table into its column names and a (columns, rows) array.
+
+    The temperature is in units of K and the radiative loss rate in erg/s cm**3.
+    """
+    # Read data from csv file into lists, being sure to skip commented
+    # lines at the top of the file.
+    modeltemp = []    # modelled temperature is in units of K
+    model_loss_rate = []
+    with open(data_file, "r") as csvfile:
+        startline = csvfile.readlines()[7:]
+        csvreader = csv.reader(startline, delimiter=" ")
+        for row in csvreader:
+            modeltemp.append(float(row[0]))
+            model_loss_rate.append(float(row[1]))
+    return ["temp_K", "rad_loss_rate"], np.array([modeltemp, model_loss_rate])
+
+
+def _file_sha256(path):
+    """
+    The hex SHA-256 hash of the contents of a file.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _npz_memmap(path):
+    """
+    Memory-map the arrays of an uncompressed ``.npz`` file, keyed by name.
+
+    `numpy.load` ignores ``mmap_mode`` for ``.npz`` files, so the arrays are
+    located by their offsets within the zip archive.  Scalars are read.
+    """
+    with zipfile.ZipFile(path) as archive:
+        members = archive.infolist()
+    arrays = {}
+    with open(path, "rb") as f:
+        for member in members:
+            if member.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} is compressed and cannot be memory-mapped.")
+            # Skip the local file header, whose name and extra field lengths
+            # may differ from those in the central directory.
+            f.seek(member.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", f.read(4))
+            f.seek(name_length + extra_length, os.SEEK_CUR)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                read_header = np.lib.format.read_array_header_1_0
+            elif version == (2, 0):
+                read_header = np.lib.format.read_array_header_2_0
+            else:
+                raise ValueError(f"{path} holds .npy data of unsupported format version "
+                                 f"{version[0]}.{version[1]}.")
+            shape, fortran_order, dtype = read_header(f)
+            name = member.filename[:-len(".npy")]
+            if shape == () or 0 in shape:
+                arrays[name] = np.frombuffer(f.read(dtype.itemsize * int(np.prod(shape))),
+                                             dtype=dtype).reshape(shape)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(),
+                                         shape=shape, order="F" if fortran_order else "C")
+    return arrays
+
+
+def _datetime64_array(times):
+    """
+    Convert times to a 1-D `numpy.datetime64` array.
+
+    Datetime64 and pandas inputs are kept at full (ns) precision, which
+    `~sunpy.time.parse_time` truncates to us; anything else goes through
+    `~sunpy.time.parse_time`.
+    """
+    if not isinstance(times, Time):
+        times = np.atleast_1d(times)
+        if times.dtype.kind == "M":
+            return times.astype("datetime64[ns]")
+        index = pandas.Index(times)
+        if isinstance(index, pandas.DatetimeIndex) or index.empty:
+            return index.values.astype("datetime64[ns]")
+    return np.atleast_1d(parse_time(times).datetime64)
+
+
+def _time_datetime64(times):
+    """
+    Convert a `~astropy.time.Time` array to UTC `numpy.datetime64` values in ns.
+
+    The calendar fields are computed by `erfa.d2dtf`, which avoids the string
+    formatting behind ``Time.datetime64``. A leap second folds onto the
+    following second.
+    """
+    utc = times.utc
+    year, month, day, hmsf = erfa.d2dtf('UTC', 9, utc.jd1, utc.jd2)
+    dates = ((year - 1970).astype('datetime64[Y]') + (month - 1).astype('timedelta64[M]'))
+    dates = dates.astype('datetime64[D]') + (day - 1).astype('timedelta64[D]')
+    seconds = (hmsf['h'].astype(np.int64) * 3600 + hmsf['m'] * 60 + hmsf['s'])
+    return (dates.astype('datetime64[ns]') + seconds.astype('timedelta64[s]')
+            + hmsf['f'].astype('timedelta64[ns]'))
+
+
+def _satellite_numbers(satellite):
+    """
+    Convert ``satellite`` to an integer array, checking all are valid GOES numbers.
+    """
+    satellite = np.asarray(satellite).astype(int)
+    if np.any(satellite < 1):
+        raise ValueError("satellite must be the number of a "
+                         "valid GOES satellite (>1).")
+    return satellite
+
+
+def _check_out_of_range(out_of_range):
+    """
+    Check ``out_of_range`` is a valid choice of the CHIANTI table kernels.
+    """
+    if out_of_range not in ("raise", "nan"):
+        raise ValueError("out_of_range must be 'raise' or 'nan'.")
+
+
+def _satellite_groups(satellite, shape):
+    """
+    Split samples of the given ``shape`` by the GOES satellite observing them.
+
+    Returns a list of ``(satellite, index)`` pairs, one per distinct
+    satellite, where ``index`` selects the samples observed by that
+    satellite.  A scalar ``satellite`` applies to all samples and gives a
+    single pair with ``index=Ellipsis``.
+    """
+    satellite = _satellite_numbers(satellite)
+    if satellite.ndim == 0:
+        return [(int(satellite), Ellipsis)]
+    if satellite.shape != shape:
+        raise ValueError("satellite must be a scalar or have the same shape "
+                         "as the flux arrays.")
+    return [(int(sat), satellite == sat) for sat in np.unique(satellite)]
+
+
+def _obstime_seconds(obstime):
+    """
+    Parse measurement times and return them in seconds from the first.
+
+    Raises a `ValueError` if the times are not in chronological order.
+    """
+    obstime = parse_time(obstime)
+    seconds = (obstime - obstime[0]).sec
+    _assert_chrono_order(seconds)
+    return seconds
+
+
+def _assert_chrono_order(times, name="obstime"):
+    """
+    Check that times are strictly increasing.
+
+    ``times`` is an array of float seconds or of `numpy.datetime64`.  The
+    `ValueError` raised otherwise gives the first element which is not
+    after the one before it.
+    """
+    times = np.asarray(times)
+    step = np.diff(times)
+    # Written so that NaN steps also fail the check
+    not_increasing = ~(step > np.zeros(1, dtype=step.dtype))
+    if not_increasing.any():
+        index = np.argmax(not_increasing) + 1
+        raise ValueError(f"Elements of {name} must be in chronological order, but "
+                         f"element {index} is not after element {index - 1}.")
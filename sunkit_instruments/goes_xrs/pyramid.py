@@ -0,0 +1,235 @@
+"""
+A multi-resolution summary of GOES/XRS time series.
+"""
+import numpy as np
+import pandas
+
+import astropy.units as u
+from astropy.time import TimeDelta
+from sunpy import timeseries
+
+from sunkit_instruments.goes_xrs.goes_xrs import _assert_chrono_order, _datetime64_array
+
+__all__ = ['XRSPyramid']
+
+
+class XRSPyramid:
+    """
+    Multi-resolution summary of GOES/XRS fluxes and derived quantities.
+
+    Level ``k`` of the pyramid holds the minimum, maximum and mean of each
+    column over time bins of ``base * 2**k``, aligned to the Unix epoch, so
+    a plot of any time range can be drawn from a few bins per pixel
+    instead of from the samples.  The bins of each level are built from
+    those of the level below, and samples are added with `append` as they
+    arrive.  Each append only updates the last bin of each level and adds
+    new ones, so it costs time proportional to the number of new samples.
+    NaN values are ignored.
+
+    Parameters
+    ----------
+    base : `~astropy.units.Quantity` or `~astropy.time.TimeDelta`, optional
+        Width of the bins of level 0.  Defaults to 1 s.
+    columns : sequence of `str`, optional
+        The columns to summarize.  Defaults to all numeric columns of the
+        first data appended, e.g. the fluxes, temperature and emission
+        measure returned by
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+    levels : `int`, optional
+        Number of levels.  Defaults to 32, which with 1 s bins gives a
+        top level with bins of 68 years.
+
+    Examples
+    --------
+    >>> import sunpy.timeseries as ts
+    >>> from sunkit_instruments.goes_xrs import XRSPyramid, calculate_temperature_em
+    >>> from sunpy.data.sample import GOES_XRS_TIMESERIES  # doctest: +REMOTE_DATA
+    >>> goests = ts.TimeSeries(GOES_XRS_TIMESERIES)  # doctest: +REMOTE_DATA +IGNORE_WARNINGS
+    >>> pyramid = XRSPyramid()
+    >>> pyramid.append(calculate_temperature_em(goests))  # doctest: +REMOTE_DATA
+    >>> pyramid.query("2011-06-07 06:00", "2011-06-07 08:00",
+    ...               max_points=500)  # doctest: +REMOTE_DATA +SKIP
+    """
+
+    def __init__(self, base=1 * u.s, columns=None, levels=32):
+        self.base = int(round(TimeDelta(base).to_value(u.ns)))
+        if not self.base > 0:
+            raise ValueError("base must be a positive time interval")
+        self.columns = None if columns is None else list(columns)
+        self._levels = [None] * levels
+        self.last_time = None
+
+    @property
+    def levels(self):
+        """
+        Number of levels of the pyramid.
+        """
+        return len(self._levels)
+
+    def bin_width(self, level):
+        """
+        Width of the bins of ``level`` as a `numpy.timedelta64`.
+        """
+        return np.timedelta64(self.base << level, "ns")
+
+    def append(self, data):
+        """
+        Add new samples to all levels.
+
+        Parameters
+        ----------
+        data : `~pandas.DataFrame` or `~sunpy.timeseries.sources.XRSTimeSeries`
+            The new samples, indexed by time.  They must be after those
+            already appended.
+        """
+        if isinstance(data, timeseries.GenericTimeSeries):
+            data = data.to_dataframe()
+        if self.columns is None:
+            self.columns = list(data.select_dtypes("number").columns)
+        times = _datetime64_array(data.index)
+        if len(times) == 0:
+            return
+        _assert_chrono_order(times if self.last_time is None
+                             else np.concatenate([[self.last_time], times]), name="times")
+        values = data[self.columns].to_numpy(dtype=float)
+
+        valid = ~np.isnan(values)
+        stats = np.stack([values, values, np.where(valid, values, 0), valid], axis=1)
+        bins = times.astype(np.int64) // self.base
+        samples = np.ones(len(bins), dtype=np.int64)
+        for level in range(self.levels):
+            if level:
+                # Two bins of the level below make one bin of this level.
+                bins = bins >> 1
+            bins, samples, stats = _aggregate_bins(bins, samples, stats)
+            if self._levels[level] is None:
+                self._levels[level] = _PyramidLevel(len(self.columns))
+            self._levels[level].append(bins, samples, stats)
+        self.last_time = times[-1]
+
+    def level(self, level, start=None, end=None):
+        """
+        The bins of one level, optionally only those overlapping a time range.
+
+        Parameters
+        ----------
+        level : `int`
+            The level, from 0 for the narrowest bins.
+        start, end : `~sunpy.time.parse_time` parsable objects, optional
+            The time range.  Default to the first and last sample.
+
+        Returns
+        -------
+        `~pandas.DataFrame`
+            One row per non-empty bin, indexed by the start time of the
+            bin, with ``<column>_min``, ``<column>_max`` and ``<column>_mean``
+            for each column and the number of samples, ``count``.
+        """
+        names = [f"{column}_{stat}" for column in self.columns or []
+                 for stat in ("min", "max", "mean")] + ["count"]
+        if self._levels[level] is None:
+            return pandas.DataFrame(columns=names, index=pandas.DatetimeIndex([]), dtype=float)
+        bins, samples, stats = self._levels[level].arrays()
+        width = self.base << level
+        first, last = 0, len(bins)
+        if start is not None:
+            first = np.searchsorted(bins, _time_ns(start) // width)
+        if end is not None:
+            last = np.searchsorted(bins, _time_ns(end) // width, side="right")
+        bins, samples, stats = bins[first:last], samples[first:last], stats[first:last]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = stats[:, 2] / stats[:, 3]
+        columns = np.stack([stats[:, 0], stats[:, 1], mean], axis=2).reshape(len(bins),
+                                                                             3 * len(self.columns))
+        index = pandas.DatetimeIndex((bins * width).astype("datetime64[ns]"))
+        frame = pandas.DataFrame(columns, columns=names[:-1], index=index)
+        frame["count"] = samples
+        return frame
+
+    def query(self, start, end, max_points=1000):
+        """
+        The bins of the narrowest level giving at most ``max_points`` bins in a time range.
+
+        Parameters
+        ----------
+        start, end : `~sunpy.time.parse_time` parsable objects
+            The time range.
+        max_points : `int`, optional
+            The maximum number of bins, e.g. the width of a plot in pixels.
+            Defaults to 1000.
+
+        Returns
+        -------
+        `~pandas.DataFrame`
+            The bins overlapping the time range, see `level`.  Its
+            ``attrs["level"]`` and ``attrs["bin_width"]`` give the level
+            used and the width of its bins.
+        """
+        start_ns, end_ns = _time_ns(start), _time_ns(end)
+        if end_ns < start_ns:
+            raise ValueError("end must not be before start.")
+        level = next((level for level in range(self.levels)
+                      if end_ns // (self.base << level) - start_ns // (self.base << level)
+                      < max_points), self.levels - 1)
+        frame = self.level(level, start, end)
+        frame.attrs["level"] = level
+        frame.attrs["bin_width"] = self.bin_width(level)
+        return frame
+
+
+class _PyramidLevel:
+    """
+    The statistics of the time bins of one level of an `XRSPyramid`.
+
+    The arrays grow by doubling their capacity, so appending is amortized
+    constant time per bin.  ``stats`` holds, for each bin, the minimum,
+    maximum, sum and number of valid values of each column.
+    """
+
+    def __init__(self, n_columns):
+        self.size = 0
+        self.bins = np.empty(0, dtype=np.int64)
+        self.samples = np.empty(0, dtype=np.int64)
+        self.stats = np.empty((0, 4, n_columns))
+
+    def arrays(self):
+        return self.bins[:self.size], self.samples[:self.size], self.stats[:self.size]
+
+    def append(self, bins, samples, stats):
+        """
+        Append bins after those held, merging a bin equal to the last one held.
+        """
+        if self.size and bins[0] == self.bins[self.size - 1]:
+            last, new = self.stats[self.size - 1], stats[0]
+            self.samples[self.size - 1] += samples[0]
+            self.stats[self.size - 1] = [np.fmin(last[0], new[0]), np.fmax(last[1], new[1]),
+                                         last[2] + new[2], last[3] + new[3]]
+            bins, samples, stats = bins[1:], samples[1:], stats[1:]
+        size = self.size + len(bins)
+        if size > len(self.bins):
+            capacity = max(size, 2 * len(self.bins))
+            self.bins = np.resize(self.bins, capacity)
+            self.samples = np.resize(self.samples, capacity)
+            self.stats = np.resize(self.stats, (capacity,) + self.stats.shape[1:])
+        self.bins[self.size:size] = bins
+        self.samples[self.size:size] = samples
+        self.stats[self.size:size] = stats
+        self.size = size
+
+
+def _time_ns(time):
+    """
+    A single time as integer ns since the Unix epoch.
+    """
+    return int(_datetime64_array(time)[0].astype("datetime64[ns]").astype(np.int64))
+
+
+def _aggregate_bins(bins, samples, stats):
+    """
+    Combine consecutive rows of statistics with the same bin, see `_PyramidLevel`.
+    """
+    starts = np.flatnonzero(np.concatenate([[True], bins[1:] != bins[:-1]]))
+    return (bins[starts], np.add.reduceat(samples, starts),
+            np.stack([np.fmin.reduceat(stats[:, 0], starts), np.fmax.reduceat(stats[:, 1], starts),
+                      np.add.reduceat(stats[:, 2], starts), np.add.reduceat(stats[:, 3], starts)],
+                     axis=1))
@@ -0,0 +1,213 @@
+"""
+Batch reprocessing of GOES/XRS files into derived quantities.
+"""
+import os
+import glob
+import time
+import argparse
+from itertools import repeat, dropwhile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas
+
+from sunpy import timeseries
+from sunpy.data import manager
+from sunpy.util.config import get_and_create_download_dir
+
+from sunkit_instruments.goes_xrs.goes_xrs import (
+    CHIANTI_ENGINES,
+    FILE_TEMP_COR,
+    FILE_TEMP_PHO,
+    THERMODYNAMIC_QUANTITIES,
+    _RemoteTableURLs,
+    calculate_thermodynamics,
+    radiative_loss_rate_kernel,
+    temperature_em_kernel,
+)
+
+__all__ = ['reprocess_goes_files']
+
+
+def reprocess_goes_files(files, output_dir, quantities=THERMODYNAMIC_QUANTITIES,
+                         abundances="coronal", download_dir=None, engine="spline",
+                         max_workers=None, mp_context=None):
+    """
+    Calculates the GOES derived quantities of many GOES/XRS files in a process pool.
+
+    Each file is read with `sunpy.timeseries.TimeSeries`, its derived
+    quantities are found with
+    `~sunkit_instruments.goes_xrs.calculate_thermodynamics` and written to
+    ``output_dir`` as a csv file named after the input file, e.g.
+    ``go1520110607.fits`` gives ``go1520110607.csv``.  The files are shared
+    out over a pool of worker processes.  The CHIANTI tables are downloaded
+    once, before the pool is started, and every worker fits them once when
+    it starts rather than for each file.  A file which fails does not stop
+    the others; its error is reported instead.
+
+    Parameters
+    ----------
+    files : `str` or iterable of `str` or `pathlib.Path`
+        The input files, or a glob pattern matching them.  The files
+        matching a pattern are processed in sorted order.
+    output_dir : `str` or `pathlib.Path`
+        The directory to write the csv files to.  It is created if needed.
+    quantities : iterable of `str`, optional
+        The quantities to calculate. See
+        `~sunkit_instruments.goes_xrs.calculate_thermodynamics`.
+        Defaults to all of them.
+    abundances : {'coronal' | 'photospheric'}, optional
+        States whether "photospheric" or "coronal" abundances should be
+        assumed, default to 'coronal'.
+    download_dir : `str`, optional
+        The directory to download the GOES data files to, defaults to the
+        default download directory.
+    engine : {'spline' | 'grid'}, optional
+        How the fits to the CHIANTI lookup tables are evaluated. See
+        `~sunkit_instruments.goes_xrs.calculate_temperature_em`.
+        Defaults to 'spline'.
+    max_workers : `int`, optional
+        The number of worker processes, defaults to the number of CPUs.
+    mp_context : `multiprocessing.context.BaseContext`, optional
+        The context used to start the workers, defaults to the default
+        context of `multiprocessing`.
+
+    Returns
+    -------
+    `~pandas.DataFrame`
+        One row per input file, in the order of ``files``, with columns:
+
+        | file - The input file
+        | output - The csv file written, or `None` if the file failed
+        | seconds - The wall time spent on the file in its worker [s]
+        | error - The error raised for the file, or `None` if it succeeded
+
+    Examples
+    --------
+    >>> from sunkit_instruments.goes_xrs import reprocess_goes_files
+    >>> report = reprocess_goes_files("goes/*.fits", "derived")  # doctest: +SKIP
+    >>> report[report.error.notna()]  # doctest: +SKIP
+    """
+    if isinstance(files, str):
+        files = sorted(glob.glob(files))
+    files = [str(file) for file in files]
+    outputs = [os.path.join(str(output_dir), os.path.splitext(os.path.basename(file))[0] + ".csv")
+               for file in files]
+    if len(set(outputs)) != len(outputs):
+        raise ValueError("The names of the input files must be unique, as the output "
+                         "files are named after them.")
+    quantities = tuple(quantities)
+    if not set(quantities).issubset(THERMODYNAMIC_QUANTITIES):
+        raise ValueError("quantities must be any of {}.".format(
+            ", ".join(repr(q) for q in THERMODYNAMIC_QUANTITIES)))
+    os.makedirs(output_dir, exist_ok=True)
+    if not download_dir:
+        download_dir = get_and_create_download_dir()
+    # Fetch any missing tables here, so the workers do not all download them.
+    _preload_chianti_tables(abundances, download_dir, engine)
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                             initializer=_preload_chianti_tables,
+                             initargs=(abundances, download_dir, engine)) as executor:
+        results = list(executor.map(_reprocess_goes_file, files, outputs,
+                                    repeat(quantities),
+                                    repeat(abundances),
+                                    repeat(download_dir),
+                                    repeat(engine)))
+    return pandas.DataFrame(results, columns=["file", "output", "seconds", "error"])
+
+
+def _preload_chianti_tables(abundances, download_dir, engine):
+    """
+    Fit the CHIANTI tables for all satellites in the cache of this process.
+
+    A table that cannot be fitted is skipped, so that the error is reported
+    for the files that need it rather than breaking the whole process pool.
+    """
+    try:
+        satellites = _chianti_table_satellites(abundances)
+    except Exception:
+        return
+    # A flux ratio of 0.1 is within the tables of all satellites.
+    longflux, shortflux = np.array([1e-5]), np.array([1e-6])
+    for satellite in range(1, satellites + 1):
+        try:
+            temperature_em_kernel(longflux, shortflux, satellite=satellite,
+                                  abundances=abundances, download_dir=download_dir,
+                                  engine=engine)
+        except Exception:
+            pass
+    try:
+        radiative_loss_rate_kernel(np.array([10.]), np.array([1e49]),
+                                   download_dir=download_dir, engine=engine)
+    except Exception:
+        pass
+
+
+@manager.require('file_temp_cor',
+                 _RemoteTableURLs(FILE_TEMP_COR),
+                 '3d8ddaaabf0faf75ba8d15e0c468896ce3d7622cc23076bf91437951e0ab3ad4')
+@manager.require('file_temp_pho',
+                 _RemoteTableURLs(FILE_TEMP_PHO),
+                 'dd8c6b949a492174146a0b7307dd5fb197236431dbbedfdbab2e3f8dcd360267')
+def _chianti_table_satellites(abundances):
+    """
+    The highest GOES satellite number in the CHIANTI temperature table.
+    """
+    data_file = manager.get('file_temp_cor' if abundances == "coronal" else 'file_temp_pho')
+    with open(data_file, "r") as csvfile:
+        header = next(dropwhile(lambda l: l.startswith("#"), csvfile))
+    return max(int(name[len("ratioGOES"):]) for name in header.strip().split(";")
+               if name.startswith("ratioGOES"))
+
+
+def _reprocess_goes_file(file, output, quantities, abundances, download_dir, engine):
+    """
+    Calculate and write the derived quantities of one file for `reprocess_goes_files`.
+    """
+    start = time.perf_counter()
+    try:
+        goests = timeseries.TimeSeries(file)
+        derived = calculate_thermodynamics(goests, quantities, abundances=abundances,
+                                           download_dir=download_dir, derived_only=True,
+                                           engine=engine)
+        derived.to_csv(output)
+    except Exception as err:
+        return file, None, time.perf_counter() - start, f"{type(err).__name__}: {err}"
+    return file, output, time.perf_counter() - start, None
+
+
+def main(argv=None):
+    """
+    Command line entry point of `~sunkit_instruments.goes_xrs.reprocess_goes_files`.
+
+    Prints the time taken by each file and any errors, and returns a
+    non-zero exit status if any file failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="sunkit-goes-reprocess",
+        description="Calculate GOES/XRS derived quantities for many files in parallel.")
+    parser.add_argument("files", nargs="+",
+                        help="input files, or glob patterns matching them")
+    parser.add_argument("-o", "--output-dir", required=True,
+                        help="directory to write the csv files to")
+    parser.add_argument("-q", "--quantities", nargs="+", choices=THERMODYNAMIC_QUANTITIES,
+                        default=THERMODYNAMIC_QUANTITIES, help="quantities to calculate")
+    parser.add_argument("--abundances", choices=("coronal", "photospheric"),
+                        default="coronal")
+    parser.add_argument("--engine", choices=CHIANTI_ENGINES, default="spline")
+    parser.add_argument("-j", "--max-workers", type=int, default=None,
+                        help="number of worker processes, defaults to the number of CPUs")
+    args = parser.parse_args(argv)
+
+    # Patterns are expanded here too, for shells which do not expand them.
+    files = [file for pattern in args.files for file in (sorted(glob.glob(pattern)) or [pattern])]
+    report = reprocess_goes_files(files, args.output_dir, args.quantities,
+                                  abundances=args.abundances, engine=args.engine,
+                                  max_workers=args.max_workers)
+    for row in report.itertuples():
+        print(f"{row.file}: {row.seconds:.2f} s" + (f", {row.error}" if row.error else ""))
+    failed = report.error.notna().sum()
+    print(f"{len(report) - failed} of {len(report)} files processed in "
+          f"{report.seconds.sum():.2f} s of worker time.")
+    return 1 if failed else 0
@@ -0,0 +1,59 @@
+import contextlib
+
+import numpy as np
+import pytest
+
+from sunkit_instruments.goes_xrs import goes_xrs as goes
+
+# Satellites for which columns are written to the mock CHIANTI tables.
+MOCK_SATELLITES = range(1, 17)
+# Modelled temperatures of the mock tables, in log_10 space in units of MK.
+MOCK_LOG10TEMP = np.linspace(-0.5, 2, 101)
+
+
+def _write_mock_csv(path, column, values):
+    header = ";".join(["log10temp_MK"] + [f"{column}{sat}" for sat in MOCK_SATELLITES])
+    with open(path, "w") as f:
+        f.write("# Mock CHIANTI table for testing\n")
+        f.write(header + "\n")
+        for i, log10temp in enumerate(MOCK_LOG10TEMP):
+            row = [log10temp] + [values(sat)[i] for sat in MOCK_SATELLITES]
+            f.write(";".join(repr(float(v)) for v in row) + "\n")
+
+
+@pytest.fixture
+def mock_chianti_tables(tmp_path):
+    """
+    Replace the remote CHIANTI tables with small synthetic tables.
+
+    The tables have the same layout as the real ones but smooth, monotonic
+    made-up values, so results only need to be self-consistent.
+    """
+    def ratio(sat):
+        return 1e-3 + 0.4 * ((MOCK_LOG10TEMP + 0.5) / 2.5) ** 1.5 * (1 + sat / 100)
+
+    def longflux(sat):
+        return 10 ** (MOCK_LOG10TEMP - 0.1 * (MOCK_LOG10TEMP - 1) ** 2) * (1 + sat / 50)
+
+    files = {
+        "file_temp_cor": ("temp_cor.csv", "ratioGOES", ratio),
+        "file_temp_pho": ("temp_pho.csv", "ratioGOES", lambda sat: 0.9 * ratio(sat)),
+        "file_em_cor": ("em_cor.csv", "longfluxGOES", longflux),
+        "file_em_pho": ("em_pho.csv", "longfluxGOES", lambda sat: 0.5 * longflux(sat)),
+    }
+    paths = {}
+    for name, (filename, column, values) in files.items():
+        paths[name] = tmp_path / filename
+        _write_mock_csv(paths[name], column, values)
+    paths["file_rad_cor"] = tmp_path / "rad_loss.txt"
+    with open(paths["file_rad_cor"], "w") as f:
+        f.write("".join(f"; header line {i}\n" for i in range(7)))
+        for temp in np.logspace(5, 8, 61):
+            f.write(f"{temp!r} {1e-22 * (temp / 1e7) ** -0.5!r}\n")
+
+    goes.clear_chianti_cache()
+    with contextlib.ExitStack() as stack:
+        for name, path in paths.items():
+            stack.enter_context(goes.manager.override_file(name, str(path)))
+        yield paths
+    goes.clear_chianti_cache()
@@ -1,19 +1,29 @@
+import sys
 import copy
+import zipfile
+import textwrap
+import subprocess
+import multiprocessing
 
 import numpy as np
+import pandas
 import pytest
 from numpy.testing import assert_almost_equal, assert_array_equal
 from pandas.testing import assert_frame_equal
+from scipy.integrate import trapz
 
 import astropy.units as u
+from astropy.table import Table
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.time import Time
 from astropy.units.quantity import Quantity
 from sunpy import timeseries
 from sunpy.time import TimeRange, is_time_equal, parse_time
+from sunpy.util.exceptions import SunpyUserWarning
 
 from sunkit_instruments import goes_xrs as goes
 from sunkit_instruments.data.test import get_test_filepath
+from sunkit_instruments.goes_xrs import goes_xrs, reprocess
 
 # Define input variables to be used in test functions for
 # _goes_chianti_tem.
@@ -22,6 +32,36 @@ SHORTFLUX = Quantity([7e-7], unit="W/m**2")
 DATE = "2014-04-16"
 
 
+def test_import_makes_no_network_calls():
+    # Importing must not resolve the remote host, see goes._goes_remote_path.
+    code = textwrap.dedent("""
+        import socket
+
+        def fail(*args, **kwargs):
+            raise AssertionError("socket call during import")
+
+        for name in ["gethostbyname", "gethostbyname_ex", "getaddrinfo", "create_connection"]:
+            setattr(socket, name, fail)
+        socket.socket.connect = fail
+
+        import sunkit_instruments.goes_xrs
+        """)
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_remote_path_is_lazy(mocker):
+    mocker.patch.object(goes_xrs, "_GOES_REMOTE_PATH", None)
+    gethostbyname_ex = mocker.patch("socket.gethostbyname_ex",
+                                    return_value=("resolved.example.com", [], []))
+    urls = goes_xrs._RemoteTableURLs(goes_xrs.FILE_TEMP_COR)
+    assert not gethostbyname_ex.called
+    assert list(urls) == ["http://resolved.example.com/ssw/gen/idl/synoptic/goes/"
+                          "goes_chianti_temp_cor.csv"]
+    assert goes_xrs.GOES_REMOTE_PATH == "http://resolved.example.com/ssw/gen/idl/synoptic/goes/"
+    # The resolved path is remembered
+    assert gethostbyname_ex.call_count == 1
+
+
 @pytest.mark.remote_data
 def test_goes_event_list():
     # Set a time range to search
@@ -65,6 +105,166 @@ def test_goes_event_list():
     assert result[0]['noaa_active_region'] == 11226
 
 
+class FakeHEKClient:
+    """
+    Stands in for `sunpy.net.hek.HEKClient`, serving a fixed list of flares.
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self.searches = []
+        # The number of times the search starting at a given time fails.
+        self.failures = {}
+
+    def search(self, *query):
+        times = next(attr for attr in query if hasattr(attr, "start"))
+        self.searches.append((times.start.isot, times.end.isot))
+        if self.failures.get(times.start.isot, 0) > 0:
+            self.failures[times.start.isot] -= 1
+            raise OSError("Failed to load return from the HEKClient.")
+        events = [event for event in self.events
+                  if event[1] <= times.end.isot and event[3] >= times.start.isot]
+        # The HEK compares GOES classes as strings.
+        for attr in query:
+            if getattr(attr, "name", None) == "FL_GOESCls":
+                assert attr.operator == ">"
+                events = [event for event in events if event[4] > attr.value]
+        if not events:
+            return Table()
+        names = ["kb_archivid", "event_starttime", "event_peaktime", "event_endtime",
+                 "fl_goescls", "event_coord1", "event_coord2", "ar_noaanum"]
+        table = Table(rows=events, names=names)
+        for name in names[1:4]:
+            table[name] = Time(table[name])
+        return table
+
+
+@pytest.fixture
+def fake_hek(mocker):
+    client = FakeHEKClient([
+        ("ivo://1", "2011-06-06T22:00:00", "2011-06-06T22:10:00", "2011-06-07T00:30:00",
+         "C1.2", -30, 10, 11225),
+        ("ivo://2", "2011-06-07T06:16:00", "2011-06-07T06:41:00", "2011-06-07T06:59:00",
+         "M2.5", 54, -21, 11226),
+        ("ivo://3", "2011-06-07T13:00:00", "2011-06-07T13:05:00", "2011-06-07T13:20:00",
+         "B5.0", 10, 5, 0),
+        ("ivo://4", "2011-06-08T09:00:00", "2011-06-08T09:10:00", "2011-06-08T09:30:00",
+         "M1.0", 60, -20, 11226),
+    ])
+    mocker.patch("sunpy.net.hek.HEKClient", return_value=client)
+    return client
+
+
+def test_goes_event_list_cache(fake_hek, tmp_path):
+    path = tmp_path / "events.sqlite"
+    day = TimeRange("2011-06-07 00:00", "2011-06-08 00:00")
+    uncached = goes.get_goes_event_list(day)
+    fake_hek.searches.clear()
+    result = goes.get_goes_event_list(day, cache=path)
+    assert [event["goes_class"] for event in result] == [
+        event["goes_class"] for event in uncached]
+    assert fake_hek.searches == [("2011-06-07T00:00:00.000", "2011-06-08T00:00:00.000")]
+    assert [event["goes_class"] for event in result] == ["C1.2", "M2.5", "B5.0"]
+    assert result[1]["event_date"] == "2011-06-07"
+    assert result[1]["goes_location"] == (54, -21)
+    assert type(result[1]["noaa_active_region"]) == np.int64
+    assert result[1]["noaa_active_region"] == 11226
+    for key in ["start_time", "peak_time", "end_time"]:
+        assert isinstance(result[1][key], Time)
+    assert is_time_equal(result[1]["peak_time"], parse_time((2011, 6, 7, 6, 41)))
+
+    # The class filter is answered from the store without another search.
+    result = goes.get_goes_event_list(day, goes_class_filter="c1", cache=path)
+    assert [event["goes_class"] for event in result] == ["C1.2", "M2.5"]
+    assert len(fake_hek.searches) == 1
+
+    # Only the uncovered part of an overlapping range is searched for, and
+    # the store persists between sessions.
+    with goes.GOESEventStore(path) as store:
+        result = goes.get_goes_event_list(
+            TimeRange("2011-06-07 12:00", "2011-06-08 12:00"), goes_class_filter="C9", cache=store)
+        assert fake_hek.searches[1:] == [("2011-06-08T00:00:00.000", "2011-06-08T12:00:00.000")]
+        assert [event["goes_class"] for event in result] == ["M1.0"]
+        assert len(store) == 4
+        assert store.missing(TimeRange("2011-06-06 12:00", "2011-06-09 00:00")) == [
+            TimeRange("2011-06-06 12:00", "2011-06-07 00:00"),
+            TimeRange("2011-06-08 12:00", "2011-06-09 00:00")]
+        assert store.missing(TimeRange("2011-06-07 06:00", "2011-06-08 06:00")) == []
+
+
+def test_goes_event_list_class_filter(fake_hek):
+    trange = TimeRange("2011-06-06 12:00", "2011-06-08 12:00")
+    # As strings, "X10" < "X2" and "M2.5" < "m0.99"
+    fake_hek.events.append(("ivo://5", "2011-06-08T10:00:00", "2011-06-08T10:10:00",
+                            "2011-06-08T10:30:00", "X10", 0, 0, 11227))
+    # Only flares above the filter class are listed, with or without the store
+    for goes_class_filter, expected in (("M1", ["M2.5", "X10"]),
+                                        ("m0.99", ["M2.5", "M1.0", "X10"]),
+                                        ("X2", ["X10"])):
+        uncached = goes.get_goes_event_list(trange, goes_class_filter=goes_class_filter)
+        with goes.GOESEventStore(":memory:") as store:
+            cached = goes.get_goes_event_list(trange, goes_class_filter=goes_class_filter,
+                                              cache=store)
+        assert [event["goes_class"] for event in uncached] == expected
+        assert [event["goes_class"] for event in cached] == expected
+    # Invalid classes have no flux
+    classes = np.array(["M1.0", "", "Q2", "X1e"], dtype=object)
+    assert_array_equal(goes_xrs._event_class_flux(classes), [1e-5, np.nan, np.nan, np.nan])
+
+
+def test_goes_event_list_windows(fake_hek):
+    trange = TimeRange("2011-06-06 12:00", "2011-06-08 12:00")
+    expected = goes.get_goes_event_list(trange)
+    fake_hek.searches.clear()
+    # The first flare spans two windows but is only listed once.
+    fake_hek.failures["2011-06-07T12:00:00.000"] = 2
+    result = goes.get_goes_event_list(trange, window=12 * u.hour, max_workers=2)
+    assert result == expected
+    starts = [start for start, end in fake_hek.searches]
+    assert sorted(set(starts)) == ["2011-06-06T12:00:00.000", "2011-06-07T00:00:00.000",
+                                   "2011-06-07T12:00:00.000", "2011-06-08T00:00:00.000"]
+    assert starts.count("2011-06-07T12:00:00.000") == 3
+
+    # A window that keeps failing fails the whole search.
+    fake_hek.failures["2011-06-07T12:00:00.000"] = 2
+    with pytest.raises(OSError):
+        goes.get_goes_event_list(trange, window=12 * u.hour, retries=1)
+    with pytest.raises(ValueError, match="positive"):
+        goes.get_goes_event_list(trange, window=0 * u.hour)
+
+
+def test_goes_event_list_dataframe(fake_hek):
+    trange = TimeRange("2011-06-06 12:00", "2011-06-08 00:00")
+    events = goes.get_goes_event_list(trange)
+    frame = goes.get_goes_event_list(trange, as_dataframe=True)
+    assert list(frame.columns) == ["start_time", "peak_time", "end_time", "goes_class",
+                                   "class_letter", "peak_flux", "event_coord1", "event_coord2",
+                                   "noaa_active_region"]
+    for key in ["start_time", "peak_time", "end_time"]:
+        assert frame[key].dtype == np.dtype("datetime64[ns]")
+        assert_array_equal(frame[key].values,
+                           Time([event[key] for event in events]).datetime64)
+    assert list(frame["goes_class"]) == ["C1.2", "M2.5", "B5.0"]
+    assert frame["class_letter"].cat.ordered
+    assert list(frame["class_letter"].cat.categories) == ["A", "B", "C", "M", "X"]
+    assert list(frame["class_letter"]) == ["C", "M", "B"]
+    assert_almost_equal(frame["peak_flux"].values, [1.2e-6, 2.5e-5, 5e-7])
+    assert list(frame["noaa_active_region"]) == [11225, 11226, 0]
+    assert frame.loc[1, ["event_coord1", "event_coord2"]].tolist() == [54, -21]
+
+    # The store gives the same frame, with the class filter applied.
+    with goes.GOESEventStore(":memory:") as store:
+        assert_frame_equal(goes.get_goes_event_list(trange, as_dataframe=True, cache=store),
+                           frame)
+        cached = goes.get_goes_event_list(trange, goes_class_filter="C1", as_dataframe=True,
+                                          cache=store)
+        assert_frame_equal(cached, frame[frame["class_letter"] >= "C"].reset_index(drop=True))
+
+    empty = goes.get_goes_event_list(TimeRange("2012-01-01", "2012-01-02"), as_dataframe=True)
+    assert len(empty) == 0
+    assert empty.dtypes.equals(frame.dtypes)
+
+
 @pytest.fixture
 def goeslc():
     return timeseries.TimeSeries(get_test_filepath("go1520110607.fits"))
@@ -361,6 +561,20 @@ def test_calculate_xray_luminosity(goeslc):
     assert_quantity_allclose(exp_xrsb, goeslc_test.quantity("luminosity_xrsb")[:5])
 
 
+def test_calc_xraylum_per_sample():
+    dates = Time("2014-01-03") + np.arange(0, 370, 7.3) * u.day
+    flux = Quantity(np.full(len(dates), 1e-6), "W/m**2")
+    expected = Quantity([goes._calc_xraylum(flux[0], date=date) for date in dates])
+    xraylum = goes._calc_xraylum(flux, date=dates)
+    # Luminosity scales with the square of the interpolated distance.
+    assert_quantity_allclose(xraylum, expected, rtol=2e-6)
+    assert xraylum.max() / xraylum.min() > 1.06
+    assert_array_equal(goes.xray_luminosity_kernel(flux.value, date=dates.datetime64),
+                       xraylum.to_value("W"))
+    nat = np.array(["2014-01-03", "NaT"], dtype="datetime64[ns]")
+    assert np.isnan(goes.xray_luminosity_kernel(flux.value[:2], date=nat)).tolist() == [False, True]
+
+
 def test_goes_lx_errors():
     # Define input values of flux and time.
     longflux = 7e-6 * Quantity(np.ones(6), unit="W/m**2")
@@ -474,6 +688,23 @@ def test_flux_to_classletter():
     assert goes.flux_to_flareclass(2.1e-05 * u.watt/u.m**2) == 'M2.1'
 
 
+def test_flux_to_flareclass_array():
+    fluxes = Quantity(np.logspace(-10, -2, 1001), 'W/m**2')
+    flareclass = goes.flux_to_flareclass(fluxes)
+    assert isinstance(flareclass, np.ndarray)
+    assert_array_equal(flareclass, [goes.flux_to_flareclass(f) for f in fluxes])
+    # Arrays keep their shape
+    assert goes.flux_to_flareclass(fluxes.reshape(7, 143)).shape == (7, 143)
+    letters, subclass = goes.flux_to_flareclass(fluxes, split=True)
+    assert_array_equal(np.char.add(letters, np.char.mod('%.3g', subclass)), flareclass)
+    assert goes.flux_to_flareclass(4.7e-06 * u.watt/u.m**2, split=True) == ('C', 4.7)
+    assert_array_equal(goes.flux_to_flareclass(Quantity([0, np.nan, 1e-5], 'W/m**2')),
+                       ['A0', 'nan', 'M1'])
+    assert goes.flux_to_flareclass(Quantity([], 'W/m**2')).shape == (0,)
+    with pytest.raises(ValueError):
+        goes.flux_to_flareclass(Quantity([1e-5, -1e-5], 'W/m**2'))
+
+
 def test_class_to_flux():
     classes = ['A3.49', 'A0.23', 'M1', 'X2.3', 'M5.8', 'C2.3', 'B3.45', 'X20']
     results = Quantity([3.49e-8, 2.3e-9, 1e-5, 2.3e-4, 5.8e-5, 2.3e-6, 3.45e-7, 2e-3], 'W/m2')
@@ -481,9 +712,682 @@ def test_class_to_flux():
         assert_almost_equal(r.value, goes.flareclass_to_flux(c).value)
 
 
+def test_class_to_flux_array():
+    classes = ['A3.49', 'a0.23', 'M1', 'X2.3', 'M5.8', 'C2.3', 'B3.45', 'X20']
+    expected = Quantity([goes.flareclass_to_flux(c) for c in classes])
+    assert_quantity_allclose(goes.flareclass_to_flux(classes), expected, rtol=0)
+    assert_quantity_allclose(goes.flareclass_to_flux(np.array(classes)), expected, rtol=0)
+    assert_quantity_allclose(goes.flareclass_to_flux(pandas.Series(classes)), expected, rtol=0)
+    assert goes.flareclass_to_flux([]).shape == (0,)
+    for not_class in (None, 1e-5):
+        with pytest.raises(TypeError):
+            goes.flareclass_to_flux(not_class)
+    # Elements that are not strings are reported like any other invalid class
+    for not_classes in ([1e-5], ["M1", None], np.array(["M1", 1], dtype=object),
+                        pandas.Series(["M1", np.nan])):
+        with pytest.raises(ValueError, match=r"indices \[\d\]"):
+            goes.flareclass_to_flux(not_classes)
+
+
+def test_class_to_flux_errors():
+    with pytest.raises(TypeError):
+        goes.flareclass_to_flux(1)
+    with pytest.raises(ValueError, match="'Q1'"):
+        goes.flareclass_to_flux('Q1')
+    with pytest.raises(ValueError, match=r"indices \[1, 3, 4\]"):
+        goes.flareclass_to_flux(['M1', 'Q2', 'C1', 'M', ''])
+    for padded in (' c4.7 ', 'X 1', 'M1 '):
+        with pytest.raises(ValueError):
+            goes.flareclass_to_flux(padded)
+    with pytest.raises(ValueError, match=r"indices \[0, 2\]"):
+        goes.flareclass_to_flux([' c4.7 ', 'C4.7', 'X 1'])
+
+
 def test_joint_class_to_flux():
     classes = ['A3.49', 'A0.23', 'M1', 'X2.3', 'M5.8', 'C2.3', 'B3.45', 'X20']
     for c in classes:
         assert c == goes.flux_to_flareclass(goes.flareclass_to_flux(c))
 
 # TODO add a test to check for raising error
+
+
+def test_chianti_cache(mock_chianti_tables):
+    temp, em = goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15, date=DATE)
+    # One fit each for the temperature and emission measure tables.
+    assert goes.chianti_cache_info() == (0, 2, 2)
+    temp_cached, em_cached = goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15, date=DATE)
+    assert goes.chianti_cache_info() == (2, 2, 2)
+    assert_quantity_allclose(temp_cached, temp)
+    assert_quantity_allclose(em_cached, em)
+    # Each satellite and abundance gets its own fit.
+    goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=5, date=DATE)
+    goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15, date=DATE,
+                           abundances="photospheric")
+    assert goes.chianti_cache_info() == (2, 6, 6)
+    # Downloading a table discards the fits made from it.
+    goes._goes_get_chianti_temp(SHORTFLUX/LONGFLUX, satellite=15, download=True)
+    assert goes.chianti_cache_info() == (2, 7, 5)
+    goes.clear_chianti_cache()
+    assert goes.chianti_cache_info() == (0, 0, 0)
+
+
+def test_chianti_cache_rad_loss(mock_chianti_tables):
+    temp = Quantity([11.0, 11.0], unit="MK")
+    em = Quantity([4.0e+48, 4.0e+48], unit="1/cm**3")
+    rad_loss = goes._calc_rad_loss(temp, em)["rad_loss_rate"]
+    assert_quantity_allclose(goes._calc_rad_loss(temp, em)["rad_loss_rate"], rad_loss)
+    assert goes.chianti_cache_info() == (1, 1, 1)
+    goes._calc_rad_loss(temp, em, force_download=True)
+    assert goes.chianti_cache_info() == (1, 2, 1)
+
+
+def test_chianti_table_store(mock_chianti_tables, tmp_path, mocker):
+    temp = Quantity([11.0, 11.0], unit="MK")
+    em = Quantity([4.0e+48, 4.0e+48], unit="1/cm**3")
+    expected = goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15, date=DATE)
+    expected_rad_loss = goes._calc_rad_loss(temp, em)["rad_loss_rate"]
+    path = tmp_path / "tables.npz"
+    goes.write_chianti_table_store(path)
+    try:
+        goes.use_chianti_table_store(path)
+        store = goes_xrs._CHIANTI_TABLE_STORE
+        assert len(store) == 5
+        columns, values = store.get(mock_chianti_tables["file_em_cor"])
+        assert isinstance(values, np.memmap)
+        assert columns == ["log10temp_MK"] + [f"longfluxGOES{sat}" for sat in range(1, 17)]
+        assert goes.chianti_cache_info() == (0, 0, 0)
+        temp_em = goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15, date=DATE)
+        for result, expected_result in zip(temp_em, expected):
+            assert_quantity_allclose(result, expected_result, rtol=0)
+        assert_quantity_allclose(goes._calc_rad_loss(temp, em)["rad_loss_rate"],
+                                 expected_rad_loss, rtol=0)
+        # The hash of an unchanged file is only computed once
+        sha256 = mocker.spy(goes_xrs, "_file_sha256")
+        assert store.get(mock_chianti_tables["file_em_cor"])[1] is values
+        sha256.assert_not_called()
+        # A changed table is not in the store, so it is parsed from the text.
+        with open(mock_chianti_tables["file_em_cor"], "a") as f:
+            f.write("\n")
+        assert store.get(mock_chianti_tables["file_em_cor"]) is None
+        sha256.assert_called_once()
+        goes.clear_chianti_cache()
+        assert_quantity_allclose(goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, satellite=15,
+                                                        date=DATE)[1], expected[1], rtol=0)
+    finally:
+        goes.use_chianti_table_store(None)
+    np.savez(tmp_path / "old.npz", version=np.array(0))
+    with pytest.raises(ValueError, match="version 0"):
+        goes.use_chianti_table_store(tmp_path / "old.npz")
+    # Only the .npy formats whose headers are known are memory-mapped
+    with zipfile.ZipFile(tmp_path / "npy3.npz", "w") as archive:
+        with archive.open("version.npy", "w") as f:
+            np.lib.format.write_array(f, np.array(goes_xrs.CHIANTI_STORE_VERSION),
+                                      version=(3, 0))
+    with pytest.raises(ValueError, match="format version 3.0"):
+        goes.use_chianti_table_store(tmp_path / "npy3.npz")
+
+
+def test_derived_only(goeslc, mock_chianti_tables):
+    original = goeslc.to_dataframe().copy()
+    goeslc_new = goes.calculate_temperature_em(goeslc)
+    derived = goes.calculate_temperature_em(goeslc, derived_only=True)
+    assert list(derived.columns) == ["temperature", "em"]
+    assert derived.index is goeslc.to_dataframe().index
+    assert_frame_equal(derived, goeslc_new.to_dataframe()[["temperature", "em"]])
+    assert goeslc_new.units["temperature"] == u.MK
+
+    rad_loss = goes.calculate_radiative_loss_rate(goeslc)
+    derived = goes.calculate_radiative_loss_rate(goeslc, derived_only=True)
+    assert list(derived.columns) == ["temperature", "em", "rad_loss_rate"]
+    assert_frame_equal(derived, rad_loss.to_dataframe()[derived.columns])
+    # Only the radiative loss rate is new if temperature and EM are present
+    derived = goes.calculate_radiative_loss_rate(goeslc_new, derived_only=True)
+    assert list(derived.columns) == ["rad_loss_rate"]
+    assert_frame_equal(derived, rad_loss.to_dataframe()[derived.columns])
+
+    lum = goes.calculate_xray_luminosity(goeslc)
+    derived = goes.calculate_xray_luminosity(goeslc, derived_only=True)
+    assert_frame_equal(derived, lum.to_dataframe()[["luminosity_xrsa", "luminosity_xrsb"]])
+    # The input is never altered
+    assert_frame_equal(goeslc.to_dataframe(), original)
+
+
+def test_calculate_thermodynamics(goeslc, mock_chianti_tables, mocker):
+    earth_distance = mocker.spy(goes_xrs, "_earth_distance")
+    result = goes.calculate_thermodynamics(goeslc)
+    # The distances are shared by both channels
+    earth_distance.assert_called_once()
+    expected = goes.calculate_radiative_loss_rate(goeslc).to_dataframe()
+    lum = goes.calculate_xray_luminosity(goeslc).to_dataframe()
+    expected[["luminosity_xrsa", "luminosity_xrsb"]] = lum[["luminosity_xrsa", "luminosity_xrsb"]]
+    assert_frame_equal(result.to_dataframe(), expected)
+    assert result.units["rad_loss_rate"] == u.W
+
+    result = goes.calculate_thermodynamics(goeslc, ["em", "temperature"],
+                                           abundances="photospheric", derived_only=True)
+    expected = goes.calculate_temperature_em(goeslc, abundances="photospheric",
+                                             derived_only=True)
+    assert_frame_equal(result, expected)
+    result = goes.calculate_thermodynamics(goeslc, ["rad_loss_rate"], derived_only=True)
+    assert list(result.columns) == ["rad_loss_rate"]
+
+    with pytest.raises(TypeError):
+        goes.calculate_thermodynamics([])
+    with pytest.raises(ValueError):
+        goes.calculate_thermodynamics(goeslc, ["entropy"])
+
+
+def test_chianti_grid_engine(mock_chianti_tables):
+    longflux = Quantity(np.logspace(-7.4, -3, 10001), "W/m**2")
+    shortflux = longflux * np.linspace(0.01, 0.2, 10001)
+    temp, em = goes._goes_chianti_tem(longflux, shortflux, satellite=15)
+    temp_grid, em_grid = goes._goes_chianti_tem(longflux, shortflux, satellite=15,
+                                                engine="grid")
+    assert_quantity_allclose(temp_grid, temp, rtol=np.log(10) * goes_xrs.CHIANTI_GRID_TOLERANCE)
+    # The EM is also affected by the error in temperature
+    assert_quantity_allclose(em_grid, em, rtol=1e-5)
+    # For a given temperature the EM matches to the tolerance
+    em_grid = goes._goes_get_chianti_em(longflux, temp, satellite=15, engine="grid")
+    em = goes._goes_get_chianti_em(longflux, temp, satellite=15)
+    assert_quantity_allclose(em_grid, em, rtol=goes_xrs.CHIANTI_GRID_TOLERANCE)
+    rad_loss = goes._calc_rad_loss(temp, em)["rad_loss_rate"]
+    rad_loss_grid = goes._calc_rad_loss(temp, em, engine="grid")["rad_loss_rate"]
+    assert_quantity_allclose(rad_loss_grid, rad_loss, rtol=goes_xrs.CHIANTI_GRID_TOLERANCE)
+    # The table limits are still enforced
+    with pytest.raises(ValueError):
+        goes._goes_get_chianti_em(LONGFLUX, Quantity([101], "MK"), engine="grid")
+    with pytest.raises(ValueError):
+        goes._goes_chianti_tem(LONGFLUX, SHORTFLUX, engine="linear")
+
+
+def test_chianti_grid():
+    spline = goes_xrs._ChiantiSpline(np.linspace(0, 1, 20), np.exp(np.linspace(0, 1, 20) * 10))
+    x = np.linspace(0, 1, 100001)
+    grid = spline(x, engine="grid")
+    assert spline._grid.max_error <= goes_xrs.CHIANTI_GRID_TOLERANCE
+    np.testing.assert_allclose(grid, spline(x), rtol=goes_xrs.CHIANTI_GRID_TOLERANCE)
+    assert np.isnan(spline(np.array([np.nan]), engine="grid")).all()
+
+
+def test_chianti_grid_fallback(mocker):
+    # A grid too small for the tolerance falls back to the spline with a warning
+    mocker.patch.object(goes_xrs, "_CHIANTI_GRID_MAX_SIZE", 2**4 + 1)
+    spline = goes_xrs._ChiantiSpline(np.linspace(0, 1, 20), np.exp(np.linspace(0, 1, 20) * 10))
+    x = np.linspace(0, 1, 101)
+    with pytest.warns(SunpyUserWarning, match="spline engine is used instead"):
+        assert_array_equal(spline(x, engine="grid"), spline(x))
+    assert not spline._grid.converged
+    assert spline._grid.max_error > goes_xrs.CHIANTI_GRID_TOLERANCE
+    assert_array_equal(spline(x, engine="grid"), spline(x))
+
+
+def test_goes_chianti_tem_per_sample(mock_chianti_tables):
+    longflux = Quantity(np.logspace(-7, -4, 12), "W/m**2")
+    shortflux = longflux * np.linspace(0.02, 0.2, 12)
+    # A GOES 6 series spanning the 1983-Jun-28 calibration change, followed
+    # by GOES 7 and GOES 15 data.
+    satellite = np.repeat([6, 6, 7, 15], 3)
+    date = parse_time(["1983-06-27"] * 3 + ["1983-06-29"] * 3
+                      + ["1990-01-01"] * 3 + ["2014-04-16"] * 3)
+    temp, em = goes._goes_chianti_tem(longflux, shortflux, satellite=satellite, date=date)
+    for start in range(0, 12, 3):
+        segment = slice(start, start + 3)
+        temp_seg, em_seg = goes._goes_chianti_tem(longflux[segment], shortflux[segment],
+                                                  satellite=satellite[start],
+                                                  date=date[start])
+        assert_array_equal(temp[segment].value, temp_seg.value)
+        assert_array_equal(em[segment].value, em_seg.value)
+    # Scalar dates and satellites still apply to all samples
+    temp, em = goes._goes_chianti_tem(longflux, shortflux, satellite=[15] * 12,
+                                      date="2014-04-16")
+    temp_scalar, em_scalar = goes._goes_chianti_tem(longflux, shortflux, satellite=15,
+                                                    date="2014-04-16")
+    assert_array_equal(temp.value, temp_scalar.value)
+    assert_array_equal(em.value, em_scalar.value)
+    with pytest.raises(ValueError):
+        goes._goes_chianti_tem(longflux, shortflux, satellite=satellite[:-1])
+    with pytest.raises(ValueError):
+        goes._goes_chianti_tem(longflux, shortflux, date=date[:-1])
+    with pytest.raises(ValueError):
+        goes._goes_chianti_tem(longflux, shortflux, satellite=satellite - 6)
+
+
+def test_kernels(mock_chianti_tables):
+    longflux = Quantity(np.logspace(-7, -4, 20), "W/m**2")
+    shortflux = longflux * np.linspace(0.02, 0.2, 20)
+    temp, em = goes._goes_chianti_tem(longflux, shortflux, satellite=15, date="2014-04-16")
+    temp_kernel, em_kernel = goes.temperature_em_kernel(longflux.value, shortflux.value,
+                                                        satellite=15, date="2014-04-16")
+    assert isinstance(temp_kernel, np.ndarray) and not isinstance(temp_kernel, Quantity)
+    assert_array_equal(temp_kernel, temp.to_value("MK"))
+    assert_array_equal(em_kernel, em.to_value("cm**-3"))
+    # The Quantity functions convert units on input
+    np.testing.assert_allclose(goes._goes_chianti_tem(longflux.to("erg/(s cm2)"), shortflux,
+                                                      satellite=15)[0].value,
+                               temp_kernel, rtol=1e-14)
+    ratio = shortflux / longflux
+    assert_array_equal(goes.temperature_kernel(ratio.value, satellite=5),
+                       goes._goes_get_chianti_temp(ratio, satellite=5).to_value("MK"))
+    assert_array_equal(goes.emission_measure_kernel(longflux.value, temp_kernel),
+                       goes._goes_get_chianti_em(longflux, temp).to_value("cm**-3"))
+    assert_array_equal(goes.radiative_loss_rate_kernel(temp_kernel, em_kernel),
+                       goes._calc_rad_loss(temp, em)["rad_loss_rate"].to_value("W"))
+    for date in [None, "2014-04-16"]:
+        assert_array_equal(goes.xray_luminosity_kernel(longflux.value, date=date),
+                           goes._calc_xraylum(longflux, date=date).to_value("W"))
+    with pytest.raises(ValueError):
+        goes.temperature_em_kernel(longflux.value, shortflux.value[:-1])
+    with pytest.raises(ValueError):
+        goes.radiative_loss_rate_kernel(temp_kernel, em_kernel, engine="linear")
+
+
+def test_kernels_dask(mock_chianti_tables):
+    da = pytest.importorskip("dask.array")
+    longflux = np.logspace(-7, -4, 20)
+    shortflux = longflux * np.linspace(0.02, 0.2, 20)
+    satellite = np.repeat([5, 15], 10)
+    dates = np.datetime64("2014-04-16") + np.arange(20) * np.timedelta64(10, "D")
+    temp, em = goes.temperature_em_kernel(longflux, shortflux, satellite=satellite)
+    longflux_lazy = da.from_array(longflux, chunks=6)
+    # Numpy arguments are chunked like the dask arrays
+    temp_lazy, em_lazy = goes.temperature_em_kernel(longflux_lazy, shortflux,
+                                                    satellite=satellite, download=True)
+    assert isinstance(temp_lazy, da.Array) and temp_lazy.chunks == ((6, 6, 6, 2),)
+    goes.clear_chianti_cache()
+    assert_array_equal(temp_lazy.compute(), temp)
+    assert_array_equal(em_lazy.compute(), em)
+    # The blocks share the fits, one per table and satellite
+    assert goes.chianti_cache_info().misses == 4
+    ratio = da.from_array(shortflux / longflux, chunks=7)
+    assert_array_equal(goes.temperature_kernel(ratio, satellite=15).compute(),
+                       goes.temperature_kernel(shortflux / longflux, satellite=15))
+    assert_array_equal(goes.emission_measure_kernel(longflux_lazy, temp_lazy,
+                                                    satellite=satellite).compute(),
+                       goes.emission_measure_kernel(longflux, temp, satellite=satellite))
+    assert_array_equal(goes.radiative_loss_rate_kernel(temp_lazy, em_lazy).compute(),
+                       goes.radiative_loss_rate_kernel(temp, em))
+    assert_array_equal(goes.xray_luminosity_kernel(longflux_lazy, date=dates).compute(),
+                       goes.xray_luminosity_kernel(longflux, date=dates))
+    assert_array_equal(goes.xray_luminosity_kernel(longflux_lazy, date=Time(dates)).compute(),
+                       goes.xray_luminosity_kernel(longflux, date=dates))
+    # Errors are raised when the result is computed
+    with pytest.raises(ValueError):
+        goes.temperature_kernel(ratio * 1e6, satellite=15).compute()
+
+
+def test_temperature_em_uncertainty(mock_chianti_tables):
+    longflux = Quantity(np.logspace(-7, -4, 20), "W/m**2")
+    shortflux = longflux * np.linspace(0.02, 0.2, 20)
+    satellite = np.repeat([5, 15], 10)
+    temp, em = goes._goes_chianti_tem(longflux, shortflux, satellite=satellite, date=DATE)
+    # Without errors all realizations are the same
+    temp_pc, em_pc = goes.temperature_em_uncertainty(longflux, shortflux, 0 * longflux,
+                                                     0 * shortflux, satellite=satellite,
+                                                     n_draws=10, max_batch=30)
+    assert temp_pc.shape == em_pc.shape == (3, 20)
+    for row in range(3):
+        assert_quantity_allclose(temp_pc[row], temp, rtol=1e-12)
+        assert_quantity_allclose(em_pc[row], em, rtol=1e-12)
+    # Batches smaller than the number of draws split the draws of a sample
+    temp_pc, em_pc = goes.temperature_em_uncertainty(longflux, shortflux, 0 * longflux,
+                                                     0 * shortflux, satellite=satellite,
+                                                     n_draws=10, max_batch=4)
+    assert_quantity_allclose(temp_pc[1], temp, rtol=1e-12)
+    assert_quantity_allclose(em_pc[1], em, rtol=1e-12)
+    # The percentiles bracket the result without errors
+    temp_pc, em_pc = goes.temperature_em_uncertainty(longflux, shortflux, 0.02 * longflux,
+                                                     0.02 * shortflux, satellite=satellite,
+                                                     n_draws=2000, seed=1)
+    assert np.all(temp_pc[0] < temp) and np.all(temp < temp_pc[2])
+    assert np.all(em_pc[0] < em) and np.all(em < em_pc[2])
+    assert_quantity_allclose(temp_pc[1], temp, rtol=0.01)
+    # Realizations outside the tables are ignored
+    ratio = np.array([1e-4, 0.1, 10])
+    assert np.isnan(goes.temperature_kernel(ratio, satellite=15, out_of_range="nan")).tolist() == [
+        True, False, True]
+    with pytest.raises(ValueError):
+        goes.temperature_kernel(ratio, satellite=15)
+    with pytest.raises(ValueError):
+        goes.temperature_kernel(ratio, satellite=15, out_of_range="clip")
+    temp_pc, _ = goes.temperature_em_uncertainty(Quantity([1e-5], "W/m**2"),
+                                                 Quantity([1e-3], "W/m**2"),
+                                                 Quantity(0, "W/m**2"), Quantity(0, "W/m**2"),
+                                                 satellite=15, n_draws=5)
+    assert np.isnan(temp_pc).all()
+
+
+def test_synthetic_fluxes(mock_chianti_tables):
+    temp = Quantity(np.logspace(0, 1.5, 30), "MK")
+    em = Quantity(np.logspace(49, 51, 30), "cm**-3")
+    satellite = np.repeat([5, 6, 15], 10)
+    for date in [None, "1983-01-01"]:
+        longflux, shortflux = goes.synthetic_fluxes(temp, em, satellite=satellite, date=date)
+        assert longflux.unit == shortflux.unit == u.W / u.m**2
+        # The fluxes give back the temperature and emission measure
+        temp_out, em_out = goes._goes_chianti_tem(longflux, shortflux, satellite=satellite,
+                                                  date=date or DATE)
+        assert_quantity_allclose(temp_out, temp, rtol=1e-3)
+        assert_quantity_allclose(em_out, em, rtol=1e-3)
+    # The GOES 6 long channel correction depends on the date
+    early, _ = goes.synthetic_fluxes(temp, em, satellite=6, date="1983-01-01")
+    late, _ = goes.synthetic_fluxes(temp, em, satellite=6)
+    assert_quantity_allclose(early, late * 5.32 / 4.43)
+    longflux, shortflux = goes.synthetic_fluxes_kernel(temp.value, em.value, satellite=15,
+                                                       engine="grid")
+    assert_array_equal(longflux, goes.synthetic_fluxes(temp, em, satellite=15,
+                                                       engine="grid")[0].value)
+    temp_out, _ = goes.temperature_em_kernel(longflux, shortflux, satellite=15)
+    np.testing.assert_allclose(temp_out, temp.value, rtol=1e-3)
+    with pytest.raises(ValueError):
+        goes.synthetic_fluxes(Quantity([1e3], "MK"), Quantity([1e49], "cm**-3"))
+    longflux, _ = goes.synthetic_fluxes_kernel(np.array([1e3, 10]), np.array([1e49, 1e49]),
+                                               out_of_range="nan")
+    assert np.isnan(longflux).tolist() == [True, False]
+
+
+def test_calculate_interval_energies(goeslc, mock_chianti_tables):
+    index = goeslc.to_dataframe().index
+    start = [index[0], index[100], index[500] + pandas.Timedelta("1ms"), index[-1]]
+    end = [index[50], index[100], index[900], index[-1] + pandas.Timedelta("1h")]
+    energies = goes.calculate_interval_energies(goeslc, start, end)
+    assert len(energies) == 4
+    assert (energies["start"] == pandas.DatetimeIndex(start)).all()
+    for row in energies.itertuples():
+        segment = goeslc.truncate(row.start, row.end)
+        if len(segment.to_dataframe()) < 2:
+            assert row.rad_loss_int == row.luminosity_xrsb_int == 0
+            continue
+        obstime = parse_time(segment.to_dataframe().index)
+        thermo = goes.calculate_thermodynamics(segment, derived_only=True)
+        lx_out = goes._goes_lx(goes_xrs._goests_quantity(segment, "xrsb"),
+                               goes_xrs._goests_quantity(segment, "xrsa"), obstime,
+                               date=segment.to_dataframe().index)
+        rad_loss_out = goes._calc_rad_loss(Quantity(thermo["temperature"].values, "MK"),
+                                           Quantity(thermo["em"].values, "cm**-3"), obstime)
+        # obstime is parsed to us precision here, so the times differ slightly
+        np.testing.assert_allclose(row.luminosity_xrsb_int,
+                                   lx_out["longlum_int"].to_value("J"), rtol=1e-8)
+        np.testing.assert_allclose(row.luminosity_xrsa_int,
+                                   lx_out["shortlum_int"].to_value("J"), rtol=1e-8)
+        np.testing.assert_allclose(row.rad_loss_int,
+                                   rad_loss_out["rad_loss_int"].to_value("J"), rtol=1e-8)
+    with pytest.raises(ValueError):
+        goes.calculate_interval_energies(goeslc, start, end[:-1])
+
+
+def test_xrs_pyramid(goeslc):
+    data = goeslc.to_dataframe()[["xrsa", "xrsb"]].astype(float)
+    data.iloc[10:20, 0] = np.nan
+    pyramid = goes.XRSPyramid(base=4 * u.s, columns=["xrsa", "xrsb"], levels=12)
+    pyramid.append(goeslc.truncate(0, 0))
+    for start, stop in [(0, 1000), (1000, 1001), (1001, 3000), (3000, len(data))]:
+        pyramid.append(data.iloc[start:stop])
+    whole = goes.XRSPyramid(base=4 * u.s, levels=12)
+    whole.append(data)
+    assert whole.columns == ["xrsa", "xrsb"]
+    for level in [0, 3, 11]:
+        # Appending in pieces gives the same bins as at once
+        assert_frame_equal(pyramid.level(level), whole.level(level))
+        width = pandas.Timedelta(pyramid.bin_width(level))
+        expected = data.resample(width, origin="epoch").agg(["min", "max", "mean"])
+        expected = expected[data.resample(width, origin="epoch").size() > 0]
+        expected.columns = [f"{column}_{stat}" for column, stat in expected.columns]
+        assert_frame_equal(pyramid.level(level).drop(columns="count"), expected,
+                           check_freq=False, check_names=False, check_exact=False, rtol=1e-12)
+        assert pyramid.level(level)["count"].sum() == len(data)
+    start, end = data.index[100], data.index[2000]
+    frame = pyramid.query(start, end, max_points=100)
+    level = frame.attrs["level"]
+    # The level is the narrowest with few enough bins
+    assert len(frame) <= 100 < len(pyramid.level(level - 1, start, end))
+    assert frame.index[0] <= start < frame.index[0] + frame.attrs["bin_width"]
+    assert frame.index[-1] <= end < frame.index[-1] + pyramid.bin_width(level)
+    assert_frame_equal(frame, pyramid.level(level, start, end))
+    # Samples must be appended in chronological order
+    with pytest.raises(ValueError):
+        pyramid.append(data.iloc[:10])
+
+
+def test_interval_integral_kernel():
+    seconds = np.array([0., 1., 3., 4., 6.])
+    values = np.vstack([np.ones(5), seconds])
+    start = np.array([0., 0.5, 1., 3.5, 6.5, 2.])
+    end = np.array([6., 4., 1., 6., 7., 1.])
+    integral = goes.interval_integral_kernel(values, seconds, start, end)
+    assert integral.shape == (2, 6)
+    assert_almost_equal(integral[0], [6., 3., 0., 2., 0., 0.])
+    assert_almost_equal(integral[1], [18., 7.5, 0., 10., 0., 0.])
+    with pytest.raises(ValueError):
+        goes.interval_integral_kernel(values, seconds[::-1], start, end)
+    with pytest.raises(ValueError):
+        goes.interval_integral_kernel(values, seconds[:-1], start, end)
+
+
+def test_interval_peak_kernel():
+    seconds = np.array([0., 1., 3., 4., 6.])
+    values = np.vstack([[1., 5., np.nan, 2., 3.], -seconds])
+    start = np.array([0., 3.5, 0.5, 6.5, 2., 2., 0.5])
+    end = np.array([6., 6., 4., 7., 1., 3., 1.])
+    peaks = goes.interval_peak_kernel(values, seconds, start, end)
+    assert peaks.shape == (2, 7)
+    assert_array_equal(peaks[0], [5., 3., 5., np.nan, np.nan, np.nan, 5.])
+    assert_array_equal(peaks[1], [0., -4., -1., np.nan, np.nan, -3., -1.])
+    windows = np.lib.stride_tricks.sliding_window_view(values[1], 3)
+    assert_array_equal(goes.interval_peak_kernel(values[1], seconds, seconds[:3], seconds[2:]),
+                       windows.max(axis=-1))
+    assert goes.interval_peak_kernel(values, seconds, start[:0], end[:0]).shape == (2, 0)
+    with pytest.raises(ValueError):
+        goes.interval_peak_kernel(values, seconds[::-1], start, end)
+    with pytest.raises(ValueError):
+        goes.interval_peak_kernel(values, seconds, start, end[:-1])
+
+
+def test_calculate_flare_energetics(goeslc, mock_chianti_tables):
+    index = goeslc.to_dataframe().index
+    flares = pandas.DataFrame({"start_time": [index[500], index[0], index[100]],
+                               "end_time": [index[900], index[50], pandas.NaT]},
+                              index=[7, 8, 9])
+    energetics = goes.calculate_flare_energetics(goeslc, flares)
+    assert list(energetics.index) == [7, 8, 9]
+    thermo = goes.calculate_thermodynamics(goeslc, derived_only=True)
+    for label, stop in zip(energetics.index, [900, 50, len(index) - 1]):
+        row = energetics.loc[label]
+        segment = thermo.loc[flares.loc[label, "start_time"]:index[stop]]
+        assert row.peak_temperature == np.nanmax(segment["temperature"])
+        assert row.peak_em == np.nanmax(segment["em"])
+        seconds = (segment.index - segment.index[0]).total_seconds()
+        np.testing.assert_allclose(row.rad_loss_int,
+                                   trapz(segment["rad_loss_rate"], seconds), rtol=1e-10)
+        np.testing.assert_allclose(row.luminosity_xrsb_int,
+                                   trapz(segment["luminosity_xrsb"], seconds), rtol=1e-10)
+
+    # A list of events as returned by get_goes_event_list gives the same result.
+    start, end = Time(flares["start_time"][:2].values), Time(flares["end_time"][:2].values)
+    events = [{"start_time": start[i], "end_time": end[i]} for i in range(2)]
+    assert_frame_equal(goes.calculate_flare_energetics(goeslc, events),
+                       energetics[:2].reset_index(drop=True))
+    assert len(goes.calculate_flare_energetics(goeslc, [])) == 0
+
+
+def test_assert_chrono_order():
+    goes_xrs._assert_chrono_order(np.arange(5.))
+    goes_xrs._assert_chrono_order(pandas.date_range("2011-06-07", periods=5, freq="2s").values)
+    for times in ([0., 1., 2., 2., 3.], [0., 1., 2., np.nan, 4.], [0., 1., 2., 1.5, 4.]):
+        with pytest.raises(ValueError, match="element 3 is not after element 2"):
+            goes_xrs._assert_chrono_order(times)
+    obstime = Time("2014-01-01") + np.array([0, 2, 4, 3, 8]) * u.s
+    with pytest.raises(ValueError, match="element 3 is not after element 2"):
+        goes._goes_lx(LONGFLUX.repeat(5), SHORTFLUX.repeat(5), obstime)
+    assert_almost_equal(goes_xrs._obstime_seconds(obstime[:3]), [0, 2, 4])
+
+
+def test_iter_thermodynamics(goeslc, mock_chianti_tables):
+    n = len(goeslc.to_dataframe())
+    chunks = [goeslc.truncate(0, 1000), goeslc.truncate(1000, 1000),
+              goeslc.truncate(1000, 2500), goeslc.truncate(2500, n)]
+    derived = list(goes.iter_thermodynamics(chunks))
+    assert [len(d) for d in derived] == [1000, 0, 1500, n - 2500]
+    derived = pandas.concat(derived)
+    expected = goes.calculate_thermodynamics(goeslc, derived_only=True)
+    # The Sun-Earth distance is found for the start of each chunk
+    assert_frame_equal(derived[expected.columns], expected, check_freq=False,
+                       check_exact=False, rtol=1e-4)
+    assert_frame_equal(derived[["temperature", "em", "rad_loss_rate"]],
+                       expected[["temperature", "em", "rad_loss_rate"]], check_freq=False)
+    seconds = (expected.index - expected.index[0]).total_seconds().to_numpy()
+    for name in ["rad_loss", "luminosity_xrsa", "luminosity_xrsb"]:
+        rate = name + "_rate" if name == "rad_loss" else name
+        cumul = goes_xrs.cumtrapz(derived[rate].to_numpy(), seconds, initial=0)
+        np.testing.assert_allclose(derived[name + "_cumul"], cumul, rtol=1e-12)
+    # File paths are read one at a time
+    derived = list(goes.iter_thermodynamics([get_test_filepath("go1520110607.fits")]))
+    assert_frame_equal(derived[0][expected.columns], expected, check_freq=False)
+    # Chunks must be in chronological order
+    with pytest.raises(ValueError):
+        list(goes.iter_thermodynamics(chunks[::-1]))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The mock tables are inherited by forking")
+def test_reprocess_goes_files(goeslc, mock_chianti_tables, tmp_path):
+    fits = get_test_filepath("go1520110607.fits")
+    files = [fits, str(tmp_path / "missing.fits")]
+    # Forked workers see the mock tables
+    context = multiprocessing.get_context("fork")
+    report = goes.reprocess_goes_files(files, tmp_path / "out", max_workers=2,
+                                       mp_context=context)
+    assert report.file.tolist() == files
+    assert report.output.tolist() == [str(tmp_path / "out" / "go1520110607.csv"), None]
+    assert report.error[0] is None and report.error[1] is not None
+    assert (report.seconds > 0).all()
+    derived = pandas.read_csv(report.output[0], index_col=0, parse_dates=True)
+    expected = goes.calculate_thermodynamics(goeslc, derived_only=True)
+    assert_frame_equal(derived, expected, check_freq=False, check_names=False,
+                       check_exact=False, rtol=1e-12)
+    with pytest.raises(ValueError):
+        goes.reprocess_goes_files([fits, fits], tmp_path / "out")
+
+    assert reprocess.main([fits, "-o", str(tmp_path / "cli"), "-q", "temperature",
+                           "-j", "1"]) == 0
+    assert pandas.read_csv(tmp_path / "cli" / "go1520110607.csv").columns.tolist() == [
+        "Unnamed: 0", "temperature"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="The mock tables are inherited by forking")
+def test_reprocess_goes_files_bad_table(mock_chianti_tables, tmp_path):
+    # A table column that cannot be fitted only fails the files that need it
+    fits = get_test_filepath("go1520110607.fits")
+    context = multiprocessing.get_context("fork")
+    table_file = mock_chianti_tables["file_temp_cor"]
+    table = pandas.read_csv(table_file, sep=";", comment="#")
+    for satellite, error in ((3, None), (15, "ValueError")):
+        goes.clear_chianti_cache()
+        bad_table = table.copy()
+        bad_table[f"ratioGOES{satellite}"] = 0.1
+        bad_table.to_csv(table_file, sep=";", index=False)
+        report = goes.reprocess_goes_files([fits], tmp_path / "out", quantities=["temperature"],
+                                           max_workers=1, mp_context=context)
+        assert report.error[0] is None if error is None else report.error[0].startswith(error)
+
+
+def test_xrs_energy_accumulator(goeslc, mock_chianti_tables):
+    data = goeslc.to_dataframe().iloc[:300]
+    accumulator = goes.XRSEnergyAccumulator(satellite=15)
+    assert accumulator.last_time is None
+    derived = [accumulator.update(data.index[0], data["xrsb"].iloc[0], data["xrsa"].iloc[0])]
+    for start in range(1, 300, 50):
+        batch = data.iloc[start:start + 50]
+        derived.append(accumulator.update(batch.index, batch["xrsb"].values,
+                                          Quantity(batch["xrsa"].values, "W/m**2")))
+    derived = pandas.concat(derived)
+    assert accumulator.last_time == data.index[-1]
+    expected = next(goes.iter_thermodynamics([goeslc.truncate(0, 300)]))
+    # The Sun-Earth distance is found for the start of each update
+    assert_frame_equal(derived, expected, check_freq=False, check_exact=False, rtol=1e-5)
+    assert accumulator.energy["rad_loss"] == derived["rad_loss_cumul"].iloc[-1]
+    # After a reset the energies are integrated from the last sample
+    accumulator.reset()
+    assert accumulator.energy["luminosity_xrsb"] == 0
+    rest = goeslc.to_dataframe().iloc[300:400]
+    derived = accumulator.update(rest.index, rest["xrsb"].values, rest["xrsa"].values)
+    full = next(goes.iter_thermodynamics([goeslc.truncate(0, 400)]))
+    np.testing.assert_allclose(derived["luminosity_xrsb_cumul"],
+                               full["luminosity_xrsb_cumul"].iloc[300:]
+                               - full["luminosity_xrsb_cumul"].iloc[299], rtol=1e-5)
+    assert len(accumulator.update([], [], [])) == 0
+    # Samples must arrive in order, and a rejected update leaves the state unchanged
+    with pytest.raises(ValueError):
+        accumulator.update(data.index[:2], data["xrsb"].values[:2], data["xrsa"].values[:2])
+    assert accumulator.last_time == rest.index[-1]
+    with pytest.raises(ValueError):
+        accumulator.update(rest.index[-1:], [1e-6, 1e-6], [1e-7])
+
+    # Samples outside the tables are skipped by the radiated energy
+    times = pandas.date_range("2011-06-07", periods=5, freq="2s")
+    longflux = np.full(5, 1e-5)
+    shortflux = np.array([1e-6, 1e-6, 1e-4, 1e-6, 1e-6])
+    derived = goes.XRSEnergyAccumulator(satellite=15).update(times, longflux, shortflux)
+    assert np.isnan(derived["temperature"]).tolist() == [False, False, True, False, False]
+    rad_loss = derived["rad_loss_rate"].to_numpy()
+    expected = np.array([0, 2, 2, 6, 8]) * rad_loss[0]
+    assert_almost_equal(derived["rad_loss_cumul"].to_numpy() / expected[-1],
+                        expected / expected[-1])
+    assert np.isfinite(derived["luminosity_xrsa_cumul"]).all()
+    accumulator = goes.XRSEnergyAccumulator(satellite=15, out_of_range="raise")
+    with pytest.raises(ValueError):
+        accumulator.update(times, longflux, shortflux)
+
+
+@pytest.fixture
+def flare_flux():
+    times = pandas.date_range("2017-09-10", periods=120, freq="1min").values
+    flux = np.full(120, 1e-6)
+    # An M1 flare from 00:10, peaking at 00:15 and decaying to 5.5e-6 at 00:18
+    flux[10:20] = 1e-6 * np.array([1, 1.2, 1.5, 2, 5, 10, 8, 6, 5, 4])
+    # A rise which is not steep enough
+    flux[30:34] = [1e-6, 1.1e-6, 1.2e-6, 1.3e-6]
+    # A C3.5 flare from 01:20 which has not ended by the last sample
+    flux[80:84] = [1e-6, 1.5e-6, 2e-6, 3e-6]
+    flux[84:] = 3.5e-6
+    flux[100] = np.nan
+    return times, flux
+
+
+def test_find_flares(flare_flux):
+    times, flux = flare_flux
+    flares = goes.find_flares(times, flux)
+    assert flares.columns.tolist() == ["start_time", "peak_time", "end_time", "peak_flux",
+                                       "goes_class"]
+    assert_array_equal(flares["start_time"], times[[10, 80]])
+    assert_array_equal(flares["peak_time"], times[[15, 84]])
+    assert flares["end_time"][0] == times[18]
+    assert pandas.isna(flares["end_time"][1])
+    assert_almost_equal(flares["peak_flux"], [1e-5, 3.5e-6])
+    assert flares["goes_class"].tolist() == ["M1", "C3.5"]
+    assert len(goes.find_flares(times[:3], flux[:3])) == 0
+    with pytest.raises(ValueError):
+        goes.find_flares(times[::-1], flux)
+    # The definitions are for one-minute samples
+    with pytest.raises(ValueError):
+        goes.find_flares(times[::2], flux[::2])
+
+
+def test_flare_detector(flare_flux):
+    times, flux = flare_flux
+    expected = goes.find_flares(times, flux)
+    for splits in ([12], [11, 13, 14], [16, 17], [81, 82], list(range(1, 120))):
+        detector = goes.FlareDetector()
+        found = []
+        for chunk in np.split(np.arange(120), splits):
+            found.append(detector.update(times[chunk], Quantity(flux[chunk], "W/m**2")))
+            if chunk[-1] == 17:
+                assert detector.in_flare
+        assert detector.in_flare
+        found.append(detector.finish())
+        assert not detector.in_flare
+        assert_frame_equal(pandas.concat(found, ignore_index=True), expected)
+    with pytest.raises(ValueError):
+        detector.update(times[:2], flux[:1])
+    # Gaps between updates are not allowed either
+    detector.update(times[:10], flux[:10])
+    with pytest.raises(ValueError):
+        detector.update(times[11:20], flux[11:20])